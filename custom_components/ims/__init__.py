@@ -1,4 +1,5 @@
 import logging
+from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import timedelta
 from typing import Any
@@ -18,10 +19,22 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     CONF_CITY,
+    CONF_CURRENT_TIMEOUT,
+    CONF_FORECAST_ATTRIBUTES,
+    CONF_FORECAST_INTERVAL,
+    CONF_FORECAST_TIMEOUT,
+    CONF_MAX_STALE_AGE,
+    CONF_WARNINGS_INTERVAL,
+    CONF_WARNINGS_TIMEOUT,
+    COORDINATOR_REGISTRY,
     CONF_LANGUAGE,
     CONF_IMAGES_PATH,
     CONF_UPDATE_INTERVAL,
     DOMAIN,
+    DEFAULT_FORECAST_ATTRIBUTES,
+    ENDPOINT_CURRENT,
+    ENDPOINT_FORECAST,
+    ENDPOINT_WARNINGS,
     ENTRY_NAME,
     ENTRY_WEATHER_COORDINATOR,
     UPDATE_LISTENER,
@@ -29,11 +42,15 @@ from .const import (
     IMS_PLATFORMS,
     IMS_PLATFORM,
     DEFAULT_LANGUAGE,
+    SLICE_MAX_STALE_AGE,
     FORECAST_MODE_HOURLY,
 )
 
 from .dependency_logging import remove_dependency_logging, setup_dependency_logging
-from .weather_update_coordinator import WeatherUpdateCoordinator
+from .planner import endpoints_for_key, required_endpoints
+from .registry import CoordinatorRegistry
+from .snapshot import WeatherSnapshotStore
+from .weather_update_coordinator import WeatherData, WeatherUpdateCoordinator
 
 CONF_FORECAST = "forecast"
 CONF_HOURLY_FORECAST = "hourly_forecast"
@@ -52,42 +69,89 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     ims_entity_platform = _get_config_value(entry, IMS_PLATFORM, [IMS_PLATFORMS[1]])
     ims_scan_int = entry.data[CONF_UPDATE_INTERVAL]
     conditions = _get_config_value(entry, CONF_MONITORED_CONDITIONS)
+    # Only set from the options flow; older entries keep the nested layout.
+    forecast_attributes = entry.options.get(
+        CONF_FORECAST_ATTRIBUTES, DEFAULT_FORECAST_ATTRIBUTES
+    )
+    # Unset, the coordinator derives them from the update interval.
+    endpoint_intervals = {
+        endpoint: timedelta(minutes=minutes)
+        for endpoint, key in (
+            (ENDPOINT_FORECAST, CONF_FORECAST_INTERVAL),
+            (ENDPOINT_WARNINGS, CONF_WARNINGS_INTERVAL),
+        )
+        if (minutes := entry.options.get(key)) is not None
+    }
+    max_stale_age = (
+        timedelta(hours=hours)
+        if (hours := entry.options.get(CONF_MAX_STALE_AGE)) is not None
+        else SLICE_MAX_STALE_AGE
+    )
+    # Unset, each endpoint keeps its ENDPOINT_TIMEOUTS budget.
+    endpoint_timeouts = {
+        endpoint: timedelta(seconds=seconds)
+        for endpoint, key in (
+            (ENDPOINT_CURRENT, CONF_CURRENT_TIMEOUT),
+            (ENDPOINT_FORECAST, CONF_FORECAST_TIMEOUT),
+            (ENDPOINT_WARNINGS, CONF_WARNINGS_TIMEOUT),
+        )
+        if (seconds := entry.options.get(key)) is not None
+    }
+    required = required_endpoints(ims_entity_platform, conditions)
 
-    # Extract list of int from forecast days/ hours string if present
-    # _LOGGER.warning('forecast_days_type: ' + str(type(forecast_days)))
-    is_legacy_city = False
-    if isinstance(city, int | str):
-        is_legacy_city = True
-
-    city_id = city if is_legacy_city else city["lid"]
-
-    unique_location = f"ims-{language}-{city_id}"
+    city_id = _city_id(city)
+    unique_location = _unique_location(language, city_id)
 
     hass.data.setdefault(DOMAIN, {})
+    if COORDINATOR_REGISTRY not in hass.data[DOMAIN]:
+        hass.data[DOMAIN][COORDINATOR_REGISTRY] = CoordinatorRegistry(hass)
+    registry: CoordinatorRegistry = hass.data[DOMAIN][COORDINATOR_REGISTRY]
 
     try:
         setup_dependency_logging(entry.entry_id)
 
-        # If coordinator already exists for this API key, we'll use that, otherwise
-        # we have to create a new one
-        if unique_location in hass.data[DOMAIN]:
-            weather_coordinator = hass.data[DOMAIN].get(unique_location)
-            _LOGGER.info(
-                "An existing IMS weather coordinator already exists for this location. Using that one instead"
-            )
-        else:
-            weather_coordinator = WeatherUpdateCoordinator(
+        # Entries for the same location share one coordinator, which fetches
+        # what any of them needs.
+        weather_coordinator, created = registry.acquire(
+            entry.entry_id,
+            unique_location,
+            required,
+            lambda: WeatherUpdateCoordinator(
                 city_id,
                 language,
                 timedelta(minutes=ims_scan_int),
                 hass,
-                monitored_conditions=conditions,
+                required_endpoints=required,
+                endpoint_intervals=endpoint_intervals,
+                max_stale_age=max_stale_age,
+                endpoint_timeouts=endpoint_timeouts,
+                snapshot_store=WeatherSnapshotStore(hass, unique_location),
+                radar_service=registry.radar_service,
+                warnings_feed=registry.warnings_feed(language),
+                analysis_feed=registry.analysis_feed(city_id),
+            ),
+        )
+        if created:
+            await weather_coordinator.async_restore_snapshot()
+
+        if weather_coordinator.data is None:
+            await weather_coordinator.async_config_entry_first_refresh()
+        elif weather_coordinator.snapshot_time is not None:
+            # Entities start from the snapshot; IMS is queried in the
+            # background instead of on the setup critical path.
+            entry.async_create_background_task(
+                hass,
+                weather_coordinator.async_staggered_refresh(),
+                f"{DOMAIN} {unique_location} warm-start refresh",
             )
-            hass.data[DOMAIN][unique_location] = weather_coordinator
-            # _LOGGER.warning('New Coordinator')
 
-        # await weather_coordinator.async_refresh()
-        await weather_coordinator.async_config_entry_first_refresh()
+        if images_path:
+            # Caching the frames is what makes the coordinator fetch radar.
+            entry.async_on_unload(
+                registry.radar_service.async_track_frames(
+                    weather_coordinator, images_path
+                )
+            )
 
         hass.data[DOMAIN][entry.entry_id] = {
             ENTRY_NAME: name,
@@ -99,6 +163,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             CONF_UPDATE_INTERVAL: ims_scan_int,
             IMS_PLATFORM: ims_entity_platform,
             CONF_MONITORED_CONDITIONS: conditions,
+            CONF_FORECAST_ATTRIBUTES: forecast_attributes,
         }
 
         platforms = _platforms_from_selection(ims_entity_platform)
@@ -121,6 +186,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             )
         return True
     except Exception:
+        await registry.async_release(entry.entry_id)
         remove_dependency_logging(entry.entry_id)
         raise
 
@@ -145,6 +211,10 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         update_listener()
 
         hass.data[DOMAIN].pop(entry.entry_id)
+        registry: CoordinatorRegistry = hass.data[DOMAIN][COORDINATOR_REGISTRY]
+        await registry.async_release(entry.entry_id)
+        if registry.is_empty():
+            hass.data[DOMAIN].pop(COORDINATOR_REGISTRY)
 
         has_other_entries = any(
             config_entry.entry_id != entry.entry_id
@@ -160,6 +230,36 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete the weather snapshot unless another entry shares the location."""
+    unique_location = _entry_unique_location(entry)
+    if any(
+        _entry_unique_location(config_entry) == unique_location
+        for config_entry in hass.config_entries.async_entries(DOMAIN)
+        if config_entry.entry_id != entry.entry_id
+    ):
+        return
+    await WeatherSnapshotStore(hass, unique_location).async_remove()
+
+
+def _city_id(city: Any) -> Any:
+    # Legacy entries store the city id itself instead of the location dict
+    if isinstance(city, int | str):
+        return city
+    return city["lid"]
+
+
+def _unique_location(language: str, city_id: Any) -> str:
+    return f"ims-{language}-{city_id}"
+
+
+def _entry_unique_location(config_entry: ConfigEntry) -> str:
+    return _unique_location(
+        _get_config_value(config_entry, CONF_LANGUAGE, DEFAULT_LANGUAGE),
+        _city_id(_get_config_value(config_entry, CONF_CITY)),
+    )
+
+
 def _get_config_value(config_entry: ConfigEntry, key: str, default=None) -> Any:
     if config_entry.options:
         val = config_entry.options.get(key)
@@ -206,12 +306,22 @@ class ImsSensorEntityDescription(SensorEntityDescription):
 
     field_name: str | None = None
     forecast_mode: str | None = None
+    # Extract the state, attributes and icon of the entity from the data.
+    value_fn: Callable[[WeatherData], Any] | None = None
+    attributes_fn: Callable[[WeatherData], dict[str, Any]] | None = None
+    icon_fn: Callable[[WeatherData], str | None] | None = None
+    # Used instead of ``attributes_fn`` by entries asking for compact
+    # forecast attributes.
+    compact_attributes_fn: Callable[[WeatherData], dict[str, Any]] | None = None
 
 
 class ImsEntity(CoordinatorEntity[WeatherUpdateCoordinator]):
     """Define a generic Ims entity."""
 
     _attr_has_entity_name = True
+    # Entities setting this skip the state writes of coordinator updates
+    # that leave their state, icon and attributes as they were written.
+    _skip_unchanged_writes = False
 
     def __init__(
         self,
@@ -219,9 +329,12 @@ class ImsEntity(CoordinatorEntity[WeatherUpdateCoordinator]):
         description: ImsSensorEntityDescription,
     ) -> None:
         """Initialize."""
-        super().__init__(coordinator)
+        # The coordinator only calls back when one of these endpoints was
+        # refreshed.
+        super().__init__(coordinator, context=endpoints_for_key(description.key))
 
         self._attr_extra_state_attributes: dict[str, Any] = {}
+        self._last_written: tuple[Any, ...] | None = None
         self._attr_unique_id = (
             f"{description.key}_{coordinator.city}_{coordinator.language}"
         )
@@ -233,12 +346,37 @@ class ImsEntity(CoordinatorEntity[WeatherUpdateCoordinator]):
         self._attr_translation_key = f"{description.key}_{coordinator.language}"
         self.entity_description = description
 
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the entity attributes and where the data comes from."""
+        if status := self.coordinator.status_attributes():
+            return {**self._attr_extra_state_attributes, **status}
+        return self._attr_extra_state_attributes
+
     @callback
     def _handle_coordinator_update(self) -> None:
         """Respond to a DataUpdateCoordinator update."""
         self._update_from_latest_data()
+        if self._skip_unchanged_writes:
+            written = self._written_state()
+            if written == self._last_written:
+                suppressed = self.coordinator.suppressed_writes
+                key = self.entity_description.key
+                suppressed[key] = suppressed.get(key, 0) + 1
+                return
+            self._last_written = written
         self.async_write_ha_state()
 
+    def _written_state(self) -> tuple[Any, ...]:
+        """Return what a state write of the entity would record."""
+        attributes = self.extra_state_attributes
+        return (
+            self.available,
+            self.state,
+            self.icon,
+            dict(attributes) if attributes else None,
+        )
+
     @callback
     def _update_from_latest_data(self) -> None:
         """Update the entity from the latest data."""
@@ -0,0 +1,92 @@
+"""Current analysis of a city shared by its coordinators of every language."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from weatheril import Weather
+
+from .const import DEFAULT_LANGUAGE, SHARED_ANALYSIS_MAX_AGE
+from .ims_client import ImsClient
+
+
+class CurrentAnalysisFeed:
+    """Fetch the current analysis of one city once for all its languages.
+
+    The analysis is made of codes and numbers; only the names resolved from
+    them (location, weather description, wind direction) depend on the
+    language, and those come from the lookup tables of each language. So when
+    an English and a Hebrew entry watch the same city, the analysis fetched
+    for one is localized for the other rather than fetched again.
+
+    A fetch is handed to each language at most once and only while it is
+    younger than ``SHARED_ANALYSIS_MAX_AGE``: a coordinator polling alone
+    still fetches on every tick, while coordinators ticking together (their
+    ticks follow the same IMS publication schedule) share one request.
+    """
+
+    def __init__(self, hass: HomeAssistant, location: int | str) -> None:
+        """Initialize the feed."""
+        self._hass = hass
+        self.location = location
+        self._client = ImsClient(hass, DEFAULT_LANGUAGE)
+        self._data: dict[str, Any] | None = None
+        self._fetched_at = 0.0
+        self._pending: asyncio.Task[dict[str, Any]] | None = None
+        # The fetch time last handed to each language.
+        self._served: dict[str, float] = {}
+        self._localized: dict[str, Weather | None] = {}
+
+    async def async_get_weather(
+        self, client: ImsClient, timeout: float | None = None
+    ) -> Weather | None:
+        """Return the current analysis in the language of ``client``.
+
+        ``timeout`` bounds the request of a fetch this call starts.
+        """
+        language = client.language
+        data = await self._async_get_data(language, timeout)
+        fetched_at = self._served[language] = self._fetched_at
+        if language in self._localized and self._data is data:
+            return self._localized[language]
+        weather = await client.async_localize_current_analysis(self.location, data)
+        if self._data is data and self._fetched_at == fetched_at:
+            self._localized[language] = weather
+        return weather
+
+    async def _async_get_data(
+        self, language: str, timeout: float | None
+    ) -> dict[str, Any]:
+        """Return data not yet served to ``language``, fetching if needed."""
+        age = time.monotonic() - self._fetched_at
+        if (
+            self._data is not None
+            and self._served.get(language) != self._fetched_at
+            and age < SHARED_ANALYSIS_MAX_AGE.total_seconds()
+        ):
+            return self._data
+        # An eagerly started fetch may finish before it is even stored here.
+        if self._pending is None or self._pending.done():
+            self._pending = self._hass.async_create_task(
+                self._async_fetch_data(timeout),
+                f"IMS current analysis of {self.location}",
+            )
+        # A caller being cancelled must not cancel the fetch the others await.
+        return await asyncio.shield(self._pending)
+
+    async def _async_fetch_data(self, timeout: float | None) -> dict[str, Any]:
+        """Fetch the analysis and drop the localizations of a changed one."""
+        try:
+            data = await self._client.async_get_current_analysis_data(
+                self.location, timeout
+            )
+        finally:
+            self._pending = None
+        if data is not self._data:
+            self._data = data
+            self._localized = {}
+        self._fetched_at = time.monotonic()
+        return data
@@ -1,5 +1,6 @@
 from collections.abc import Callable
 from dataclasses import dataclass
+from datetime import datetime
 
 from homeassistant.components.binary_sensor import (
     BinarySensorEntityDescription,
@@ -8,9 +9,11 @@ from homeassistant.components.binary_sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_MONITORED_CONDITIONS
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_point_in_time
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 import homeassistant.util.dt as dt_util
+from weatheril import Warning
 
 from . import ImsEntity, ImsSensorEntityDescription
 from .const import (
@@ -42,6 +45,9 @@ class ImsBinarySensorEntityDescription(
 ):
     """Class describing IMS Binary sensors entities"""
 
+    # When the value next changes with time alone, without new data.
+    next_change_fn: Callable[[WeatherData], datetime | None] | None = None
+
 
 BINARY_SENSORS_DESCRIPTIONS: tuple[ImsBinarySensorEntityDescription, ...] = (
     ImsBinarySensorEntityDescription(
@@ -61,26 +67,54 @@ BINARY_SENSORS_DESCRIPTIONS: tuple[ImsBinarySensorEntityDescription, ...] = (
         device_class=BinarySensorDeviceClass.SAFETY,
         forecast_mode=FORECAST_MODE.CURRENT,
         field_name=FIELD_NAME_WARNING,
-        value_fn=lambda data: any(
-            valid_from_dt <= now <= valid_to_dt
-            for warning in data.warnings
-            if (now := dt_util.now(IMS_TIMEZONE)) is not None
-            and (
-                valid_from_dt := dt_util.parse_datetime(warning.valid_from)
-                if isinstance(warning.valid_from, str)
-                else warning.valid_from
-            )
-            is not None
-            and (
-                valid_to_dt := dt_util.parse_datetime(warning.valid_to)
-                if isinstance(warning.valid_to, str)
-                else warning.valid_to
-            )
-            is not None
-        ),
+        value_fn=lambda data: _is_warning_active(data.warnings),
+        next_change_fn=lambda data: _next_warning_change(data.warnings),
     ),
 )
 
+
+def _warning_window(warning: Warning) -> tuple[datetime, datetime] | None:
+    """Return when ``warning`` is valid, if known."""
+    valid_from = (
+        dt_util.parse_datetime(warning.valid_from)
+        if isinstance(warning.valid_from, str)
+        else warning.valid_from
+    )
+    valid_to = (
+        dt_util.parse_datetime(warning.valid_to)
+        if isinstance(warning.valid_to, str)
+        else warning.valid_to
+    )
+    if valid_from is None or valid_to is None:
+        return None
+    return valid_from, valid_to
+
+
+def _is_warning_active(warnings: list[Warning]) -> bool:
+    """Return whether any of ``warnings`` is valid now."""
+    now = dt_util.now(IMS_TIMEZONE)
+    return any(
+        window[0] <= now <= window[1]
+        for warning in warnings
+        if (window := _warning_window(warning)) is not None
+    )
+
+
+def _next_warning_change(warnings: list[Warning]) -> datetime | None:
+    """Return when the next of ``warnings`` becomes valid or expires."""
+    now = dt_util.now(IMS_TIMEZONE)
+    return min(
+        (
+            moment
+            for warning in warnings
+            if (window := _warning_window(warning)) is not None
+            for moment in window
+            if moment > now
+        ),
+        default=None,
+    )
+
+
 BINARY_SENSOR_DESCRIPTIONS_DICT = {
     desc.key: desc for desc in BINARY_SENSORS_DESCRIPTIONS
 }
@@ -109,13 +143,20 @@ async def async_setup_entry(
             description = BINARY_SENSOR_DESCRIPTIONS_DICT[condition]
             sensors.append(ImsBinarySensor(weather_coordinator, description))
 
-    async_add_entities(sensors, update_before_add=True)
+    async_add_entities(sensors, update_before_add=False)
 
 
 class ImsBinarySensor(ImsEntity, BinarySensorEntity):
     """Defines an IMS binary sensor."""
 
     entity_description: ImsBinarySensorEntityDescription
+    _skip_unchanged_writes = True
+    _unsub_reevaluation: CALLBACK_TYPE | None = None
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel the scheduled re-evaluation."""
+        self._cancel_reevaluation()
+        await super().async_will_remove_from_hass()
 
     @callback
     def _update_from_latest_data(self) -> None:
@@ -125,3 +166,33 @@ class ImsBinarySensor(ImsEntity, BinarySensorEntity):
             self._attr_is_on = None
         else:
             self._attr_is_on = self.entity_description.value_fn(data)
+        self._schedule_reevaluation(data)
+
+    @callback
+    def _schedule_reevaluation(self, data: WeatherData | None) -> None:
+        """Re-evaluate the state when time alone changes it.
+
+        The coordinator only calls back when IMS returns new data, but e.g.
+        a warning becomes active at its ``valid_from`` without one.
+        """
+        self._cancel_reevaluation()
+        next_change_fn = self.entity_description.next_change_fn
+        if data is None or next_change_fn is None or self.hass is None:
+            return
+        if (next_change := next_change_fn(data)) is not None:
+            self._unsub_reevaluation = async_track_point_in_time(
+                self.hass, self._async_reevaluate, next_change
+            )
+
+    @callback
+    def _async_reevaluate(self, now: datetime) -> None:
+        """Update the state as if the coordinator called back."""
+        self._unsub_reevaluation = None
+        self._handle_coordinator_update()
+
+    @callback
+    def _cancel_reevaluation(self) -> None:
+        """Cancel the scheduled re-evaluation, if any."""
+        if self._unsub_reevaluation is not None:
+            self._unsub_reevaluation()
+            self._unsub_reevaluation = None
@@ -0,0 +1,122 @@
+"""Circuit breaker guarding the IMS host during outages."""
+
+from __future__ import annotations
+
+import datetime
+import logging
+import random
+from enum import StrEnum
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.singleton import singleton
+
+from .const import (
+    BREAKER_BASE_BACKOFF,
+    BREAKER_FAILURE_THRESHOLD,
+    BREAKER_MAX_BACKOFF,
+    BREAKER_PROBE_TIMEOUT,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_CIRCUIT_BREAKERS = "ims_circuit_breakers"
+
+
+class CircuitState(StrEnum):
+    """State of a ``CircuitBreaker``."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Stop polling a host that keeps failing until a probe gets through.
+
+    After ``failure_threshold`` consecutive failed refreshes the breaker
+    opens: no coordinator polls the host until ``next_attempt``. Then a
+    single refresh is let through as a probe (half open). A successful
+    probe closes the breaker; a failed one opens it again for twice as
+    long, up to ``max_backoff``. Every delay is jittered so coordinators
+    and Home Assistant instances do not come back in lockstep.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        failure_threshold: int = BREAKER_FAILURE_THRESHOLD,
+        base_backoff: datetime.timedelta = BREAKER_BASE_BACKOFF,
+        max_backoff: datetime.timedelta = BREAKER_MAX_BACKOFF,
+    ) -> None:
+        """Initialize the breaker."""
+        self.host = host
+        self.failure_threshold = failure_threshold
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.state = CircuitState.CLOSED
+        self.failures = 0
+        self.next_attempt: datetime.datetime | None = None
+        self._opened = 0
+        self._probe_started: datetime.datetime | None = None
+
+    def allow_request(self, now: datetime.datetime) -> bool:
+        """Return True when a refresh may contact the host at ``now``."""
+        if self.state is CircuitState.CLOSED:
+            return True
+        if self.state is CircuitState.HALF_OPEN:
+            # Let another probe through if the last one never reported back.
+            assert self._probe_started is not None
+            if now - self._probe_started < BREAKER_PROBE_TIMEOUT:
+                return False
+        elif self.next_attempt is not None and now < self.next_attempt:
+            return False
+        _LOGGER.debug("Probing %s after an outage", self.host)
+        self.state = CircuitState.HALF_OPEN
+        self._probe_started = now
+        return True
+
+    def record_success(self) -> None:
+        """Close the breaker after a good refresh."""
+        if self.state is not CircuitState.CLOSED:
+            _LOGGER.info("%s is reachable again", self.host)
+        self.state = CircuitState.CLOSED
+        self.failures = 0
+        self.next_attempt = None
+        self._opened = 0
+        self._probe_started = None
+
+    def record_failure(self, now: datetime.datetime) -> None:
+        """Count a failed refresh, opening the breaker when needed."""
+        self.failures += 1
+        if self.state is CircuitState.OPEN or (
+            self.state is CircuitState.CLOSED and self.failures < self.failure_threshold
+        ):
+            return
+        self._opened += 1
+        backoff = min(self.base_backoff * 2 ** (self._opened - 1), self.max_backoff)
+        # Jitter within the upper half keeps at least half the backoff.
+        delay = backoff * random.uniform(0.5, 1)
+        self.state = CircuitState.OPEN
+        self.next_attempt = now + delay
+        self._probe_started = None
+        _LOGGER.warning(
+            "%s failed %d times in a row, next attempt at %s",
+            self.host,
+            self.failures,
+            self.next_attempt,
+        )
+
+
+@singleton(DATA_CIRCUIT_BREAKERS)
+def _circuit_breakers(hass: HomeAssistant) -> dict[str, CircuitBreaker]:
+    """Return the breakers of the integration by host."""
+    return {}
+
+
+@callback
+def async_get_circuit_breaker(hass: HomeAssistant, host: str) -> CircuitBreaker:
+    """Return the breaker of ``host``, shared by every coordinator."""
+    breakers = _circuit_breakers(hass)
+    if (breaker := breakers.get(host)) is None:
+        breaker = breakers[host] = CircuitBreaker(host)
+    return breaker
@@ -24,15 +24,31 @@ from .const import (
     CONFIG_FLOW_VERSION,
     CONF_UPDATE_INTERVAL,
     DEFAULT_IMAGE_PATH,
+    CONF_CURRENT_TIMEOUT,
+    CONF_FORECAST_ATTRIBUTES,
+    CONF_FORECAST_INTERVAL,
+    CONF_FORECAST_TIMEOUT,
+    CONF_MAX_STALE_AGE,
+    CONF_WARNINGS_INTERVAL,
+    CONF_WARNINGS_TIMEOUT,
+    DEFAULT_FORECAST_ATTRIBUTES,
     DEFAULT_FORECAST_MODE,
+    FORECAST_ATTRIBUTES_LAYOUTS,
     DEFAULT_LANGUAGE,
     DEFAULT_NAME,
     DEFAULT_UPDATE_INTERVAL,
     DOMAIN,
+    ENDPOINT_CURRENT,
+    ENDPOINT_FORECAST,
+    ENDPOINT_TIMEOUTS,
+    ENDPOINT_WARNINGS,
     FORECAST_MODES,
+    FORECAST_UPDATE_INTERVAL,
     LANGUAGES,
     IMS_PLATFORMS,
     IMS_PLATFORM,
+    SLICE_MAX_STALE_AGE,
+    WARNINGS_UPDATE_INTERVAL,
 )
 from .sensor import SENSOR_DESCRIPTIONS_KEYS
 from .binary_sensor import BINARY_SENSOR_DESCRIPTIONS_KEYS
@@ -230,6 +246,20 @@ def _handle_http_error(error):
     _LOGGER.error("Error fetching data from URL: %s", error)
 
 
+def _longest_interval(user_input):
+    """Return the longest refresh interval set in the options."""
+    return timedelta(
+        minutes=max(
+            user_input.get(key) or 0
+            for key in (
+                CONF_UPDATE_INTERVAL,
+                CONF_FORECAST_INTERVAL,
+                CONF_WARNINGS_INTERVAL,
+            )
+        )
+    )
+
+
 def _extract_city_id(city_value):
     """Extract city id from entry value."""
     if isinstance(city_value, dict):
@@ -295,6 +325,11 @@ class IMSWeatherOptionsFlow(config_entries.OptionsFlow):
             else:
                 user_input[CONF_CITY] = int(city_id)
 
+            if timedelta(hours=user_input[CONF_MAX_STALE_AGE]) < _longest_interval(
+                user_input
+            ):
+                errors["base"] = "max_stale_age_too_short"
+
             # entry = self.config_entry
 
             # _LOGGER.warning('async_step_init_Options')
@@ -373,6 +408,54 @@ class IMSWeatherOptionsFlow(config_entries.OptionsFlow):
                             ),
                         ),
                     ): cv.multi_select(SENSOR_KEYS),
+                    vol.Optional(
+                        CONF_FORECAST_ATTRIBUTES,
+                        default=self._config_entry.options.get(
+                            CONF_FORECAST_ATTRIBUTES, DEFAULT_FORECAST_ATTRIBUTES
+                        ),
+                    ): vol.In(FORECAST_ATTRIBUTES_LAYOUTS),
+                    vol.Optional(
+                        CONF_FORECAST_INTERVAL,
+                        default=self._config_entry.options.get(
+                            CONF_FORECAST_INTERVAL,
+                            int(FORECAST_UPDATE_INTERVAL.total_seconds() // 60),
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+                    vol.Optional(
+                        CONF_WARNINGS_INTERVAL,
+                        default=self._config_entry.options.get(
+                            CONF_WARNINGS_INTERVAL,
+                            int(WARNINGS_UPDATE_INTERVAL.total_seconds() // 60),
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+                    vol.Optional(
+                        CONF_MAX_STALE_AGE,
+                        default=self._config_entry.options.get(
+                            CONF_MAX_STALE_AGE,
+                            int(SLICE_MAX_STALE_AGE.total_seconds() // 3600),
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+                    vol.Optional(
+                        CONF_CURRENT_TIMEOUT,
+                        default=self._config_entry.options.get(
+                            CONF_CURRENT_TIMEOUT,
+                            int(ENDPOINT_TIMEOUTS[ENDPOINT_CURRENT].total_seconds()),
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+                    vol.Optional(
+                        CONF_FORECAST_TIMEOUT,
+                        default=self._config_entry.options.get(
+                            CONF_FORECAST_TIMEOUT,
+                            int(ENDPOINT_TIMEOUTS[ENDPOINT_FORECAST].total_seconds()),
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+                    vol.Optional(
+                        CONF_WARNINGS_TIMEOUT,
+                        default=self._config_entry.options.get(
+                            CONF_WARNINGS_TIMEOUT,
+                            int(ENDPOINT_TIMEOUTS[ENDPOINT_WARNINGS].total_seconds()),
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1)),
                     vol.Optional(
                         CONF_IMAGES_PATH,
                         default=self._config_entry.options.get(
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 import types
+from datetime import timedelta
 
 import homeassistant.util.dt as dt_util
 
@@ -38,6 +39,13 @@ CONF_CITY = "city"
 CONF_LANGUAGE = "language"
 CONF_MODE = "mode"
 CONF_IMAGES_PATH = "images_path"
+CONF_FORECAST_ATTRIBUTES = "forecast_attributes"
+CONF_FORECAST_INTERVAL = "forecast_interval"
+CONF_WARNINGS_INTERVAL = "warnings_interval"
+CONF_MAX_STALE_AGE = "max_stale_age"
+CONF_CURRENT_TIMEOUT = "current_timeout"
+CONF_FORECAST_TIMEOUT = "forecast_timeout"
+CONF_WARNINGS_TIMEOUT = "warnings_timeout"
 CONFIG_FLOW_VERSION = 2
 ENTRY_NAME = "name"
 ENTRY_WEATHER_COORDINATOR = "weather_coordinator"
@@ -60,6 +68,9 @@ ATTR_API_WEATHER_CODE = "weather_code"
 ATTR_API_WIND_BEARING = "wind_direction_id"
 ATTR_API_WIND_CHILL = "wind_chill"
 ATTR_API_WIND_SPEED = "wind_speed"
+ATTR_SNAPSHOT_TIME = "snapshot_time"
+ATTR_CIRCUIT_STATE = "ims_circuit_state"
+ATTR_NEXT_ATTEMPT = "ims_next_attempt"
 UPDATE_LISTENER = "update_listener"
 PLATFORMS = [Platform.SENSOR, Platform.WEATHER, Platform.BINARY_SENSOR]
 IMS_PLATFORMS = ["Sensor", "Weather"]
@@ -71,6 +82,13 @@ FORECAST_MODE_DAILY = "daily"
 DEFAULT_FORECAST_MODE = FORECAST_MODE_DAILY
 FORECAST_MODES = [FORECAST_MODE_HOURLY, FORECAST_MODE_DAILY]
 
+# Layout of the attributes of the forecast_* sensors: one nested dict per
+# hour, or parallel lists of the hours' values with the units stated once.
+FORECAST_ATTRIBUTES_NESTED = "nested"
+FORECAST_ATTRIBUTES_COMPACT = "compact"
+DEFAULT_FORECAST_ATTRIBUTES = FORECAST_ATTRIBUTES_NESTED
+FORECAST_ATTRIBUTES_LAYOUTS = [FORECAST_ATTRIBUTES_NESTED, FORECAST_ATTRIBUTES_COMPACT]
+
 TYPE_CITY = "city"
 TYPE_CURRENT_UV_INDEX = "current_uv_index"
 TYPE_CURRENT_UV_LEVEL = "current_uv_level"
@@ -147,6 +165,86 @@ WARNING_SENSOR_KEYS: frozenset[str] = frozenset(
 )
 
 
+# IMS endpoints polled by ``WeatherUpdateCoordinator``. Each one fills a
+# single slice of ``WeatherData``.
+ENDPOINT_CURRENT = "current"
+ENDPOINT_FORECAST = "forecast"
+ENDPOINT_WARNINGS = "warnings"
+ENDPOINT_RADAR = "radar"
+ENDPOINTS = (ENDPOINT_CURRENT, ENDPOINT_FORECAST, ENDPOINT_WARNINGS, ENDPOINT_RADAR)
+
+# Refresh cadences of the endpoints that do not follow the configured update
+# interval. The forecast is republished a few times a day, warnings need to
+# reach the user quickly (and cost one request per language, see
+# ``WarningsFeed``).
+FORECAST_UPDATE_INTERVAL = timedelta(hours=1)
+WARNINGS_UPDATE_INTERVAL = timedelta(minutes=1)
+RADAR_UPDATE_INTERVAL = timedelta(minutes=10)
+# How long each request of an endpoint may wait for IMS to answer, counted
+# once the rate limiter let it through. The current analysis is critical;
+# the others are best-effort and never outlast it.
+ENDPOINT_TIMEOUTS = {
+    ENDPOINT_CURRENT: timedelta(seconds=20),
+    ENDPOINT_FORECAST: timedelta(seconds=15),
+    ENDPOINT_WARNINGS: timedelta(seconds=10),
+    ENDPOINT_RADAR: timedelta(seconds=10),
+}
+# Likewise for each request of a lookup table (locations, weather codes...).
+LOOKUP_TIMEOUT = timedelta(seconds=20)
+# And for each radar/satellite frame download.
+FRAME_TIMEOUT = timedelta(seconds=20)
+# A refresh gives up this long after its current analysis timeout, which
+# leaves room for waiting on the rate limiter and loading lookup tables.
+REFRESH_QUEUE_ALLOWANCE = timedelta(seconds=30)
+# A failed forecast/warnings/radar fetch keeps serving the last good value
+# for at most this long, and is retried after this delay, doubled on every
+# further failure up to the endpoint's own interval.
+SLICE_MAX_STALE_AGE = timedelta(hours=6)
+FAILED_FETCH_RETRY_INTERVAL = timedelta(minutes=1)
+
+# How long a current analysis fetched for one language of a city may be
+# handed to the coordinator of another language of that city.
+SHARED_ANALYSIS_MAX_AGE = timedelta(seconds=90)
+
+# Domain-wide limits on requests to ims.gov.il (see ``RequestLimiter``).
+IMS_REQUESTS_PER_SECOND = 2.0
+IMS_REQUEST_BURST = 5
+IMS_MAX_IN_FLIGHT = 4
+# Coordinators started together are spread over their intervals, and their
+# first refresh and current analysis fetches (aligned to an IMS publication)
+# over this window. Kept under SHARED_ANALYSIS_MAX_AGE: the coordinators of
+# every language of a city are shifted alike and share their analysis.
+STAGGER_WINDOW = timedelta(minutes=1)
+
+# Circuit breaker of the IMS host (see ``CircuitBreaker``).
+BREAKER_FAILURE_THRESHOLD = 3
+BREAKER_BASE_BACKOFF = timedelta(minutes=2)
+BREAKER_MAX_BACKOFF = timedelta(hours=1)
+BREAKER_PROBE_TIMEOUT = timedelta(minutes=2)
+
+# Key of the ``CoordinatorRegistry`` in ``hass.data[DOMAIN]``.
+COORDINATOR_REGISTRY = "coordinator_registry"
+# Limits of the radar frame cache kept in a subdirectory of
+# ``CONF_IMAGES_PATH``.
+RADAR_FRAMES_DIRECTORY = "ims_radar_frames"
+RADAR_FRAME_CACHE_MAX_BYTES = 50 * 1024 * 1024
+
+# Sensor keys that consume ``WeatherData.forecast``.
+FORECAST_SENSOR_KEYS: frozenset[str] = frozenset(
+    IMS_SENSOR_KEY_PREFIX + TYPE_FORECAST_PREFIX + day
+    for day in (
+        TYPE_FORECAST_TODAY,
+        TYPE_FORECAST_DAY1,
+        TYPE_FORECAST_DAY2,
+        TYPE_FORECAST_DAY3,
+        TYPE_FORECAST_DAY4,
+        TYPE_FORECAST_DAY5,
+        TYPE_FORECAST_DAY6,
+        TYPE_FORECAST_DAY7,
+    )
+)
+
+
 FORECAST_MODE = types.SimpleNamespace()
 FORECAST_MODE.CURRENT = "current"
 FORECAST_MODE.DAILY = "daily"
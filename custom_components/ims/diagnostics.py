@@ -0,0 +1,26 @@
+"""Diagnostics support for IMS Weather."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN, ENTRY_WEATHER_COORDINATOR
+from .rate_limit import async_get_request_limiter
+from .weather_update_coordinator import WeatherUpdateCoordinator
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: WeatherUpdateCoordinator = hass.data[DOMAIN][entry.entry_id][
+        ENTRY_WEATHER_COORDINATOR
+    ]
+    return {
+        "entry": {"data": dict(entry.data), "options": dict(entry.options)},
+        "coordinator": coordinator.as_diagnostics(),
+        "rate_limiter": async_get_request_limiter(hass).as_dict(),
+    }
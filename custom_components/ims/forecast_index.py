@@ -0,0 +1,72 @@
+"""Time index over the hourly entries of an IMS forecast."""
+
+from __future__ import annotations
+
+import bisect
+import datetime
+
+from weatheril import Forecast
+from weatheril.forecast import Daily, Hourly
+
+
+def hourly_start(daily: Daily, hourly: Hourly) -> datetime.datetime:
+    """Return the aware start time of ``hourly``, an hour of ``daily``."""
+    return daily.date + datetime.timedelta(hours=int(hourly.hour.split(":")[0]))
+
+
+class ForecastIndex:
+    """Sorted, timezone-aware start times of every hour of a ``Forecast``.
+
+    Built once per fetched forecast, so pruning is a bisection over
+    ``times`` instead of a scan over ``forecast.days[*].hours`` that parses
+    every ``hour`` string again. ``entries[i]`` is the (day, hour)
+    pair starting at ``times[i]``.
+    """
+
+    __slots__ = ("entries", "forecast", "times")
+
+    def __init__(self, forecast: Forecast) -> None:
+        """Index ``forecast``."""
+        self.forecast = forecast
+        indexed = sorted(
+            (
+                (hourly_start(daily, hourly), position, daily, hourly)
+                for position, daily in enumerate(forecast.days)
+                for hourly in daily.hours
+            ),
+            key=lambda item: (item[0], item[1]),
+        )
+        self.times: list[datetime.datetime] = [item[0] for item in indexed]
+        self.entries: list[tuple[Daily, Hourly]] = [
+            (item[2], item[3]) for item in indexed
+        ]
+
+    def prune(self, now: datetime.datetime, today: datetime.datetime) -> bool:
+        """Drop the hours starting before ``now`` and the days before ``today``.
+
+        The indexed ``Forecast`` is updated in place. Returns whether
+        anything was dropped.
+        """
+        days = self.forecast.days
+        kept_days = [daily for daily in days if daily.date >= today]
+        first_hour = bisect.bisect_left(self.times, now)
+        if len(kept_days) == len(days) and not first_hour:
+            return False
+
+        kept = {id(daily) for daily in kept_days}
+        hours: dict[int, list[Hourly]] = {day_id: [] for day_id in kept}
+        times: list[datetime.datetime] = []
+        entries: list[tuple[Daily, Hourly]] = []
+        for start, (daily, hourly) in zip(
+            self.times[first_hour:], self.entries[first_hour:], strict=True
+        ):
+            if id(daily) in kept:
+                hours[id(daily)].append(hourly)
+                times.append(start)
+                entries.append((daily, hourly))
+        for daily in kept_days:
+            daily.hours = hours[id(daily)]
+        self.forecast.days = kept_days
+        self.times = times
+        self.entries = entries
+        return True
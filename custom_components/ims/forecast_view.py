@@ -0,0 +1,228 @@
+"""What the entities show of an IMS forecast, derived once per update."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from typing import Any
+
+from homeassistant.const import UV_INDEX, UnitOfTemperature
+from weatheril import Forecast
+from weatheril.forecast import Daily, Hourly
+
+from .const import WEATHER_CODE_TO_ICON
+from .utils import get_hourly_weather_icon
+
+
+class ForecastView:
+    """Per-day sensor attributes and per-hour weather codes of a ``Forecast``.
+
+    The ``forecast_*`` sensors and the weather entity both resolve the
+    weather code of every hour, and ``get_hourly_weather_icon`` parses the
+    ``hour`` string each time. A view is shared by every entity of a
+    coordinator (see ``WeatherData.forecast_view``), so each day and the
+    hourly list are derived once per update, and each (hour, code) pair is
+    resolved once whichever entity asks first.
+    """
+
+    __slots__ = (
+        "_codes",
+        "_compact_day_attributes",
+        "_day_attributes",
+        "_hourly_codes",
+        "forecast",
+    )
+
+    def __init__(self, forecast: Forecast) -> None:
+        """Initialize the view; everything is derived on first use."""
+        self.forecast = forecast
+        self._codes: dict[tuple[str, str | None], str | None] = {}
+        self._day_attributes: dict[int, dict[str, Any]] = {}
+        self._compact_day_attributes: dict[int, dict[str, Any]] = {}
+        self._hourly_codes: list[tuple[Hourly, str | None]] | None = None
+
+    def day(self, day_index: int) -> Daily | None:
+        """Return day ``day_index`` of the forecast (0 is today), if any."""
+        if day_index >= len(self.forecast.days):
+            return None
+        return self.forecast.days[day_index]
+
+    def day_attributes(self, day_index: int) -> dict[str, Any]:
+        """Return the sensor attributes of day ``day_index``."""
+        if (attributes := self._day_attributes.get(day_index)) is None:
+            daily_forecast = self.day(day_index)
+            attributes = self._day_attributes[day_index] = (
+                generate_forecast_extra_state_attributes(
+                    daily_forecast, self.hourly_code
+                )
+                if daily_forecast is not None
+                else {}
+            )
+        return attributes
+
+    def compact_day_attributes(self, day_index: int) -> dict[str, Any]:
+        """Return the sensor attributes of day ``day_index``, compact layout."""
+        if (attributes := self._compact_day_attributes.get(day_index)) is None:
+            daily_forecast = self.day(day_index)
+            attributes = self._compact_day_attributes[day_index] = (
+                generate_compact_forecast_attributes(daily_forecast, self.hourly_code)
+                if daily_forecast is not None
+                else {}
+            )
+        return attributes
+
+    def hourly_codes(self) -> list[tuple[Hourly, str | None]]:
+        """Return every hour with the weather code the weather entity shows.
+
+        An hour without a usable code (missing, "0" or negative) keeps the
+        code of the hour before it, or of its day for the first hours.
+        """
+        if self._hourly_codes is not None:
+            return self._hourly_codes
+        hourly_codes: list[tuple[Hourly, str | None]] = []
+        last_weather_code = None
+        for daily_forecast in self.forecast.days:
+            for hourly_forecast in daily_forecast.hours:
+                if _is_usable_code(hourly_forecast.weather_code) and (
+                    hourly_forecast.weather_code != "0"
+                ):
+                    last_weather_code = hourly_forecast.weather_code
+                elif not last_weather_code and _is_usable_code(
+                    daily_forecast.weather_code
+                ):
+                    last_weather_code = daily_forecast.weather_code
+                hourly_codes.append(
+                    (
+                        hourly_forecast,
+                        self.hourly_code(hourly_forecast.hour, last_weather_code),
+                    )
+                )
+        self._hourly_codes = hourly_codes
+        return hourly_codes
+
+    def hourly_code(self, hour: str, weather_code: str | None) -> str | None:
+        """Return ``weather_code`` as shown at ``hour`` (night variants)."""
+        key = (hour, weather_code)
+        if key not in self._codes:
+            self._codes[key] = get_hourly_weather_icon(hour, weather_code)
+        return self._codes[key]
+
+
+def _is_usable_code(weather_code: str | None) -> bool:
+    """Return False for a missing or negative weather code."""
+    if not weather_code:
+        return False
+    try:
+        return int(weather_code) >= 0
+    except (ValueError, TypeError):
+        return True
+
+
+def generate_forecast_extra_state_attributes(
+    daily_forecast: Daily,
+    hourly_code: Callable[[str, str | None], str | None] = get_hourly_weather_icon,
+) -> dict[str, Any]:
+    """Return the attributes of a ``forecast_*`` sensor showing a day."""
+    attributes = {
+        "minimum_temperature": {
+            "value": daily_forecast.minimum_temperature,
+            "unit": UnitOfTemperature.CELSIUS,
+        },
+        "maximum_temperature": {
+            "value": daily_forecast.maximum_temperature,
+            "unit": UnitOfTemperature.CELSIUS,
+        },
+        "maximum_uvi": {"value": daily_forecast.maximum_uvi, "unit": UV_INDEX},
+        "weather": {
+            "value": daily_forecast.weather,
+            "icon": WEATHER_CODE_TO_ICON.get(
+                str(daily_forecast.weather_code), "mdi:weather-sunny"
+            ),
+        },
+        "description": {"value": daily_forecast.description},
+        "date": {"value": daily_forecast.date.strftime("%Y/%m/%d")},
+    }
+
+    for hour, weather_status, hourly_weather_code in _hourly_weather(
+        daily_forecast, hourly_code
+    ):
+        attributes[hour.hour] = {
+            "weather": {
+                "value": weather_status,
+                "icon": WEATHER_CODE_TO_ICON.get(str(hourly_weather_code)),
+            },
+            "temperature": {
+                "value": hour.precise_temperature or hour.temperature,
+                "unit": UnitOfTemperature.CELSIUS,
+            },
+        }
+
+    return attributes
+
+
+def generate_compact_forecast_attributes(
+    daily_forecast: Daily,
+    hourly_code: Callable[[str, str | None], str | None] = get_hourly_weather_icon,
+) -> dict[str, Any]:
+    """Return the attributes of a ``forecast_*`` sensor, compact layout.
+
+    Holds what ``generate_forecast_extra_state_attributes`` does, with the
+    hours as parallel lists instead of one nested dict per hour and every
+    unit stated once.
+    """
+    hours: list[str] = []
+    temperatures: list[float | None] = []
+    weather_codes: list[str | None] = []
+    icons: list[str | None] = []
+    weather: list[str | None] = []
+    for hour, weather_status, hourly_weather_code in _hourly_weather(
+        daily_forecast, hourly_code
+    ):
+        hours.append(hour.hour)
+        temperatures.append(hour.precise_temperature or hour.temperature)
+        weather_codes.append(hourly_weather_code)
+        icons.append(WEATHER_CODE_TO_ICON.get(str(hourly_weather_code)))
+        weather.append(weather_status)
+
+    return {
+        "date": daily_forecast.date.strftime("%Y/%m/%d"),
+        "description": daily_forecast.description,
+        "weather": daily_forecast.weather,
+        "icon": WEATHER_CODE_TO_ICON.get(
+            str(daily_forecast.weather_code), "mdi:weather-sunny"
+        ),
+        "minimum_temperature": daily_forecast.minimum_temperature,
+        "maximum_temperature": daily_forecast.maximum_temperature,
+        "maximum_uvi": daily_forecast.maximum_uvi,
+        "temperature_unit": UnitOfTemperature.CELSIUS,
+        "uvi_unit": UV_INDEX,
+        "hours": hours,
+        "temperatures": temperatures,
+        "weather_codes": weather_codes,
+        "icons": icons,
+        "hourly_weather": weather,
+    }
+
+
+def _hourly_weather(
+    daily_forecast: Daily,
+    hourly_code: Callable[[str, str | None], str | None],
+) -> Iterator[tuple[Hourly, str | None, str | None]]:
+    """Yield every hour of a day with its weather status and code.
+
+    An hour without a status or code keeps those of the hour before it, or
+    of its day for the first hours.
+    """
+    last_weather_code = None
+    last_weather_status = None
+    for hour in daily_forecast.hours:
+        if hour.weather and hour.weather != "Nothing":
+            last_weather_status = hour.weather
+        elif not last_weather_status:
+            last_weather_status = daily_forecast.weather
+
+        if hour.weather_code and hour.weather_code != "0":
+            last_weather_code = hour.weather_code
+        elif not last_weather_code:
+            last_weather_code = daily_forecast.weather_code
+
+        yield hour, last_weather_status, hourly_code(hour.hour, last_weather_code)
@@ -0,0 +1,646 @@
+"""Async client for the IMS (ims.gov.il) JSON API.
+
+``weatheril.WeatherIL`` talks to IMS with blocking ``requests`` calls, so
+every use of it has to be pushed into an executor thread and opens its own
+HTTP connection. This client talks to the same endpoints over Home
+Assistant's shared aiohttp session (keep-alive, pooled connections) and
+builds the very same ``weatheril`` model objects, so entities keep working
+unchanged.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import socket
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import datetime
+from http import HTTPStatus
+from typing import Any, TypeVar
+from urllib.parse import urlparse
+
+from aiohttp import ClientError, ClientResponse, ClientResponseError, hdrs
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from weatheril import Forecast, RadarSatellite, Warning, Weather
+from weatheril.consts import (
+    CURRENT_ANALYSIS_URL,
+    FORECAST_URL,
+    IMS_API_URL_BASE,
+    LOCATIONS_INFO_URL,
+    RADAR_SATELLITE_URL,
+    REGIONS_URL,
+    TIMEZONE,
+    WARNINGS_METADTA_URL,
+    WARNINGS_URL,
+    WEATHER_CODES_URL,
+    WIND_DIRECTIONS_URL,
+)
+from weatheril.forecast import Daily, Hourly
+from weatheril.utils import get_value
+
+from .const import LOOKUP_TIMEOUT
+from .lookups import (
+    LanguageLookups,
+    WarningLookups,
+    fallback_locations,
+    fallback_weather_codes,
+    lookup_tasks,
+    parse_locations,
+    parse_regions,
+    parse_weather_codes,
+    parse_wind_directions,
+    prime_weatheril_tables,
+    prime_weatheril_warning_tables,
+)
+from .rate_limit import async_get_request_limiter
+
+_LOGGER = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+IMS_DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+IMS_DATE_FORMAT = "%Y-%m-%d"
+
+DAILY_KEY = "daily"
+HOURLY_KEY = "hourly"
+FULL_WARNINGS_DATA_KEY = "full_warnings_data"
+
+IMS_HOST = urlparse(IMS_API_URL_BASE).hostname
+
+# Answers telling us to slow down.
+THROTTLE_STATUSES = (HTTPStatus.TOO_MANY_REQUESTS, HTTPStatus.SERVICE_UNAVAILABLE)
+
+# (JSON key, ``RadarSatellite`` attribute) pairs of the radar_satellite index.
+RADAR_IMAGE_TYPES = (
+    (("IMSRadar",), "imsradar_images"),
+    (("radar",), "radar_images"),
+    (("satellite", "NATURAL"), "middle_east_satellite_images"),
+    (("EUROPE",), "europe_satellite_images"),
+)
+
+
+class ImsRequestTimeout(TimeoutError):
+    """IMS did not answer a request within its timeout."""
+
+
+def is_ims_unavailable(error: BaseException) -> bool:
+    """Return whether ``error`` means IMS could not be reached or served.
+
+    A connection failure, a request IMS did not answer in time, a server
+    error or a throttling answer do; a client error such as ``404`` or a
+    payload that does not parse says nothing about the availability of IMS.
+    """
+    if isinstance(error, ClientResponseError):
+        return (
+            error.status >= HTTPStatus.INTERNAL_SERVER_ERROR
+            or error.status in THROTTLE_STATUSES
+        )
+    return isinstance(error, (ClientError, ImsRequestTimeout))
+
+
+@dataclass(slots=True)
+class _CachedResponse:
+    """Validators of an IMS response and the object parsed from it."""
+
+    etag: str | None
+    last_modified: str | None
+    result: Any
+
+
+class ImsClient:
+    """Fetch IMS data for one language over Home Assistant's aiohttp session."""
+
+    def __init__(self, hass: HomeAssistant, language: str) -> None:
+        """Initialize the client."""
+        self._hass = hass
+        self.language = language
+        # ims.gov.il does not support IPv6; avoid waiting on AAAA timeouts.
+        self._session = async_get_clientsession(hass, family=socket.AF_INET)
+        self._limiter = async_get_request_limiter(hass)
+        # Tables of this language, once loaded by the first fetch.
+        self.lookups: LanguageLookups | None = None
+        # Likewise, once loaded by ``async_get_warnings_index``.
+        self.warning_lookups: WarningLookups | None = None
+        self._cache: dict[str, _CachedResponse] = {}
+
+    async def async_get_current_analysis(
+        self, location: int | str, timeout: float | None = None
+    ) -> Weather | None:
+        """Return the current analysis of ``location``, or ``None`` if missing.
+
+        ``timeout`` (in seconds) bounds the HTTP request to IMS, here and in
+        every other ``async_get_*`` method; see ``_async_fetch``.
+        """
+        lookups = await self._async_ensure_lookups(location)
+        return await self._async_fetch(
+            CURRENT_ANALYSIS_URL.format(language=self.language, location=location),
+            lambda payload: lookups.localize_weather(
+                parse_current_analysis(
+                    self.language, str(location), _data_member(payload)
+                )
+            ),
+            timeout=timeout,
+        )
+
+    async def async_get_current_analysis_data(
+        self, location: int | str, timeout: float | None = None
+    ) -> dict[str, Any]:
+        """Return the raw current analysis data of ``location``.
+
+        The values are codes and numbers, the same in every language, so
+        the data can be localized by clients of other languages with
+        ``async_localize_current_analysis``.
+        """
+        return await self._async_fetch(
+            CURRENT_ANALYSIS_URL.format(language=self.language, location=location),
+            _data_member,
+            timeout=timeout,
+        )
+
+    async def async_localize_current_analysis(
+        self, location: int | str, data: dict[str, Any]
+    ) -> Weather | None:
+        """Build the ``Weather`` of this client's language from raw data."""
+        lookups = await self._async_ensure_lookups(location)
+        return lookups.localize_weather(
+            parse_current_analysis(self.language, str(location), data)
+        )
+
+    async def async_get_forecast(
+        self, location: int | str, timeout: float | None = None
+    ) -> Forecast | None:
+        """Return the multi-day forecast of ``location``."""
+        lookups = await self._async_ensure_lookups(location)
+        return await self._async_fetch(
+            FORECAST_URL.format(language=self.language, location=location),
+            lambda payload: lookups.localize_forecast(
+                parse_forecast(self.language, _data_member(payload))
+            ),
+            timeout=timeout,
+        )
+
+    async def async_get_warnings(
+        self, location: int | str, timeout: float | None = None
+    ) -> list[Warning]:
+        """Return the IMS warnings issued for the region of ``location``."""
+        index = await self.async_get_warnings_index(location, timeout)
+        region = self.region_of(location)
+        assert self.warning_lookups is not None
+        return build_warnings(
+            location, region, index.get(region, []), self.warning_lookups
+        )
+
+    async def async_get_warnings_index(
+        self, location: int | str, timeout: float | None = None
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Return the national warnings feed indexed by region id.
+
+        ``location`` is any known location; it is only used to load the
+        region lookup tables. An unchanged feed returns the same index
+        object as the previous call. Afterwards ``warning_lookups`` holds
+        the tables ``build_warnings`` needs.
+        """
+        await self._async_ensure_warning_lookups(location)
+        return await self._async_fetch(
+            WARNINGS_URL.format(language=self.language),
+            lambda payload: index_warnings(_data_member(payload)),
+            timeout=timeout,
+        )
+
+    def region_of(self, location: int | str) -> str:
+        """Return the warnings region id of ``location``.
+
+        Needs the lookup tables loaded by ``async_get_warnings_index``.
+        """
+        assert self.lookups is not None
+        location_info = self.lookups.location_info(location)
+        if not location_info:
+            raise ValueError(f"Location not found for id {location}")
+        return "r-" + str(location_info.get("rid"))
+
+    async def async_get_radar_images(
+        self, timeout: float | None = None
+    ) -> RadarSatellite:
+        """Return the current national radar/satellite image index."""
+        return await self._async_fetch(
+            RADAR_SATELLITE_URL.format(language=self.language),
+            parse_radar_images,
+            timeout=timeout,
+        )
+
+    async def async_get_bytes(self, url: str, timeout: float | None = None) -> bytes:
+        """Return the raw body of ``url``, e.g. a radar or satellite frame.
+
+        ``timeout`` is applied as in ``_async_fetch``.
+        """
+        _LOGGER.debug("Downloading: %s", url)
+        deadline = asyncio.timeout(timeout)
+        try:
+            async with (
+                self._limiter.async_request(),
+                deadline,
+                self._session.get(url) as response,
+            ):
+                self._check_throttled(response)
+                response.raise_for_status()
+                return await response.read()
+        except TimeoutError as error:
+            if not deadline.expired():
+                raise
+            raise ImsRequestTimeout(
+                f"IMS did not answer {url} within {timeout:.0f}s"
+            ) from error
+
+    async def _async_fetch(
+        self,
+        url: str,
+        parse: Callable[[dict[str, Any]], _T],
+        cache_key: str | None = None,
+        timeout: float | None = None,
+    ) -> _T:
+        """GET ``url`` and parse its JSON body, revalidating a cached result.
+
+        When an earlier response carried an ``ETag`` or ``Last-Modified``
+        header the request is made conditional. A ``304 Not Modified``
+        answer returns the object parsed from that earlier response as-is,
+        so an unchanged payload is neither downloaded nor re-parsed.
+
+        ``timeout`` starts once the rate limiter let the request through,
+        so time spent queued behind other requests does not count; when IMS
+        does not answer within it ``ImsRequestTimeout`` is raised.
+
+        IMS does not always label its JSON responses as such, so the
+        content type is not enforced.
+        """
+        key = cache_key or url
+        cached = self._cache.get(key)
+        headers = {}
+        if cached is not None:
+            if cached.etag:
+                headers[hdrs.IF_NONE_MATCH] = cached.etag
+            if cached.last_modified:
+                headers[hdrs.IF_MODIFIED_SINCE] = cached.last_modified
+
+        _LOGGER.debug("Getting data from: %s", url)
+        deadline = asyncio.timeout(timeout)
+        try:
+            async with (
+                self._limiter.async_request(),
+                deadline,
+                self._session.get(url, headers=headers) as response,
+            ):
+                self._check_throttled(response)
+                if response.status == HTTPStatus.NOT_MODIFIED and cached is not None:
+                    _LOGGER.debug("%s not modified, reusing the parsed result", url)
+                    return cached.result
+                response.raise_for_status()
+                payload = await response.json(content_type=None)
+                etag = response.headers.get(hdrs.ETAG)
+                last_modified = response.headers.get(hdrs.LAST_MODIFIED)
+        except TimeoutError as error:
+            if not deadline.expired():
+                raise
+            raise ImsRequestTimeout(
+                f"IMS did not answer {url} within {timeout:.0f}s"
+            ) from error
+
+        result = parse(payload if isinstance(payload, dict) else {})
+        if etag or last_modified:
+            self._cache[key] = _CachedResponse(etag, last_modified, result)
+        else:
+            self._cache.pop(key, None)
+        return result
+
+    def _check_throttled(self, response: ClientResponse) -> None:
+        """Slow every client down when IMS says we are too fast."""
+        if response.status not in THROTTLE_STATUSES:
+            return
+        retry_after = response.headers.get(hdrs.RETRY_AFTER)
+        _LOGGER.warning(
+            "IMS throttled %s (HTTP %s, Retry-After %s)",
+            response.url,
+            response.status,
+            retry_after,
+        )
+        self._limiter.async_throttled(
+            float(retry_after) if retry_after and retry_after.isdigit() else None
+        )
+
+    async def _async_ensure_lookups(self, location: int | str) -> LanguageLookups:
+        """Load the lookup tables models are built and localized with.
+
+        The tables are fetched once per language over the shared session.
+        The ``weatheril`` models fill in names (location, weather
+        description, wind direction) from module-level tables, which they
+        would otherwise download with blocking ``requests`` on first use;
+        those are filled from the fetched tables instead. They hold the
+        language of whichever client came first, so the names are then
+        resolved again from the tables of this client's language (see
+        ``lookups``).
+        """
+        key = self.language
+        task = self._lookup_task(key, self._async_load_lookups)
+        lookups = await asyncio.shield(task)
+        if not lookups.complete:
+            # Serve the fallback tables now and ask IMS again next time.
+            self._forget_lookup_task(key, task)
+        prime_weatheril_tables(lookups)
+        self.lookups = lookups
+        return lookups
+
+    async def _async_ensure_warning_lookups(self, location: int | str) -> None:
+        """Load the region and warning metadata tables (see above)."""
+        await self._async_ensure_lookups(location)
+        key = f"{self.language} warnings"
+        task = self._lookup_task(key, self._async_load_warning_lookups)
+        try:
+            warning_lookups = await asyncio.shield(task)
+        except Exception:
+            self._forget_lookup_task(key, task)
+            raise
+        prime_weatheril_warning_tables(warning_lookups)
+        self.warning_lookups = warning_lookups
+
+    def _lookup_task(
+        self, key: str, load: Callable[[], Awaitable[_T]]
+    ) -> asyncio.Task[_T]:
+        """Return the load of lookup tables ``key``, shared by every client."""
+        tasks = lookup_tasks(self._hass)
+        if (task := tasks.get(key)) is None:
+            task = tasks[key] = self._hass.async_create_task(
+                load(), f"IMS {key} lookup tables"
+            )
+        return task
+
+    def _forget_lookup_task(self, key: str, task: asyncio.Task[Any]) -> None:
+        """Have the next caller load lookup tables ``key`` again."""
+        tasks = lookup_tasks(self._hass)
+        if tasks.get(key) is task:
+            del tasks[key]
+
+    async def _async_load_lookups(self) -> LanguageLookups:
+        """Fetch the location, weather code and wind direction tables.
+
+        A table IMS fails to serve is replaced with the one ``weatheril``
+        ships for the language (there is none for wind directions), and the
+        lookups are marked incomplete.
+        """
+        complete = True
+
+        async def _async_table(
+            url: str, parse: Callable[[dict[str, Any]], _T], fallback: _T
+        ) -> _T:
+            nonlocal complete
+            try:
+                return await self._async_fetch(
+                    url.format(language=self.language),
+                    lambda payload: parse(_data_member(payload)),
+                    timeout=LOOKUP_TIMEOUT.total_seconds(),
+                )
+            except Exception as error:  # noqa: BLE001 - fall back, see docstring
+                _LOGGER.warning(
+                    "Failed to load IMS lookup table %s; using a built-in one: %s",
+                    url.format(language=self.language),
+                    error,
+                )
+                complete = False
+                return fallback
+
+        locations, weather_codes, wind_directions = await asyncio.gather(
+            _async_table(
+                LOCATIONS_INFO_URL, parse_locations, fallback_locations(self.language)
+            ),
+            _async_table(
+                WEATHER_CODES_URL,
+                parse_weather_codes,
+                fallback_weather_codes(self.language),
+            ),
+            _async_table(WIND_DIRECTIONS_URL, parse_wind_directions, {}),
+        )
+        return LanguageLookups(
+            self.language, locations, weather_codes, wind_directions, complete
+        )
+
+    async def _async_load_warning_lookups(self) -> WarningLookups:
+        """Fetch the region and warning metadata tables."""
+        regions, metadata = await asyncio.gather(
+            self._async_fetch(
+                REGIONS_URL.format(language=self.language),
+                parse_regions,
+                timeout=LOOKUP_TIMEOUT.total_seconds(),
+            ),
+            self._async_fetch(
+                WARNINGS_METADTA_URL.format(language=self.language),
+                _data_member,
+                timeout=LOOKUP_TIMEOUT.total_seconds(),
+            ),
+        )
+        return WarningLookups(
+            self.language,
+            regions,
+            warning_types={
+                int(warning_type["warning_type_id"]): warning_type
+                for warning_type in metadata["ims_warning_type"].values()
+            },
+            warning_groups=dict(metadata["warning_groups"]),
+            warning_severities={
+                int(severity["severity_id"]): severity
+                for severity in metadata["warning_severity"].values()
+            },
+        )
+
+
+def _data_member(payload: dict[str, Any]) -> dict[str, Any]:
+    """Return the ``data`` member of an IMS city portal response."""
+    data = payload.get("data")
+    return data if isinstance(data, dict) else {}
+
+
+def _parse_datetime(value: str | None) -> datetime | None:
+    """Parse an IMS local timestamp into an aware datetime."""
+    if not value:
+        return None
+    return TIMEZONE.localize(datetime.strptime(value, IMS_DATETIME_FORMAT))
+
+
+def parse_current_analysis(
+    language: str, location: str, data: dict[str, Any]
+) -> Weather | None:
+    """Build a ``Weather`` from a ``now_analysis`` payload."""
+    analysis_data = data.get(location)
+    if not analysis_data:
+        _LOGGER.error('No "%s" in current analysis response', location)
+        return None
+
+    return Weather(
+        language=language,
+        lid=get_value(analysis_data, "lid", None, str),
+        humidity=get_value(analysis_data, "relative_humidity", None, int, 0),
+        rain=get_value(analysis_data, "rain", None, float, 0.0, -999.0),
+        rain_chance=get_value(analysis_data, "rain_chance", None, int, 0),
+        temperature=get_value(analysis_data, "temperature", None, float, 0.0),
+        due_point_temp=get_value(analysis_data, "due_point_Temp", None, int, 0),
+        wind_speed=get_value(analysis_data, "wind_speed", None, int, 0),
+        wind_chill=get_value(analysis_data, "wind_chill", None, int, 0),
+        wind_direction_id=get_value(analysis_data, "wind_direction_id", None, int, 0),
+        feels_like=get_value(analysis_data, "feels_like", None, float),
+        heat_stress_level=get_value(analysis_data, "heat_stress_level", None, int, 0),
+        u_v_index=get_value(analysis_data, "u_v_index", None, int, 0),
+        u_v_level=get_value(analysis_data, "u_v_level", None, str),
+        u_v_i_max=get_value(analysis_data, "u_v_i_max", None, int),
+        u_v_i_factor=get_value(analysis_data, "u_v_i_factor", None, float),
+        wave_height=get_value(analysis_data, "wave_height", None, float, 0.0),
+        max_temp=get_value(analysis_data, "max_temp", None, int),
+        min_temp=get_value(analysis_data, "min_temp", None, int),
+        pm10=get_value(analysis_data, "pm10", None, int, 0),
+        forecast_time=_parse_datetime(
+            get_value(analysis_data, "forecast_time", None, str)
+        ),
+        modified_at=_parse_datetime(get_value(analysis_data, "modified", None, str)),
+        json=analysis_data,
+        weather_code=get_value(analysis_data, "weather_code", None, int),
+        gust_speed=get_value(analysis_data, "gust_speed", None, int, None, -999),
+    )
+
+
+def parse_forecast(language: str, data: dict[str, Any]) -> Forecast:
+    """Build a ``Forecast`` from a ``full_forecast_data`` payload."""
+    days = []
+    for key, day_data in data.items():
+        days.append(
+            Daily(
+                language=language,
+                date=TIMEZONE.localize(datetime.strptime(key, IMS_DATE_FORMAT)),
+                lid=get_value(day_data, DAILY_KEY, "lid", default_value="0"),
+                weather_code=get_value(day_data, DAILY_KEY, "weather_code", int),
+                minimum_temperature=get_value(
+                    day_data, DAILY_KEY, "minimum_temperature", int
+                ),
+                maximum_temperature=get_value(
+                    day_data, DAILY_KEY, "maximum_temperature", int
+                ),
+                maximum_uvi=get_value(day_data, DAILY_KEY, "maximum_uvi", int),
+                u_v_i_factor=get_value(day_data, DAILY_KEY, "u_v_i_factor", float),
+                hours=_parse_hourly_forecast(
+                    language, get_value(data, key, HOURLY_KEY, dict) or {}
+                ),
+                description=get_value(
+                    day_data, "country", "description", default_value=""
+                ).rstrip(),
+            )
+        )
+    return Forecast(days)
+
+
+def _parse_hourly_forecast(language: str, data: dict[str, Any]) -> list[Hourly]:
+    """Build the ``Hourly`` entries of one forecast day."""
+    return [
+        Hourly(
+            language=language,
+            hour=key,
+            forecast_time=_parse_datetime(hour_data.get("forecast_time")),
+            created=_parse_datetime(hour_data.get("created")),
+            weather_code=get_value(data, key, "weather_code", int),
+            temperature=get_value(data, key, "temperature", int),
+            precise_temperature=get_value(data, key, "precise_temperature", float),
+            heat_stress=get_value(data, key, "heat_stress", float),
+            heat_stress_level=get_value(data, key, "heat_stress_level", int),
+            pm10=get_value(data, key, "pm10", int),
+            relative_humidity=get_value(data, key, "relative_humidity", int),
+            rain=get_value(data, key, "rain", float, None, -999.0),
+            rain_chance=get_value(data, key, "rain_chance", int),
+            wind_speed=get_value(data, key, "wind_speed", int),
+            gust_speed=get_value(data, key, "gust_speed", int, None, -999),
+            wind_direction_id=get_value(data, key, "wind_direction_id", int),
+            wave_height=get_value(data, key, "wave_height", float),
+            wind_chill=get_value(data, key, "wind_chill", int),
+            u_v_index=get_value(data, key, "u_v_index", int, None, -8991),
+            u_v_i_max=get_value(data, key, "u_v_i_max", int),
+        )
+        for key, hour_data in data.items()
+    ]
+
+
+def index_warnings(data: dict[str, Any]) -> dict[str, list[dict[str, Any]]]:
+    """Group the alerts of a ``warnings`` payload by region id."""
+    index: dict[str, list[dict[str, Any]]] = {}
+    for daily_warnings in (data.get(FULL_WARNINGS_DATA_KEY) or {}).values():
+        if not isinstance(daily_warnings, dict):
+            continue
+        for region_id, alerts in daily_warnings.items():
+            if isinstance(alerts, dict):
+                index.setdefault(region_id, []).extend(alerts.values())
+    return index
+
+
+def build_warnings(
+    location: int | str,
+    region: str,
+    alerts: list[dict[str, Any]],
+    lookups: WarningLookups,
+) -> list[Warning]:
+    """Build the ``Warning`` list of ``location`` from the alerts of ``region``.
+
+    The names are those of the language of ``lookups``. Where ``weatheril``
+    raises ``ValueError`` for a region missing from its tables, here such
+    a region has no warnings: the rest of the update goes on, and the
+    region is logged once per language.
+    """
+    if region not in lookups.regions:
+        if region not in lookups.unknown_regions:
+            lookups.unknown_regions.add(region)
+            _LOGGER.warning(
+                "Region not found for id %s; no warnings for location %s",
+                region,
+                location,
+            )
+        return []
+    return [
+        lookups.localize_warning(
+            _build_warning(lookups.language, location, alert), region, alert
+        )
+        for alert in alerts
+    ]
+
+
+def _build_warning(
+    language: str, location: int | str, alert: dict[str, Any]
+) -> Warning:
+    """Build the ``Warning`` of one alert."""
+    return Warning(
+        language=language,
+        location_id=int(location),
+        wid=int(alert["wid"]),
+        alert_id=int(alert["alert_id"]),
+        severity_id=int(alert["severity_id"]),
+        warning_type_id=int(alert["warning_type_id"]),
+        sent=alert["sent"],
+        valid_from=alert["valid_from"],
+        valid_to=alert["valid_to"],
+        full_en=alert["full_en"],
+        full_he=alert["full_he"],
+        text=alert["text"],
+        text_full=alert["text_full"],
+        valid_from_unix=int(alert["valid_from_unix"]),
+        groups=alert["groups"],
+        regions=alert["regions"],
+    )
+
+
+def parse_radar_images(data: dict[str, Any]) -> RadarSatellite:
+    """Build a ``RadarSatellite`` from a ``radar_satellite`` payload."""
+    base_url = IMS_API_URL_BASE.format(language="").rstrip("/")
+    types = (data.get("data") or {}).get("types") or {}
+    images: dict[str, list[str]] = {}
+    for keys, attribute in RADAR_IMAGE_TYPES:
+        items: Any = types
+        for key in keys:
+            items = items.get(key, {}) if isinstance(items, dict) else []
+        images[attribute] = [
+            base_url + item["file_name"]
+            for item in (items if isinstance(items, list) else [])
+            if item.get("file_name")
+        ]
+    return RadarSatellite(**images)
@@ -0,0 +1,211 @@
+"""IMS lookup tables of each language.
+
+The ``weatheril`` models resolve names (location, weather description,
+warning region, ...) from codes in ``__post_init__``, through module-level
+tables filled in the language of whichever model is built first. With an
+English and a Hebrew entry, one of them would show the names of the other.
+``ImsClient`` loads the tables of its own language, once per Home Assistant
+instance, and resolves those names again from them after building a model.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.singleton import singleton
+from weatheril import Forecast, Warning, Weather
+from weatheril import utils as weatheril_utils
+from weatheril.consts import (
+    EN_LOCATIONS,
+    EN_WEATHER_CODES,
+    HE_LOCATIONS,
+    HE_WEATHER_CODES,
+)
+
+DATA_LOOKUP_TASKS = "ims_lookup_tasks"
+
+# What ``weatheril`` shows for a code missing from its tables.
+UNKNOWN_NAME = "Nothing"
+UNKNOWN_WIND_DIRECTION = -1
+
+
+@dataclass(slots=True)
+class LanguageLookups:
+    """Names of the location, weather and wind direction codes."""
+
+    language: str
+    locations: dict[int, dict[str, Any]]
+    weather_codes: dict[int, str]
+    # Wind direction id to azimuth, in degrees.
+    wind_directions: dict[int, int]
+    # False when a table is a built-in fallback rather than what IMS serves.
+    complete: bool = True
+
+    def location_info(self, lid: int | str | None) -> dict[str, Any] | None:
+        """Return the location table entry of ``lid``, if any."""
+        try:
+            return self.locations.get(int(lid))  # type: ignore[arg-type]
+        except (TypeError, ValueError):
+            return None
+
+    def location_name(self, lid: int | str | None) -> str:
+        """Return the name of location ``lid``."""
+        location = self.location_info(lid)
+        return location["name"] if location else UNKNOWN_NAME
+
+    def weather_description(self, code: int | str | None) -> str:
+        """Return the description of weather ``code``."""
+        if not code:
+            return UNKNOWN_NAME
+        return self.weather_codes.get(int(code), UNKNOWN_NAME)
+
+    def wind_direction(self, direction_id: int | None) -> int:
+        """Return the azimuth of wind direction ``direction_id``."""
+        if direction_id is None:
+            return UNKNOWN_WIND_DIRECTION
+        return self.wind_directions.get(direction_id) or UNKNOWN_WIND_DIRECTION
+
+    def localize_weather(self, weather: Weather | None) -> Weather | None:
+        """Resolve the names of ``weather`` in this language."""
+        if weather is not None:
+            weather.location = self.location_name(weather.lid)
+            weather.description = self.weather_description(weather.weather_code)
+            weather.wind_direction = self.wind_direction(weather.wind_direction_id)
+        return weather
+
+    def localize_forecast(self, forecast: Forecast) -> Forecast:
+        """Resolve the names of every day and hour of ``forecast``."""
+        for daily_forecast in forecast.days:
+            daily_forecast.location = self.location_name(daily_forecast.lid)
+            daily_forecast.weather = self.weather_description(
+                daily_forecast.weather_code
+            )
+            for hourly_forecast in daily_forecast.hours:
+                hourly_forecast.weather = self.weather_description(
+                    hourly_forecast.weather_code
+                )
+                hourly_forecast.wind_direction = self.wind_direction(
+                    hourly_forecast.wind_direction_id
+                )
+        return forecast
+
+
+@dataclass(slots=True)
+class WarningLookups:
+    """Names of the warning regions, types, groups and severities."""
+
+    language: str
+    regions: dict[str, dict[str, Any]]
+    warning_types: dict[int, dict[str, Any]]
+    warning_groups: dict[str, dict[str, Any]]
+    warning_severities: dict[int, dict[str, Any]]
+    # Regions warnings were issued for but missing from ``regions``.
+    unknown_regions: set[str] = field(default_factory=set)
+
+    def region_name(self, region_id: int | str) -> str:
+        """Return the name of region ``region_id`` (``118`` or ``r-118``)."""
+        region_id = str(region_id)
+        if not region_id.startswith("r-"):
+            region_id = "r-" + region_id
+        return self.regions.get(region_id, {}).get("name", "")
+
+    def localize_warning(
+        self, warning: Warning, region_id: str, alert: dict[str, Any]
+    ) -> Warning:
+        """Resolve the names of ``warning``, built from ``alert``."""
+        warning.region_name = self.region_name(region_id)
+        warning.severity = self.warning_severities.get(
+            int(alert["severity_id"]), {}
+        ).get("severity_name", "")
+        warning.warning_type = self.warning_types.get(
+            int(alert["warning_type_id"]), {}
+        ).get("name", "")
+        warning.groups = [
+            self.warning_groups.get("g-" + str(group_id), {}).get("name", "")
+            for group_id in alert["groups"]
+        ]
+        warning.regions = [self.region_name(rid) for rid in alert["regions"]]
+        return warning
+
+
+@singleton(DATA_LOOKUP_TASKS)
+def lookup_tasks(hass: HomeAssistant) -> dict[str, asyncio.Task[Any]]:
+    """Return the loads of the lookup tables, by table set and language."""
+    return {}
+
+
+def prime_weatheril_tables(lookups: LanguageLookups) -> None:
+    """Fill the ``weatheril`` tables its models read in ``__post_init__``.
+
+    ``weatheril`` downloads an empty table with blocking ``requests``. The
+    names it resolves are replaced by ``localize_*`` anyway, so the tables
+    of any language do, and tables already filled are kept.
+    """
+    if not weatheril_utils._locations_map:
+        weatheril_utils._locations_map = lookups.locations
+    if not weatheril_utils._weather_code_map:
+        weatheril_utils._weather_code_map = lookups.weather_codes
+    if not weatheril_utils._wind_direction_map:
+        # IMS may have served no wind directions; any entry stops a download.
+        weatheril_utils._wind_direction_map = lookups.wind_directions or {
+            UNKNOWN_WIND_DIRECTION: UNKNOWN_WIND_DIRECTION
+        }
+
+
+def prime_weatheril_warning_tables(lookups: WarningLookups) -> None:
+    """Fill the ``weatheril`` warning tables (see above)."""
+    if not weatheril_utils._regions_map:
+        weatheril_utils._regions_map = lookups.regions
+    if not weatheril_utils._warning_type_map:
+        weatheril_utils._warning_type_map = lookups.warning_types
+        weatheril_utils._warning_group_map = lookups.warning_groups
+        weatheril_utils._warning_severity_map = lookups.warning_severities
+
+
+def parse_locations(data: dict[str, Any]) -> dict[int, dict[str, Any]]:
+    """Build the location table from a ``locations_info`` payload."""
+    locations = {int(location["lid"]): location for location in data.values()}
+    if not locations:
+        raise ValueError("IMS returned no locations")
+    return locations
+
+
+def parse_weather_codes(data: dict[str, Any]) -> dict[int, str]:
+    """Build the weather description table from a ``weather_codes`` payload."""
+    weather_codes = {int(code["weather_code"]): code["desc"] for code in data.values()}
+    if not weather_codes:
+        raise ValueError("IMS returned no weather codes")
+    return weather_codes
+
+
+def parse_wind_directions(data: dict[str, Any]) -> dict[int, int]:
+    """Build the wind direction table from a ``wind_directions`` payload."""
+    wind_directions = {
+        int(direction_id): int(direction["direction"])
+        for direction_id, direction in data.items()
+    }
+    if not wind_directions:
+        raise ValueError("IMS returned no wind directions")
+    return wind_directions
+
+
+def parse_regions(payload: dict[str, Any]) -> dict[str, dict[str, Any]]:
+    """Build the region table from a ``regions`` payload."""
+    regions = {region["rid"]: region for region in payload.get("data") or []}
+    if not regions:
+        raise ValueError("IMS returned no warning regions")
+    return regions
+
+
+def fallback_locations(language: str) -> dict[int, dict[str, Any]]:
+    """Return the location table ``weatheril`` ships for ``language``."""
+    locations = HE_LOCATIONS if language == "he" else EN_LOCATIONS
+    return {int(location["lid"]): location for location in locations.values()}
+
+
+def fallback_weather_codes(language: str) -> dict[int, str]:
+    """Return the weather description table ``weatheril`` ships."""
+    return dict(HE_WEATHER_CODES if language == "he" else EN_WEATHER_CODES)
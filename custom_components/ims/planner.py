@@ -0,0 +1,55 @@
+"""Work out which IMS endpoints a config entry needs fetched."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from .const import (
+    ENDPOINT_CURRENT,
+    ENDPOINT_FORECAST,
+    ENDPOINT_WARNINGS,
+    FORECAST_SENSOR_KEYS,
+    IMS_PLATFORMS,
+    WARNING_SENSOR_KEYS,
+)
+
+# The current analysis is always fetched: it is the slice that decides
+# whether the coordinator's data is available at all.
+BASE_ENDPOINTS = frozenset({ENDPOINT_CURRENT})
+# The weather entity shows current conditions and the forecast.
+WEATHER_ENDPOINTS = frozenset({ENDPOINT_CURRENT, ENDPOINT_FORECAST})
+
+
+def endpoints_for_key(key: str) -> frozenset[str]:
+    """Return the endpoints the sensor or binary sensor ``key`` reads."""
+    if key in WARNING_SENSOR_KEYS:
+        return frozenset({ENDPOINT_WARNINGS})
+    if key in FORECAST_SENSOR_KEYS:
+        return frozenset({ENDPOINT_FORECAST})
+    return frozenset({ENDPOINT_CURRENT})
+
+
+def required_endpoints(
+    platforms: Iterable[str] | None, monitored_conditions: Iterable[str] | None
+) -> frozenset[str]:
+    """Return the endpoints the entities of a config entry consume.
+
+    ``platforms`` is the ``ims_platform`` selection of the entry; an empty
+    selection sets up the weather entity only (see
+    ``_platforms_from_selection``). ``monitored_conditions`` of ``None``
+    means every sensor is created, as the sensor platforms fall back to all
+    description keys. Radar imagery is never required here: no platform
+    reads ``WeatherData.images``, so it is only fetched for listeners that
+    register the radar endpoint in their context.
+    """
+    platforms = list(platforms or [IMS_PLATFORMS[1]])
+    endpoints = set(BASE_ENDPOINTS)
+    if IMS_PLATFORMS[1] in platforms or IMS_PLATFORMS[0] not in platforms:
+        endpoints |= WEATHER_ENDPOINTS
+    if IMS_PLATFORMS[0] in platforms:
+        if monitored_conditions is None:
+            endpoints |= {ENDPOINT_FORECAST, ENDPOINT_WARNINGS}
+        else:
+            for key in monitored_conditions:
+                endpoints |= endpoints_for_key(key)
+    return frozenset(endpoints)
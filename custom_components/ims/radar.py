@@ -0,0 +1,245 @@
+"""IMS radar/satellite imagery shared by every coordinator of the domain."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import os
+import time
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+from urllib.parse import urlparse
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from weatheril import RadarSatellite
+
+from .const import (
+    DEFAULT_LANGUAGE,
+    DOMAIN,
+    ENDPOINT_RADAR,
+    FRAME_TIMEOUT,
+    IMS_MAX_IN_FLIGHT,
+    RADAR_FRAME_CACHE_MAX_BYTES,
+    RADAR_FRAMES_DIRECTORY,
+    RADAR_UPDATE_INTERVAL,
+)
+from .ims_client import ImsClient
+
+if TYPE_CHECKING:
+    from .weather_update_coordinator import WeatherUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+# Frames downloaded at the same time by one cache. Kept below the
+# domain-wide in-flight cap so frames never hold every request slot and
+# the weather endpoints can still get through.
+MAX_PARALLEL_FRAME_DOWNLOADS = max(1, IMS_MAX_IN_FLIGHT // 2)
+
+
+class RadarService:
+    """Fetch the national radar/satellite index once for all coordinators.
+
+    The index and its frames do not depend on the city or the language, so
+    a single service in ``hass.data[DOMAIN]`` serves every
+    ``WeatherUpdateCoordinator``. ``async_get_images`` returns the cached
+    index while it is younger than ``RADAR_UPDATE_INTERVAL`` and joins a
+    fetch already in flight rather than starting another one.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the service."""
+        self._hass = hass
+        self._client = ImsClient(hass, DEFAULT_LANGUAGE)
+        self._images: RadarSatellite | None = None
+        self._fetched_at = 0.0
+        self._pending: asyncio.Task[RadarSatellite] | None = None
+        self._frame_caches: dict[str, RadarFrameCache] = {}
+
+    async def async_get_images(self, timeout: float | None = None) -> RadarSatellite:
+        """Return the current radar/satellite index.
+
+        ``timeout`` bounds the request of a fetch this call starts.
+        """
+        age = time.monotonic() - self._fetched_at
+        if self._images is not None and age < RADAR_UPDATE_INTERVAL.total_seconds():
+            return self._images
+        # An eagerly started fetch may finish before it is even stored here.
+        if self._pending is None or self._pending.done():
+            self._pending = self._hass.async_create_task(
+                self._async_fetch_images(timeout), "IMS radar/satellite index"
+            )
+        # A caller being cancelled must not cancel the fetch the others await.
+        return await asyncio.shield(self._pending)
+
+    async def _async_fetch_images(self, timeout: float | None) -> RadarSatellite:
+        """Fetch the index and cache it for the other coordinators."""
+        try:
+            images = await self._client.async_get_radar_images(timeout)
+        finally:
+            self._pending = None
+        self._images = images
+        self._fetched_at = time.monotonic()
+        return images
+
+    async def async_cache_frames(
+        self, images: RadarSatellite, images_path: str
+    ) -> dict[str, str]:
+        """Store the frames of ``images`` under ``images_path``.
+
+        Returns the local file of every frame URL that could be cached.
+        """
+        directory = os.path.join(images_path, RADAR_FRAMES_DIRECTORY)
+        if (cache := self._frame_caches.get(directory)) is None:
+            cache = self._frame_caches[directory] = RadarFrameCache(
+                self._hass, self._client, directory
+            )
+        return await cache.async_get_paths(radar_frame_urls(images))
+
+    @callback
+    def async_track_frames(
+        self, coordinator: WeatherUpdateCoordinator, images_path: str
+    ) -> CALLBACK_TYPE:
+        """Cache the frames of every index ``coordinator`` fetches.
+
+        The listener is registered with the ``ENDPOINT_RADAR`` context, so
+        the coordinator fetches the index for as long as it is tracked.
+        Frames go through the shared rate limit and download in the
+        background. Returns the function that stops tracking.
+        """
+
+        @callback
+        def _async_cache_frames() -> None:
+            if coordinator.data is None or (images := coordinator.data.images) is None:
+                return
+            self._hass.async_create_background_task(
+                self.async_cache_frames(images, images_path),
+                f"{DOMAIN} {coordinator.city} radar frames",
+            )
+
+        # A restored snapshot may already hold an index.
+        _async_cache_frames()
+        return coordinator.async_add_listener(
+            _async_cache_frames, context=frozenset({ENDPOINT_RADAR})
+        )
+
+
+class RadarFrameCache:
+    """Content-addressed store of radar/satellite frames in one directory.
+
+    Frames are saved as ``<sha256 of the content><extension>``, so a frame
+    listed under several URLs is stored once and a rewritten frame never
+    overwrites one still in use. When the directory grows beyond
+    ``max_bytes`` the least recently written frames not in the current
+    index are evicted. All file I/O runs in the executor.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        client: ImsClient,
+        directory: str,
+        max_bytes: int = RADAR_FRAME_CACHE_MAX_BYTES,
+    ) -> None:
+        """Initialize the cache."""
+        self._hass = hass
+        self._client = client
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._paths: dict[str, str] = {}
+        self._lock = asyncio.Lock()
+        self._download_slots = asyncio.Semaphore(MAX_PARALLEL_FRAME_DOWNLOADS)
+
+    async def async_get_paths(self, urls: Iterable[str]) -> dict[str, str]:
+        """Return the local file of each of ``urls``, downloading new ones."""
+        urls = list(dict.fromkeys(urls))
+        async with self._lock:
+            missing = [url for url in urls if url not in self._paths]
+            contents = await asyncio.gather(
+                *(self._async_download(url) for url in missing),
+                return_exceptions=True,
+            )
+            new_files: dict[str, bytes] = {}
+            for url, content in zip(missing, contents, strict=True):
+                if isinstance(content, BaseException):
+                    _LOGGER.debug("Failed to download IMS frame %s: %s", url, content)
+                    continue
+                path = os.path.join(self.directory, frame_file_name(url, content))
+                self._paths[url] = path
+                new_files[path] = content
+
+            if new_files:
+                in_use = {self._paths[url] for url in urls if url in self._paths}
+                try:
+                    evicted = await self._hass.async_add_executor_job(
+                        self._write_and_evict, new_files, in_use
+                    )
+                except OSError as error:
+                    _LOGGER.warning(
+                        "Failed to cache IMS frames in %s: %s", self.directory, error
+                    )
+                    evicted = set(new_files)
+                self._paths = {
+                    url: path
+                    for url, path in self._paths.items()
+                    if path not in evicted
+                }
+            return {url: self._paths[url] for url in urls if url in self._paths}
+
+    async def _async_download(self, url: str) -> bytes:
+        """Download one frame."""
+        async with self._download_slots:
+            return await self._client.async_get_bytes(
+                url, timeout=FRAME_TIMEOUT.total_seconds()
+            )
+
+    def _write_and_evict(
+        self, new_files: dict[str, bytes], in_use: set[str]
+    ) -> set[str]:
+        """Write ``new_files`` and evict old frames; return the evicted paths."""
+        os.makedirs(self.directory, exist_ok=True)
+        for path, content in new_files.items():
+            if os.path.exists(path):
+                continue
+            temp_path = f"{path}.tmp"
+            with open(temp_path, "wb") as file:
+                file.write(content)
+            os.replace(temp_path, path)
+
+        with os.scandir(self.directory) as entries:
+            frames = [
+                (entry.stat().st_mtime, entry.stat().st_size, entry.path)
+                for entry in entries
+                if entry.is_file() and not entry.name.endswith(".tmp")
+            ]
+        total = sum(size for _, size, _ in frames)
+        evicted: set[str] = set()
+        for _, size, path in sorted(frames):
+            if total <= self.max_bytes:
+                break
+            if path in in_use:
+                continue
+            try:
+                os.remove(path)
+            except OSError as error:
+                _LOGGER.debug("Failed to evict IMS frame %s: %s", path, error)
+                continue
+            total -= size
+            evicted.add(path)
+        return evicted
+
+
+def frame_file_name(url: str, content: bytes) -> str:
+    """Return the content-addressed file name of a frame."""
+    extension = os.path.splitext(urlparse(url).path)[1].lower()
+    return hashlib.sha256(content).hexdigest() + extension
+
+
+def radar_frame_urls(images: RadarSatellite) -> list[str]:
+    """Return the frame URLs of every image type in ``images``."""
+    return [
+        *images.imsradar_images,
+        *images.radar_images,
+        *images.middle_east_satellite_images,
+        *images.europe_satellite_images,
+    ]
@@ -0,0 +1,116 @@
+"""Domain-wide limit on the requests made to ims.gov.il."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.singleton import singleton
+
+from .const import (
+    IMS_MAX_IN_FLIGHT,
+    IMS_REQUEST_BURST,
+    IMS_REQUESTS_PER_SECOND,
+)
+
+DATA_REQUEST_LIMITER = "ims_request_limiter"
+
+
+class RequestLimiter:
+    """Token bucket and in-flight cap shared by every ``ImsClient``.
+
+    A request first takes one of ``max_in_flight`` slots, then a token from
+    a bucket holding up to ``burst`` tokens and refilled at ``rate`` per
+    second. When IMS answers with a throttling status the bucket is paused
+    for the ``Retry-After`` it asked for.
+    """
+
+    def __init__(
+        self,
+        rate: float = IMS_REQUESTS_PER_SECOND,
+        burst: int = IMS_REQUEST_BURST,
+        max_in_flight: int = IMS_MAX_IN_FLIGHT,
+    ) -> None:
+        """Initialize the limiter."""
+        self.rate = rate
+        self.burst = burst
+        self.max_in_flight = max_in_flight
+        self._slots = asyncio.Semaphore(max_in_flight)
+        self._tokens = float(burst)
+        self._refilled_at = time.monotonic()
+        self._paused_until = 0.0
+        self.in_flight = 0
+        self.requests = 0
+        self.delayed_requests = 0
+        self.total_delay = 0.0
+        self.throttled_responses = 0
+
+    @asynccontextmanager
+    async def async_request(self) -> AsyncIterator[None]:
+        """Hold a request slot and token while the request is made."""
+        async with self._slots:
+            await self._async_take_token()
+            self.in_flight += 1
+            self.requests += 1
+            try:
+                yield
+            finally:
+                self.in_flight -= 1
+
+    async def _async_take_token(self) -> None:
+        """Wait until a token is available and take it."""
+        start = time.monotonic()
+        waited = False
+        while True:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._refilled_at) * self.rate
+            )
+            self._refilled_at = now
+            if now >= self._paused_until and self._tokens >= 1:
+                self._tokens -= 1
+                break
+            wait = max(self._paused_until - now, (1 - self._tokens) / self.rate)
+            await asyncio.sleep(wait)
+            waited = True
+        if waited:
+            self.delayed_requests += 1
+            self.total_delay += time.monotonic() - start
+
+    @callback
+    def async_throttled(self, retry_after: float | None) -> None:
+        """Record a throttling answer and hold back requests as asked."""
+        self.throttled_responses += 1
+        pause = retry_after if retry_after is not None else 1 / self.rate
+        self._paused_until = max(self._paused_until, time.monotonic() + pause)
+        self._tokens = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the limiter state for diagnostics."""
+        now = time.monotonic()
+        return {
+            "rate_per_second": self.rate,
+            "burst": self.burst,
+            "max_in_flight": self.max_in_flight,
+            "in_flight": self.in_flight,
+            "tokens": round(
+                min(self.burst, self._tokens + (now - self._refilled_at) * self.rate),
+                2,
+            ),
+            "paused_for": round(max(self._paused_until - now, 0), 2),
+            "requests": self.requests,
+            "delayed_requests": self.delayed_requests,
+            "total_delay": round(self.total_delay, 3),
+            "throttled_responses": self.throttled_responses,
+        }
+
+
+@callback
+@singleton(DATA_REQUEST_LIMITER)
+def async_get_request_limiter(hass: HomeAssistant) -> RequestLimiter:
+    """Return the request limiter shared by the whole integration."""
+    return RequestLimiter()
@@ -0,0 +1,150 @@
+"""Registry of the coordinators shared by IMS config entries."""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from homeassistant.core import HomeAssistant
+
+from .analysis_feed import CurrentAnalysisFeed
+from .radar import RadarService
+from .warnings_feed import WarningsFeed
+from .weather_update_coordinator import WeatherUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+# Successive multiples of the golden ratio (mod 1) are evenly spread over
+# [0, 1) however many cities there are.
+_GOLDEN_RATIO_FRACTION = 0.6180339887498949
+
+
+def city_stagger(city: int | str) -> float:
+    """Return the stagger of the coordinators of ``city``, in [0, 1).
+
+    It depends on the city alone, so the coordinators of its languages
+    fetch together and keep sharing its current analysis.
+    """
+    return (int(city) * _GOLDEN_RATIO_FRACTION) % 1
+
+
+@dataclass
+class _Registration:
+    """A shared coordinator and the endpoints each entry using it needs."""
+
+    coordinator: WeatherUpdateCoordinator
+    demand: dict[str, frozenset[str]] = field(default_factory=dict)
+
+
+class CoordinatorRegistry:
+    """Hand out one ``WeatherUpdateCoordinator`` per IMS location.
+
+    Config entries for the same location and language share a coordinator.
+    Every entry acquires it with the endpoints it needs and releases it when
+    unloaded; the coordinator fetches the union of the demand of the entries
+    holding it, and is shut down once the last one lets go. The domain-wide
+    ``RadarService``, the per-language ``WarningsFeed`` and the per-city
+    ``CurrentAnalysisFeed`` live here too.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the registry."""
+        self._hass = hass
+        self._registrations: dict[str, _Registration] = {}
+        self._entry_locations: dict[str, str] = {}
+        self._warnings_feeds: dict[str, WarningsFeed] = {}
+        self._analysis_feeds: dict[str, CurrentAnalysisFeed] = {}
+        self._radar_service: RadarService | None = None
+
+    @property
+    def radar_service(self) -> RadarService:
+        """Return the radar/satellite service of the domain."""
+        if self._radar_service is None:
+            self._radar_service = RadarService(self._hass)
+        return self._radar_service
+
+    def warnings_feed(self, language: str) -> WarningsFeed:
+        """Return the warnings feed of ``language``."""
+        if (feed := self._warnings_feeds.get(language)) is None:
+            feed = self._warnings_feeds[language] = WarningsFeed(self._hass, language)
+        return feed
+
+    def analysis_feed(self, city: int | str) -> CurrentAnalysisFeed:
+        """Return the current analysis feed of ``city``."""
+        if (feed := self._analysis_feeds.get(str(city))) is None:
+            feed = self._analysis_feeds[str(city)] = CurrentAnalysisFeed(
+                self._hass, city
+            )
+        return feed
+
+    def is_empty(self) -> bool:
+        """Return True when no entry holds a coordinator."""
+        return not self._registrations
+
+    def acquire(
+        self,
+        entry_id: str,
+        location_key: str,
+        demand: frozenset[str],
+        create: Callable[[], WeatherUpdateCoordinator],
+    ) -> tuple[WeatherUpdateCoordinator, bool]:
+        """Hold the coordinator of ``location_key`` for ``entry_id``.
+
+        ``create`` builds the coordinator when no entry holds one yet.
+        Returns the coordinator and whether it was just created.
+        """
+        created = False
+        if (registration := self._registrations.get(location_key)) is None:
+            registration = self._registrations[location_key] = _Registration(create())
+            created = True
+            registration.coordinator.stagger = city_stagger(
+                registration.coordinator.city
+            )
+        else:
+            _LOGGER.info(
+                "Sharing the IMS weather coordinator of %s with another entry",
+                location_key,
+            )
+        registration.demand[entry_id] = demand
+        self._entry_locations[entry_id] = location_key
+        self._update_demand(registration)
+        return registration.coordinator, created
+
+    def release(self, entry_id: str) -> WeatherUpdateCoordinator | None:
+        """Let go of the coordinator held by ``entry_id``.
+
+        Returns the coordinator when this was its last holder; the caller
+        must then shut it down.
+        """
+        if (location_key := self._entry_locations.pop(entry_id, None)) is None:
+            return None
+        registration = self._registrations[location_key]
+        registration.demand.pop(entry_id, None)
+        if registration.demand:
+            self._update_demand(registration)
+            return None
+        del self._registrations[location_key]
+        _LOGGER.debug("Freeing the IMS weather coordinator of %s", location_key)
+        city = str(registration.coordinator.city)
+        if all(
+            str(other.coordinator.city) != city
+            for other in self._registrations.values()
+        ):
+            self._analysis_feeds.pop(city, None)
+        if not self._registrations:
+            self._warnings_feeds.clear()
+            self._radar_service = None
+        return registration.coordinator
+
+    async def async_release(self, entry_id: str) -> None:
+        """Release ``entry_id`` and stop its coordinator if nobody else uses it."""
+        if (coordinator := self.release(entry_id)) is not None:
+            await coordinator.async_shutdown()
+
+    @staticmethod
+    def _update_demand(registration: _Registration) -> None:
+        """Make the coordinator fetch what any of its entries needs."""
+        registration.coordinator.required_endpoints = frozenset().union(
+            *registration.demand.values()
+        )
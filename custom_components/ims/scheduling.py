@@ -0,0 +1,112 @@
+"""Scheduling helpers for the IMS weather coordinator."""
+
+from __future__ import annotations
+
+import datetime
+import logging
+import statistics
+from collections import deque
+
+_LOGGER = logging.getLogger(__name__)
+
+# Gaps between analyses outside this range are treated as outages or
+# corrections and are not used to learn the publication period.
+MIN_PUBLICATION_PERIOD = datetime.timedelta(minutes=5)
+MAX_PUBLICATION_PERIOD = datetime.timedelta(hours=6)
+# How long after ``forecast_time`` an analysis is assumed to be published
+# until an actual lag has been observed, and the margin added to that lag.
+DEFAULT_PUBLICATION_LAG = datetime.timedelta(minutes=5)
+PUBLICATION_MARGIN = datetime.timedelta(minutes=1)
+# Retries when an expected analysis is late.
+PUBLICATION_RETRY_INTERVAL = datetime.timedelta(minutes=2)
+PUBLICATION_MAX_RETRIES = 3
+PUBLICATION_HISTORY = 8
+
+
+class PublicationSchedule:
+    """Learn the IMS analysis cadence and time fetches just after publication.
+
+    Every fetch of the current analysis reports the ``forecast_time`` it
+    returned through ``observe``. The gaps between successive analyses give
+    the publication period, and how long after ``forecast_time`` a new
+    analysis was first seen gives the publication lag. The next fetch is
+    then placed just after an expected publication:
+
+    * the latest one within ``interval`` from now, so data is fetched as
+      fresh as possible without polling more often than configured, or
+    * the next one when it is further away than ``interval``, since polling
+      before it cannot return anything new.
+
+    When an expected analysis is not there yet, it is retried every
+    ``PUBLICATION_RETRY_INTERVAL`` up to ``PUBLICATION_MAX_RETRIES`` times
+    before waiting for the publication after it. Until a period has been
+    learned, fetches simply follow ``interval``.
+    """
+
+    def __init__(self, interval: datetime.timedelta) -> None:
+        """Initialize the schedule."""
+        self.interval = interval
+        self._last_forecast_time: datetime.datetime | None = None
+        self._gaps: deque[datetime.timedelta] = deque(maxlen=PUBLICATION_HISTORY)
+        self._lags: deque[datetime.timedelta] = deque(maxlen=PUBLICATION_HISTORY)
+        self._retries = 0
+
+    @property
+    def period(self) -> datetime.timedelta | None:
+        """Return the learned publication period, if any."""
+        if not self._gaps:
+            return None
+        return statistics.median(self._gaps)
+
+    @property
+    def lag(self) -> datetime.timedelta:
+        """Return how long after ``forecast_time`` an analysis appears."""
+        return min(self._lags, default=DEFAULT_PUBLICATION_LAG) + PUBLICATION_MARGIN
+
+    def observe(
+        self, forecast_time: datetime.datetime | None, now: datetime.datetime
+    ) -> datetime.datetime:
+        """Record the analysis fetched at ``now`` and return the next fetch time."""
+        last = self._last_forecast_time
+        if forecast_time is None:
+            return now + self.interval
+
+        if last is None or forecast_time > last:
+            if last is not None:
+                gap = forecast_time - last
+                if MIN_PUBLICATION_PERIOD <= gap <= MAX_PUBLICATION_PERIOD:
+                    self._gaps.append(gap)
+            if now >= forecast_time:
+                self._lags.append(now - forecast_time)
+            self._last_forecast_time = forecast_time
+            self._retries = 0
+        elif (period := self.period) is not None and now >= last + period + self.lag:
+            if self._retries < PUBLICATION_MAX_RETRIES:
+                self._retries += 1
+                _LOGGER.debug(
+                    "IMS analysis after %s is late, retry %d of %d",
+                    last,
+                    self._retries,
+                    PUBLICATION_MAX_RETRIES,
+                )
+                return now + PUBLICATION_RETRY_INTERVAL
+            # Give up on this one and wait for the publication after it.
+            self._retries = 0
+
+        return self._next_publication(now)
+
+    def _next_publication(self, now: datetime.datetime) -> datetime.datetime:
+        """Return the fetch time aligned to an expected publication."""
+        period = self.period
+        last = self._last_forecast_time
+        if period is None or last is None:
+            return now + self.interval
+
+        lag = self.lag
+        # First expected publication (plus lag) that is still ahead of us.
+        periods_ahead = (now - last - lag) // period + 1
+        first = last + max(periods_ahead, 1) * period + lag
+        horizon = now + self.interval
+        if first > horizon:
+            return first
+        return first + ((horizon - first) // period) * period
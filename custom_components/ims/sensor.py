@@ -1,6 +1,6 @@
 from typing import Any
 import logging
-import types
+from functools import partial
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -20,10 +20,13 @@ from homeassistant.const import (
 )
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from weatheril.forecast import Daily
 
 from . import ImsEntity, ImsSensorEntityDescription
-from .weather_update_coordinator import WeatherData
+from .weather_update_coordinator import WeatherData, WeatherUpdateCoordinator
 from .const import (
+    CONF_FORECAST_ATTRIBUTES,
+    FORECAST_ATTRIBUTES_COMPACT,
     DOMAIN,
     ENTRY_WEATHER_COORDINATOR,
     FIELD_NAME_DEW_POINT_TEMP,
@@ -80,54 +83,56 @@ from .const import (
     TYPE_WEATHER_WARNINGS,
     DATETIME_FORMAT,
 )
-from .utils import get_hourly_weather_icon
-
-sensor_keys = types.SimpleNamespace()
-sensor_keys.TYPE_CURRENT_UV_INDEX = IMS_SENSOR_KEY_PREFIX + TYPE_CURRENT_UV_INDEX
-sensor_keys.TYPE_CURRENT_UV_LEVEL = IMS_SENSOR_KEY_PREFIX + TYPE_CURRENT_UV_LEVEL
-sensor_keys.TYPE_DEW_POINT_TEMP = IMS_SENSOR_KEY_PREFIX + TYPE_DEW_POINT_TEMP
-sensor_keys.TYPE_MAX_UV_INDEX = IMS_SENSOR_KEY_PREFIX + TYPE_MAX_UV_INDEX
-sensor_keys.TYPE_GUST_SPEED = IMS_SENSOR_KEY_PREFIX + TYPE_GUST_SPEED
-sensor_keys.TYPE_CITY = IMS_SENSOR_KEY_PREFIX + TYPE_CITY
-sensor_keys.TYPE_TEMPERATURE = IMS_SENSOR_KEY_PREFIX + TYPE_TEMPERATURE
-sensor_keys.TYPE_HUMIDITY = IMS_SENSOR_KEY_PREFIX + TYPE_HUMIDITY
-sensor_keys.TYPE_FORECAST_TIME = IMS_SENSOR_KEY_PREFIX + TYPE_FORECAST_TIME
-sensor_keys.TYPE_FEELS_LIKE = IMS_SENSOR_KEY_PREFIX + TYPE_FEELS_LIKE
-sensor_keys.TYPE_PM10 = IMS_SENSOR_KEY_PREFIX + TYPE_PM10
-sensor_keys.TYPE_PRECIPITATION = IMS_SENSOR_KEY_PREFIX + TYPE_PRECIPITATION
-sensor_keys.TYPE_PRECIPITATION_PROBABILITY = (
-    IMS_SENSOR_KEY_PREFIX + TYPE_PRECIPITATION_PROBABILITY
-)
-sensor_keys.TYPE_WIND_DIRECTION = IMS_SENSOR_KEY_PREFIX + TYPE_WIND_DIRECTION
-sensor_keys.TYPE_WEATHER_WARNINGS = IMS_SENSOR_KEY_PREFIX + TYPE_WEATHER_WARNINGS
-sensor_keys.TYPE_WIND_SPEED = IMS_SENSOR_KEY_PREFIX + TYPE_WIND_SPEED
-sensor_keys.TYPE_FORECAST_TODAY = (
-    IMS_SENSOR_KEY_PREFIX + TYPE_FORECAST_PREFIX + TYPE_FORECAST_TODAY
-)
-sensor_keys.TYPE_FORECAST_DAY1 = (
-    IMS_SENSOR_KEY_PREFIX + TYPE_FORECAST_PREFIX + TYPE_FORECAST_DAY1
-)
-sensor_keys.TYPE_FORECAST_DAY2 = (
-    IMS_SENSOR_KEY_PREFIX + TYPE_FORECAST_PREFIX + TYPE_FORECAST_DAY2
-)
-sensor_keys.TYPE_FORECAST_DAY3 = (
-    IMS_SENSOR_KEY_PREFIX + TYPE_FORECAST_PREFIX + TYPE_FORECAST_DAY3
-)
-sensor_keys.TYPE_FORECAST_DAY4 = (
-    IMS_SENSOR_KEY_PREFIX + TYPE_FORECAST_PREFIX + TYPE_FORECAST_DAY4
-)
-sensor_keys.TYPE_FORECAST_DAY5 = (
-    IMS_SENSOR_KEY_PREFIX + TYPE_FORECAST_PREFIX + TYPE_FORECAST_DAY5
-)
-sensor_keys.TYPE_FORECAST_DAY6 = (
-    IMS_SENSOR_KEY_PREFIX + TYPE_FORECAST_PREFIX + TYPE_FORECAST_DAY6
-)
-sensor_keys.TYPE_FORECAST_DAY7 = (
-    IMS_SENSOR_KEY_PREFIX + TYPE_FORECAST_PREFIX + TYPE_FORECAST_DAY7
-)
 
 _LOGGER = logging.getLogger(__name__)
 
+UV_LEVELS = {
+    "E": UV_LEVEL_EXTREME,
+    "V": UV_LEVEL_VHIGH,
+    "H": UV_LEVEL_HIGH,
+    "M": UV_LEVEL_MODERATE,
+}
+
+
+def forecast_day(day_index: int, data: WeatherData) -> Daily | None:
+    """Return day ``day_index`` of the forecast (0 is today), if there is one."""
+    if (view := data.forecast_view) is None:
+        return None
+    return view.day(day_index)
+
+
+def forecast_day_value(day_index: int, data: WeatherData) -> str | None:
+    """Return the name of day ``day_index`` of the forecast."""
+    daily_forecast = forecast_day(day_index, data)
+    return daily_forecast.day if daily_forecast is not None else None
+
+
+def forecast_day_attributes(day_index: int, data: WeatherData) -> dict[str, Any]:
+    """Return the attributes of day ``day_index`` of the forecast."""
+    if (view := data.forecast_view) is None:
+        return {}
+    return view.day_attributes(day_index)
+
+
+def forecast_day_compact_attributes(
+    day_index: int, data: WeatherData
+) -> dict[str, Any]:
+    """Return the attributes of day ``day_index`` in the compact layout."""
+    if (view := data.forecast_view) is None:
+        return {}
+    return view.compact_day_attributes(day_index)
+
+
+def forecast_day_icon(day_index: int, data: WeatherData) -> str | None:
+    """Return the icon of the weather of day ``day_index`` of the forecast."""
+    daily_forecast = forecast_day(day_index, data)
+    if daily_forecast is None:
+        return None
+    return WEATHER_CODE_TO_ICON.get(
+        str(daily_forecast.weather_code), "mdi:weather-sunny"
+    )
+
+
 SENSOR_DESCRIPTIONS: list[ImsSensorEntityDescription] = [
     ImsSensorEntityDescription(
         key=IMS_SENSOR_KEY_PREFIX + TYPE_CURRENT_UV_INDEX,
@@ -137,6 +142,7 @@ SENSOR_DESCRIPTIONS: list[ImsSensorEntityDescription] = [
         state_class=SensorStateClass.MEASUREMENT,
         forecast_mode=FORECAST_MODE.CURRENT,
         field_name=FIELD_NAME_UV_INDEX,
+        value_fn=lambda data: data.current_weather.u_v_index,
     ),
     ImsSensorEntityDescription(
         key=IMS_SENSOR_KEY_PREFIX + TYPE_CURRENT_UV_LEVEL,
@@ -144,6 +150,9 @@ SENSOR_DESCRIPTIONS: list[ImsSensorEntityDescription] = [
         icon="mdi:weather-sunny",
         forecast_mode=FORECAST_MODE.CURRENT,
         field_name=FIELD_NAME_UV_LEVEL,
+        value_fn=lambda data: UV_LEVELS.get(
+            data.current_weather.u_v_level, UV_LEVEL_LOW
+        ),
     ),
     ImsSensorEntityDescription(
         key=IMS_SENSOR_KEY_PREFIX + TYPE_MAX_UV_INDEX,
@@ -153,6 +162,7 @@ SENSOR_DESCRIPTIONS: list[ImsSensorEntityDescription] = [
         state_class=SensorStateClass.MEASUREMENT,
         forecast_mode=FORECAST_MODE.CURRENT,
         field_name=FIELD_NAME_UV_INDEX_MAX,
+        value_fn=lambda data: data.current_weather.u_v_i_max,
     ),
     ImsSensorEntityDescription(
         key=IMS_SENSOR_KEY_PREFIX + TYPE_CITY,
@@ -160,6 +170,7 @@ SENSOR_DESCRIPTIONS: list[ImsSensorEntityDescription] = [
         icon="mdi:city",
         forecast_mode=FORECAST_MODE.CURRENT,
         field_name=FIELD_NAME_LOCATION,
+        value_fn=lambda data: data.current_weather.location,
     ),
     ImsSensorEntityDescription(
         key=IMS_SENSOR_KEY_PREFIX + TYPE_TEMPERATURE,
@@ -170,6 +181,7 @@ SENSOR_DESCRIPTIONS: list[ImsSensorEntityDescription] = [
         state_class=SensorStateClass.MEASUREMENT,
         forecast_mode=FORECAST_MODE.CURRENT,
         field_name=FIELD_NAME_TEMPERATURE,
+        value_fn=lambda data: data.current_weather.temperature,
     ),
     ImsSensorEntityDescription(
         key=IMS_SENSOR_KEY_PREFIX + TYPE_FEELS_LIKE,
@@ -180,6 +192,7 @@ SENSOR_DESCRIPTIONS: list[ImsSensorEntityDescription] = [
         state_class=SensorStateClass.MEASUREMENT,
         forecast_mode=FORECAST_MODE.CURRENT,
         field_name=FIELD_NAME_FEELS_LIKE,
+        value_fn=lambda data: data.current_weather.feels_like,
     ),
     ImsSensorEntityDescription(
         key=IMS_SENSOR_KEY_PREFIX + TYPE_HUMIDITY,
@@ -189,6 +202,7 @@ SENSOR_DESCRIPTIONS: list[ImsSensorEntityDescription] = [
         state_class=SensorStateClass.MEASUREMENT,
         forecast_mode=FORECAST_MODE.CURRENT,
         field_name=FIELD_NAME_HUMIDITY,
+        value_fn=lambda data: data.current_weather.humidity,
     ),
     ImsSensorEntityDescription(
         key=IMS_SENSOR_KEY_PREFIX + TYPE_WIND_DIRECTION,
@@ -198,6 +212,9 @@ SENSOR_DESCRIPTIONS: list[ImsSensorEntityDescription] = [
         state_class=SensorStateClass.MEASUREMENT,
         forecast_mode=FORECAST_MODE.CURRENT,
         field_name=FIELD_NAME_WIND_DIRECTION_ID,
+        value_fn=lambda data: WIND_DIRECTIONS[
+            int(data.current_weather.wind_direction_id)
+        ],
     ),
     ImsSensorEntityDescription(
         key=IMS_SENSOR_KEY_PREFIX + TYPE_WIND_SPEED,
@@ -208,6 +225,7 @@ SENSOR_DESCRIPTIONS: list[ImsSensorEntityDescription] = [
         state_class=SensorStateClass.MEASUREMENT,
         forecast_mode=FORECAST_MODE.CURRENT,
         field_name=FIELD_NAME_WIND_SPEED,
+        value_fn=lambda data: data.current_weather.wind_speed,
     ),
     ImsSensorEntityDescription(
         key=IMS_SENSOR_KEY_PREFIX + TYPE_GUST_SPEED,
@@ -218,6 +236,7 @@ SENSOR_DESCRIPTIONS: list[ImsSensorEntityDescription] = [
         state_class=SensorStateClass.MEASUREMENT,
         forecast_mode=FORECAST_MODE.CURRENT,
         field_name=FIELD_NAME_GUST_SPEED,
+        value_fn=lambda data: data.current_weather.gust_speed,
     ),
     ImsSensorEntityDescription(
         key=IMS_SENSOR_KEY_PREFIX + TYPE_FORECAST_TIME,
@@ -226,6 +245,7 @@ SENSOR_DESCRIPTIONS: list[ImsSensorEntityDescription] = [
         device_class=SensorDeviceClass.TIMESTAMP,
         forecast_mode=FORECAST_MODE.CURRENT,
         field_name=FIELD_NAME_FORECAST_TIME,
+        value_fn=lambda data: data.current_weather.forecast_time.astimezone(),
     ),
     ImsSensorEntityDescription(
         key=IMS_SENSOR_KEY_PREFIX + TYPE_PRECIPITATION,
@@ -236,6 +256,11 @@ SENSOR_DESCRIPTIONS: list[ImsSensorEntityDescription] = [
         state_class=SensorStateClass.MEASUREMENT,
         forecast_mode=FORECAST_MODE.CURRENT,
         field_name=FIELD_NAME_RAIN,
+        value_fn=lambda data: (
+            data.current_weather.rain
+            if (data.current_weather.rain and data.current_weather.rain > 0.0)
+            else 0.0
+        ),
     ),
     ImsSensorEntityDescription(
         key=IMS_SENSOR_KEY_PREFIX + TYPE_PRECIPITATION_PROBABILITY,
@@ -245,6 +270,7 @@ SENSOR_DESCRIPTIONS: list[ImsSensorEntityDescription] = [
         state_class=SensorStateClass.MEASUREMENT,
         forecast_mode=FORECAST_MODE.CURRENT,
         field_name=FIELD_NAME_RAIN_CHANCE,
+        value_fn=lambda data: data.current_weather.rain_chance,
     ),
     ImsSensorEntityDescription(
         key=IMS_SENSOR_KEY_PREFIX + TYPE_PM10,
@@ -255,6 +281,7 @@ SENSOR_DESCRIPTIONS: list[ImsSensorEntityDescription] = [
         state_class=SensorStateClass.MEASUREMENT,
         forecast_mode=FORECAST_MODE.CURRENT,
         field_name=FIELD_NAME_PM10,
+        value_fn=lambda data: data.current_weather.pm10,
     ),
     ImsSensorEntityDescription(
         key=IMS_SENSOR_KEY_PREFIX + TYPE_DEW_POINT_TEMP,
@@ -265,6 +292,7 @@ SENSOR_DESCRIPTIONS: list[ImsSensorEntityDescription] = [
         state_class=SensorStateClass.MEASUREMENT,
         forecast_mode=FORECAST_MODE.CURRENT,
         field_name=FIELD_NAME_DEW_POINT_TEMP,
+        value_fn=lambda data: data.current_weather.due_point_temp,
     ),
     ImsSensorEntityDescription(
         key=IMS_SENSOR_KEY_PREFIX + TYPE_WEATHER_WARNINGS,
@@ -272,46 +300,82 @@ SENSOR_DESCRIPTIONS: list[ImsSensorEntityDescription] = [
         icon="mdi:weather-cloudy-alert",
         forecast_mode=FORECAST_MODE.CURRENT,
         field_name=FIELD_NAME_WARNING,
+        value_fn=lambda data: len(data.warnings),
+        attributes_fn=lambda data: generate_warnings_extra_state_attributes(
+            data.warnings
+        ),
     ),
     ImsSensorEntityDescription(
         key=IMS_SENSOR_KEY_PREFIX + TYPE_FORECAST_PREFIX + TYPE_FORECAST_TODAY,
         name="IMS Forecast Today",
         icon="mdi:weather-sunny",
+        value_fn=partial(forecast_day_value, 0),
+        attributes_fn=partial(forecast_day_attributes, 0),
+        compact_attributes_fn=partial(forecast_day_compact_attributes, 0),
+        icon_fn=partial(forecast_day_icon, 0),
     ),
     ImsSensorEntityDescription(
         key=IMS_SENSOR_KEY_PREFIX + TYPE_FORECAST_PREFIX + TYPE_FORECAST_DAY1,
         name="IMS Forecast Day1",
         icon="mdi:weather-sunny",
+        value_fn=partial(forecast_day_value, 1),
+        attributes_fn=partial(forecast_day_attributes, 1),
+        compact_attributes_fn=partial(forecast_day_compact_attributes, 1),
+        icon_fn=partial(forecast_day_icon, 1),
     ),
     ImsSensorEntityDescription(
         key=IMS_SENSOR_KEY_PREFIX + TYPE_FORECAST_PREFIX + TYPE_FORECAST_DAY2,
         name="IMS Forecast Day2",
         icon="mdi:weather-windy",
+        value_fn=partial(forecast_day_value, 2),
+        attributes_fn=partial(forecast_day_attributes, 2),
+        compact_attributes_fn=partial(forecast_day_compact_attributes, 2),
+        icon_fn=partial(forecast_day_icon, 2),
     ),
     ImsSensorEntityDescription(
         key=IMS_SENSOR_KEY_PREFIX + TYPE_FORECAST_PREFIX + TYPE_FORECAST_DAY3,
         name="IMS Forecast Day3",
         icon="mdi:weather-sunny",
+        value_fn=partial(forecast_day_value, 3),
+        attributes_fn=partial(forecast_day_attributes, 3),
+        compact_attributes_fn=partial(forecast_day_compact_attributes, 3),
+        icon_fn=partial(forecast_day_icon, 3),
     ),
     ImsSensorEntityDescription(
         key=IMS_SENSOR_KEY_PREFIX + TYPE_FORECAST_PREFIX + TYPE_FORECAST_DAY4,
         name="IMS Forecast Day4",
         icon="mdi:weather-sunny",
+        value_fn=partial(forecast_day_value, 4),
+        attributes_fn=partial(forecast_day_attributes, 4),
+        compact_attributes_fn=partial(forecast_day_compact_attributes, 4),
+        icon_fn=partial(forecast_day_icon, 4),
     ),
     ImsSensorEntityDescription(
         key=IMS_SENSOR_KEY_PREFIX + TYPE_FORECAST_PREFIX + TYPE_FORECAST_DAY5,
         name="IMS Forecast Day5",
         icon="mdi:weather-sunny",
+        value_fn=partial(forecast_day_value, 5),
+        attributes_fn=partial(forecast_day_attributes, 5),
+        compact_attributes_fn=partial(forecast_day_compact_attributes, 5),
+        icon_fn=partial(forecast_day_icon, 5),
     ),
     ImsSensorEntityDescription(
         key=IMS_SENSOR_KEY_PREFIX + TYPE_FORECAST_PREFIX + TYPE_FORECAST_DAY6,
         name="IMS Forecast Day6",
         icon="mdi:weather-sunny",
+        value_fn=partial(forecast_day_value, 6),
+        attributes_fn=partial(forecast_day_attributes, 6),
+        compact_attributes_fn=partial(forecast_day_compact_attributes, 6),
+        icon_fn=partial(forecast_day_icon, 6),
     ),
     ImsSensorEntityDescription(
         key=IMS_SENSOR_KEY_PREFIX + TYPE_FORECAST_PREFIX + TYPE_FORECAST_DAY7,
         name="IMS Forecast Day7",
         icon="mdi:weather-sunny",
+        value_fn=partial(forecast_day_value, 7),
+        attributes_fn=partial(forecast_day_attributes, 7),
+        compact_attributes_fn=partial(forecast_day_compact_attributes, 7),
+        icon_fn=partial(forecast_day_icon, 7),
     ),
 ]
 
@@ -350,6 +414,9 @@ async def async_setup_entry(
     domain_data = hass.data[DOMAIN][config_entry.entry_id]
     conditions = domain_data[CONF_MONITORED_CONDITIONS]
     weather_coordinator = domain_data[ENTRY_WEATHER_COORDINATOR]
+    compact_attributes = (
+        domain_data[CONF_FORECAST_ATTRIBUTES] == FORECAST_ATTRIBUTES_COMPACT
+    )
 
     # Add IMS Sensors
     sensors: list[ImsSensor] = []
@@ -361,9 +428,11 @@ async def async_setup_entry(
     for condition in conditions:
         if condition in SENSOR_DESCRIPTIONS_KEYS:
             description = SENSOR_DESCRIPTIONS_DICT[condition]
-            sensors.append(ImsSensor(weather_coordinator, description))
+            sensors.append(
+                ImsSensor(weather_coordinator, description, compact_attributes)
+            )
 
-    async_add_entities(sensors, update_before_add=True)
+    async_add_entities(sensors, update_before_add=False)
 
 
 def generate_single_warning_string(warning):
@@ -379,61 +448,24 @@ def generate_warnings_extra_state_attributes(warnings):
     return attributes
 
 
-def generate_forecast_extra_state_attributes(daily_forecast):
-    attributes = {
-        "minimum_temperature": {
-            "value": daily_forecast.minimum_temperature,
-            "unit": UnitOfTemperature.CELSIUS,
-        },
-        "maximum_temperature": {
-            "value": daily_forecast.maximum_temperature,
-            "unit": UnitOfTemperature.CELSIUS,
-        },
-        "maximum_uvi": {"value": daily_forecast.maximum_uvi, "unit": UV_INDEX},
-        "weather": {
-            "value": daily_forecast.weather,
-            "icon": WEATHER_CODE_TO_ICON.get(
-                str(daily_forecast.weather_code), "mdi:weather-sunny"
-            ),
-        },
-        "description": {"value": daily_forecast.description},
-        "date": {"value": daily_forecast.date.strftime("%Y/%m/%d")},
-    }
-
-    last_weather_code = None
-    last_weather_status = None
-    for hour in daily_forecast.hours:
-        if hour.weather and hour.weather != "Nothing":
-            last_weather_status = hour.weather
-        elif not last_weather_status:
-            last_weather_status = daily_forecast.weather
-
-        if hour.weather_code and hour.weather_code != "0":
-            last_weather_code = hour.weather_code
-        elif not last_weather_code:
-            last_weather_code = daily_forecast.weather_code
-
-        hourly_weather_code = get_hourly_weather_icon(hour.hour, last_weather_code)
-
-        attributes[hour.hour] = {
-            "weather": {
-                "value": last_weather_status,
-                "icon": WEATHER_CODE_TO_ICON.get(str(hourly_weather_code)),
-            },
-            "temperature": {
-                "value": hour.precise_temperature or hour.temperature,
-                "unit": UnitOfTemperature.CELSIUS,
-            },
-        }
-
-    return attributes
-
-
 class ImsSensor(ImsEntity, SensorEntity):
     """Representation of an IMS sensor."""
 
     entity_description: ImsSensorEntityDescription
     _attr_native_value: Any
+    _skip_unchanged_writes = True
+
+    def __init__(
+        self,
+        coordinator: WeatherUpdateCoordinator,
+        description: ImsSensorEntityDescription,
+        compact_attributes: bool = False,
+    ) -> None:
+        """Initialize."""
+        super().__init__(coordinator, description)
+        self._attributes_fn = description.attributes_fn
+        if compact_attributes and description.compact_attributes_fn is not None:
+            self._attributes_fn = description.compact_attributes_fn
 
     @callback
     def _update_from_latest_data(self) -> None:
@@ -458,108 +490,15 @@ class ImsSensor(ImsEntity, SensorEntity):
                 self._attr_native_value = None
                 return
 
-        # After these checks, data is guaranteed to be not None
-        assert data is not None
-
-        match self.entity_description.key:
-            case sensor_keys.TYPE_CURRENT_UV_LEVEL:
-                match data.current_weather.u_v_level:
-                    case "E":
-                        self._attr_native_value = UV_LEVEL_EXTREME
-                    case "V":
-                        self._attr_native_value = UV_LEVEL_VHIGH
-                    case "H":
-                        self._attr_native_value = UV_LEVEL_HIGH
-                    case "M":
-                        self._attr_native_value = UV_LEVEL_MODERATE
-                    case _:
-                        self._attr_native_value = UV_LEVEL_LOW
-
-            case sensor_keys.TYPE_CURRENT_UV_INDEX:
-                self._attr_native_value = data.current_weather.u_v_index
-
-            case sensor_keys.TYPE_MAX_UV_INDEX:
-                self._attr_native_value = data.current_weather.u_v_i_max
-
-            case sensor_keys.TYPE_GUST_SPEED:
-                self._attr_native_value = data.current_weather.gust_speed
-
-            case sensor_keys.TYPE_CITY:
-                _LOGGER.debug(
-                    "Location: %s, entity: %s",
-                    data.current_weather.location,
-                    self.entity_description.key,
-                )
-                self._attr_native_value = data.current_weather.location
-
-            case sensor_keys.TYPE_TEMPERATURE:
-                self._attr_native_value = data.current_weather.temperature
-
-            case sensor_keys.TYPE_DEW_POINT_TEMP:
-                self._attr_native_value = data.current_weather.due_point_temp
-
-            case sensor_keys.TYPE_FEELS_LIKE:
-                self._attr_native_value = data.current_weather.feels_like
-
-            case sensor_keys.TYPE_HUMIDITY:
-                self._attr_native_value = data.current_weather.humidity
-
-            case sensor_keys.TYPE_PM10:
-                self._attr_native_value = data.current_weather.pm10
-
-            case sensor_keys.TYPE_PRECIPITATION:
-                self._attr_native_value = (
-                    data.current_weather.rain
-                    if (data.current_weather.rain and data.current_weather.rain > 0.0)
-                    else 0.0
-                )
-
-            case sensor_keys.TYPE_PRECIPITATION_PROBABILITY:
-                self._attr_native_value = data.current_weather.rain_chance
-
-            case sensor_keys.TYPE_FORECAST_TIME:
-                self._attr_native_value = (
-                    data.current_weather.forecast_time.astimezone()
-                )
-
-            case sensor_keys.TYPE_WIND_DIRECTION:
-                self._attr_native_value = WIND_DIRECTIONS[
-                    int(data.current_weather.wind_direction_id)
-                ]
-
-            case sensor_keys.TYPE_WIND_SPEED:
-                self._attr_native_value = data.current_weather.wind_speed
+        if data is None:
+            self._attr_native_value = None
+            return
 
-            case sensor_keys.TYPE_WEATHER_WARNINGS:
-                self._attr_native_value = len(data.warnings)
-                self._attr_extra_state_attributes = (
-                    generate_warnings_extra_state_attributes(data.warnings)
-                )
-
-            case (
-                sensor_keys.TYPE_FORECAST_TODAY
-                | sensor_keys.TYPE_FORECAST_DAY1
-                | sensor_keys.TYPE_FORECAST_DAY2
-                | sensor_keys.TYPE_FORECAST_DAY3
-                | sensor_keys.TYPE_FORECAST_DAY4
-                | sensor_keys.TYPE_FORECAST_DAY5
-                | sensor_keys.TYPE_FORECAST_DAY6
-                | sensor_keys.TYPE_FORECAST_DAY7
-            ):
-                day_index = (
-                    0
-                    if self.entity_description.key == sensor_keys.TYPE_FORECAST_TODAY
-                    else int(self.entity_description.key[-1])
-                )
-                if data.forecast is not None and day_index < len(data.forecast.days):
-                    daily_forecast = data.forecast.days[day_index]
-                    self._attr_native_value = daily_forecast.day
-                    self._attr_extra_state_attributes = (
-                        generate_forecast_extra_state_attributes(daily_forecast)
-                    )
-                    self._attr_icon = WEATHER_CODE_TO_ICON.get(
-                        str(daily_forecast.weather_code), "mdi:weather-sunny"
-                    )
-
-            case _:
-                self._attr_native_value = None
+        description = self.entity_description
+        self._attr_native_value = (
+            description.value_fn(data) if description.value_fn is not None else None
+        )
+        if self._attributes_fn is not None:
+            self._attr_extra_state_attributes = self._attributes_fn(data)
+        if description.icon_fn is not None and (icon := description.icon_fn(data)):
+            self._attr_icon = icon
@@ -0,0 +1,150 @@
+"""Persistent snapshot of the last good IMS weather data.
+
+The snapshot lets entities come up immediately after a Home Assistant
+restart, before (and even without) a successful round-trip to IMS.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import datetime
+import logging
+from collections.abc import Callable
+from typing import Any
+
+import homeassistant.util.dt as dt_util
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+from weatheril import Forecast, RadarSatellite, Warning, Weather
+from weatheril.forecast import Daily, Hourly
+
+from .const import DOMAIN
+from .weather_update_coordinator import WeatherData
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+# Coalesce the writes of frequent refreshes into one every few minutes.
+SNAPSHOT_SAVE_DELAY = 300
+# Older snapshots are ignored rather than shown as current conditions.
+SNAPSHOT_MAX_AGE = datetime.timedelta(hours=24)
+
+KEY_SAVED_AT = "saved_at"
+KEY_DATA = "data"
+
+
+class WeatherSnapshotStore:
+    """Save and load the ``WeatherData`` of one IMS location."""
+
+    def __init__(self, hass: HomeAssistant, location_key: str) -> None:
+        """Initialize the store."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, snapshot_storage_key(location_key)
+        )
+        # Builds the snapshot waiting for its delayed write, if any.
+        self._pending: Callable[[], dict[str, Any]] | None = None
+
+    async def async_load(self) -> tuple[WeatherData, datetime.datetime] | None:
+        """Return the stored ``WeatherData`` and when it was saved, if usable.
+
+        A snapshot that cannot be read only costs the warm start, so any
+        error is logged and treated as no snapshot.
+        """
+        try:
+            stored = await self._store.async_load()
+            if not stored:
+                return None
+            saved_at = dt_util.parse_datetime(stored[KEY_SAVED_AT])
+            if saved_at is None or dt_util.utcnow() - saved_at > SNAPSHOT_MAX_AGE:
+                _LOGGER.debug("Ignoring IMS snapshot saved at %s", saved_at)
+                return None
+            return weather_data_from_dict(stored[KEY_DATA]), saved_at
+        except Exception as error:  # noqa: BLE001
+            _LOGGER.warning("Failed to load the IMS weather snapshot: %s", error)
+            return None
+
+    def async_delay_save(self, data: WeatherData) -> None:
+        """Schedule ``data`` to be written to storage."""
+        saved_at = dt_util.utcnow()
+        self._pending = lambda: {
+            KEY_SAVED_AT: saved_at.isoformat(),
+            KEY_DATA: dataclasses.asdict(data),
+        }
+        self._store.async_delay_save(self._take_pending, SNAPSHOT_SAVE_DELAY)
+
+    async def async_flush(self) -> None:
+        """Write the snapshot waiting for its delayed write, now.
+
+        Home Assistant writes delayed saves when it stops, but not when the
+        entry is unloaded or reloaded.
+        """
+        if self._pending is not None:
+            await self._store.async_save(self._take_pending())
+
+    def _take_pending(self) -> dict[str, Any]:
+        """Build the pending snapshot, which is then no longer pending."""
+        assert self._pending is not None
+        data_func, self._pending = self._pending, None
+        return data_func()
+
+    async def async_remove(self) -> None:
+        """Delete the stored snapshot."""
+        await self._store.async_remove()
+
+
+def snapshot_storage_key(location_key: str) -> str:
+    """Return the storage key of the snapshot of ``location_key``."""
+    return f"{DOMAIN}.snapshot.{location_key}"
+
+
+def _restore(cls: type, values: dict[str, Any], *datetime_fields: str) -> Any:
+    """Rebuild a ``weatheril`` model without running ``__post_init__``.
+
+    The stored values already contain the names ``__post_init__`` would
+    look up, so the lookup tables (and their blocking downloads) are not
+    needed at startup.
+    """
+    instance = cls.__new__(cls)
+    instance.__dict__.update(values)
+    for name in datetime_fields:
+        value = values.get(name)
+        if isinstance(value, str):
+            setattr(instance, name, dt_util.parse_datetime(value))
+    return instance
+
+
+def weather_data_from_dict(values: dict[str, Any]) -> WeatherData:
+    """Rebuild a ``WeatherData`` serialized with ``dataclasses.asdict``."""
+    forecast = None
+    if (forecast_values := values.get("forecast")) is not None:
+        days = []
+        for day_values in forecast_values["days"]:
+            hours = [
+                _restore(Hourly, hour_values, "forecast_time", "created")
+                for hour_values in day_values["hours"]
+            ]
+            day = _restore(Daily, day_values, "date")
+            day.hours = hours
+            days.append(day)
+        forecast = Forecast(days)
+
+    images = None
+    if (images_values := values.get("images")) is not None:
+        images = RadarSatellite(**images_values)
+
+    return WeatherData(
+        current_weather=_restore(
+            Weather, values["current_weather"], "forecast_time", "modified_at"
+        ),
+        forecast=forecast,
+        images=images,
+        warnings=[
+            _restore(Warning, warning_values, "sent", "valid_from", "valid_to")
+            for warning_values in values.get("warnings", [])
+        ],
+        updated_at={
+            endpoint: fetched_at
+            for endpoint, value in values.get("updated_at", {}).items()
+            if (fetched_at := dt_util.parse_datetime(value)) is not None
+        },
+    )
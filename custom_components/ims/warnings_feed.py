@@ -0,0 +1,88 @@
+"""National IMS warnings feed shared by the coordinators of one language."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from weatheril import Warning
+
+from .const import WARNINGS_UPDATE_INTERVAL
+from .ims_client import ImsClient, build_warnings
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class WarningsFeed:
+    """Poll the national warnings feed of one language for every location.
+
+    IMS publishes all warnings of a language in a single feed. The feed is
+    fetched at most once per ``WARNINGS_UPDATE_INTERVAL`` (concurrent
+    callers join the fetch in flight) and indexed by region, so a location
+    only looks up its region and gets a ``Warning`` list built once per
+    feed revision.
+    """
+
+    def __init__(self, hass: HomeAssistant, language: str) -> None:
+        """Initialize the feed."""
+        self._hass = hass
+        self.language = language
+        self._client = ImsClient(hass, language)
+        self._index: dict[str, list[dict[str, Any]]] | None = None
+        self._fetched_at = 0.0
+        self._pending: asyncio.Task[dict[str, list[dict[str, Any]]]] | None = None
+        # Warnings of every location built from the current ``_index``.
+        self._views: dict[str, list[Warning]] = {}
+        self._regions: dict[str, str] = {}
+
+    async def async_get_warnings(
+        self, location: int | str, timeout: float | None = None
+    ) -> list[Warning]:
+        """Return the warnings issued for the region of ``location``.
+
+        ``timeout`` bounds the request of a fetch this call starts.
+        """
+        index = await self._async_get_index(location, timeout)
+        key = str(location)
+        if (warnings := self._views.get(key)) is None:
+            if (region := self._regions.get(key)) is None:
+                region = self._regions[key] = self._client.region_of(location)
+            assert self._client.warning_lookups is not None
+            warnings = self._views[key] = build_warnings(
+                location, region, index.get(region, []), self._client.warning_lookups
+            )
+        return warnings
+
+    async def _async_get_index(
+        self, location: int | str, timeout: float | None
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Return the region index of the feed, fetching it when stale."""
+        age = time.monotonic() - self._fetched_at
+        if self._index is not None and age < WARNINGS_UPDATE_INTERVAL.total_seconds():
+            return self._index
+        # An eagerly started fetch may finish before it is even stored here.
+        if self._pending is None or self._pending.done():
+            self._pending = self._hass.async_create_task(
+                self._async_fetch_index(location, timeout),
+                f"IMS warnings feed ({self.language})",
+            )
+        # A caller being cancelled must not cancel the fetch the others await.
+        return await asyncio.shield(self._pending)
+
+    async def _async_fetch_index(
+        self, location: int | str, timeout: float | None
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Fetch the feed and drop the views of a changed one."""
+        try:
+            index = await self._client.async_get_warnings_index(location, timeout)
+        finally:
+            self._pending = None
+        if index is not self._index:
+            _LOGGER.debug("IMS warnings feed (%s) changed", self.language)
+            self._index = index
+            self._views = {}
+        self._fetched_at = time.monotonic()
+        return index
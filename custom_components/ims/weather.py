@@ -32,6 +32,7 @@ from .const import (
 
 from homeassistant.const import UnitOfTemperature
 
+from .planner import WEATHER_ENDPOINTS
 from .utils import get_hourly_weather_icon
 from .weather_update_coordinator import WeatherUpdateCoordinator, WeatherData
 
@@ -108,6 +109,90 @@ def round_if_needed(value: int | float, output_round: bool):
         return round(value, 2)
 
 
+class CurrentConditions:
+    """Current conditions of an ``IMSWeather``, converted once per update.
+
+    Home Assistant reads every property of the weather entity on each state
+    write; building them all from one ``WeatherData`` at once keeps those
+    reads to attribute lookups instead of parsing and rounding again.
+    """
+
+    __slots__ = (
+        "apparent_temperature",
+        "attribution",
+        "condition",
+        "description",
+        "dew_point",
+        "humidity",
+        "temperature",
+        "uv_index",
+        "wind_bearing",
+        "wind_gust_speed",
+        "wind_speed",
+    )
+
+    def __init__(self) -> None:
+        """Initialize conditions with nothing known."""
+        self.apparent_temperature: float | None = None
+        self.attribution: str | None = None
+        self.condition: str | None = None
+        self.description: str | None = None
+        self.dew_point: float | None = None
+        self.humidity: float | None = None
+        self.temperature: float | None = None
+        self.uv_index: int | None = None
+        self.wind_bearing: str | None = None
+        self.wind_gust_speed: int | None = None
+        self.wind_speed: float | None = None
+
+    @classmethod
+    def from_data(
+        cls, data: WeatherData | None, output_round: bool
+    ) -> CurrentConditions:
+        """Convert the current analysis of ``data``."""
+        conditions = cls()
+        if data is None or data.current_weather is None:
+            return conditions
+        current = data.current_weather
+        forecast_days = data.forecast.days if data.forecast is not None else None
+
+        conditions.temperature = round_if_needed(
+            float(current.temperature), output_round
+        )
+        conditions.apparent_temperature = round_if_needed(
+            float(current.feels_like), output_round
+        )
+        conditions.humidity = round_if_needed(float(current.humidity), output_round)
+        conditions.wind_speed = round_if_needed(float(current.wind_speed), output_round)
+        conditions.dew_point = round_if_needed(
+            float(current.due_point_temp), output_round
+        )
+        conditions.wind_bearing = WIND_DIRECTIONS[int(current.wind_direction_id)]
+        conditions.wind_gust_speed = (
+            int(current.gust_speed) if current.gust_speed else None
+        )
+        conditions.uv_index = int(current.u_v_index)
+        conditions.attribution = current.description
+
+        weather_code = get_hourly_weather_icon(
+            current.json["forecast_time"],
+            current.weather_code,
+            "%Y-%m-%d %H:%M:%S",
+        )
+        condition = WEATHER_CODE_TO_CONDITION.get(str(weather_code))
+        if (not condition or condition == "Nothing") and forecast_days:
+            condition = WEATHER_CODE_TO_CONDITION.get(
+                str(forecast_days[0].weather_code)
+            )
+        conditions.condition = condition
+
+        description = current.description
+        if (not description or description == "Nothing") and forecast_days:
+            description = forecast_days[0].weather
+        conditions.description = description
+        return conditions
+
+
 class IMSWeather(CoordinatorEntity[WeatherUpdateCoordinator], WeatherEntity):
     """Implementation of an IMSWeather sensor."""
 
@@ -132,7 +217,10 @@ class IMSWeather(CoordinatorEntity[WeatherUpdateCoordinator], WeatherEntity):
         output_round: str,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(weather_coordinator)
+        super().__init__(
+            weather_coordinator,
+            context=WEATHER_ENDPOINTS,
+        )
         self._attr_name = name
         self._weather_coordinator = weather_coordinator
         self._name = name
@@ -141,11 +229,27 @@ class IMSWeather(CoordinatorEntity[WeatherUpdateCoordinator], WeatherEntity):
         self._city = city
         self._output_round = output_round == "Yes"
         self._ds_data = self._weather_coordinator.data
+        # Daily (False) and hourly (True) forecasts with the data generation
+        # they were built from.
+        self._forecast_cache: dict[bool, tuple[int, list[Forecast]]] = {}
+        self._conditions: CurrentConditions | None = None
+        self._conditions_generation = -1
+        # Data generation of the last forecasts pushed to subscribers.
+        self._pushed_generation = -1
 
     @callback
     def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
+        """Write the state and push the forecasts once per data change.
+
+        The coordinator also calls back when only its status changed (an
+        outage starting or ending); the forecasts are pushed again only when
+        its data generation moved.
+        """
         super()._handle_coordinator_update()
+        generation = self._weather_coordinator.data_generation
+        if generation == self._pushed_generation:
+            return
+        self._pushed_generation = generation
         assert self.platform.config_entry
         self.platform.config_entry.async_create_task(
             self.hass, self.async_update_listeners(("daily", "hourly"))
@@ -171,11 +275,26 @@ class IMSWeather(CoordinatorEntity[WeatherUpdateCoordinator], WeatherEntity):
             and data.forecast is not None
         )
 
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return where the data comes from when it is not live."""
+        return self._weather_coordinator.status_attributes() or None
+
+    @property
+    def _current(self) -> CurrentConditions:
+        """Return the current conditions, built once per coordinator update."""
+        generation = self._weather_coordinator.data_generation
+        if self._conditions is None or self._conditions_generation != generation:
+            self._conditions = CurrentConditions.from_data(
+                self.weather_data, self._output_round
+            )
+            self._conditions_generation = generation
+        return self._conditions
+
     @property
     def attribution(self):
         """Return the attribution."""
-        data = self.weather_data
-        return data.current_weather.description
+        return self._current.attribution
 
     @property
     def name(self):
@@ -185,99 +304,65 @@ class IMSWeather(CoordinatorEntity[WeatherUpdateCoordinator], WeatherEntity):
     @property
     def native_temperature(self):
         """Return the temperature."""
-        data = self.weather_data
-        temperature = float(data.current_weather.temperature)
-
-        return round_if_needed(temperature, self._output_round)
+        return self._current.temperature
 
     @property
     def native_apparent_temperature(self):
         """Return the native apparent temperature (feel-like)."""
-        data = self.weather_data
-        feels_like_temperature = float(data.current_weather.feels_like)
-
-        return round_if_needed(feels_like_temperature, self._output_round)
+        return self._current.apparent_temperature
 
     @property
     def humidity(self):
         """Return the humidity."""
-        data = self.weather_data
-        humidity = float(data.current_weather.humidity)
-
-        return round_if_needed(humidity, self._output_round)
+        return self._current.humidity
 
     @property
     def native_wind_speed(self):
         """Return the wind speed."""
-        data = self.weather_data
-        wind_speed = float(data.current_weather.wind_speed)
-
-        return round_if_needed(wind_speed, self._output_round)
+        return self._current.wind_speed
 
     @property
     def native_dew_point(self):
         """Return the native dew point."""
-        data = self.weather_data
-        dew_point = float(data.current_weather.due_point_temp)
-
-        return round_if_needed(dew_point, self._output_round)
+        return self._current.dew_point
 
     @property
     def wind_bearing(self):
         """Return the wind bearing."""
-        data = self.weather_data
-        return WIND_DIRECTIONS[int(data.current_weather.wind_direction_id)]
+        return self._current.wind_bearing
 
     @property
     def native_wind_gust_speed(self):
         """Return the gust wind speed."""
-        data = self.weather_data
-        return (
-            int(data.current_weather.gust_speed)
-            if data.current_weather.gust_speed
-            else None
-        )
+        return self._current.wind_gust_speed
 
     @property
     def uv_index(self):
         """Return the wind bearing."""
-        data = self.weather_data
-        return int(data.current_weather.u_v_index)
+        return self._current.uv_index
 
     @property
     def condition(self):
         """Return the weather condition."""
-        data = self.weather_data
-
-        date_str = data.current_weather.json["forecast_time"]
-        weather_code = get_hourly_weather_icon(
-            date_str,
-            data.current_weather.weather_code,
-            "%Y-%m-%d %H:%M:%S",
-        )
-
-        condition = WEATHER_CODE_TO_CONDITION.get(str(weather_code))
-        if not condition or condition == "Nothing":
-            forecast_days = data.forecast.days
-            if forecast_days:
-                condition = WEATHER_CODE_TO_CONDITION.get(
-                    str(forecast_days[0].weather_code)
-                )
-        return condition
+        return self._current.condition
 
     @property
     def description(self):
         """Return the weather description."""
-        data = self.weather_data
-        description = data.current_weather.description
-        if not description or description == "Nothing":
-            forecast_days = data.forecast.days
-            if forecast_days:
-                description = forecast_days[0].weather
-        return description
+        return self._current.description
 
     def _forecast(self, hourly: bool) -> list[Forecast]:
-        """Return the forecast array."""
+        """Return the forecast array, built once per coordinator update."""
+        generation = self._weather_coordinator.data_generation
+        cached = self._forecast_cache.get(hourly)
+        if cached is not None and cached[0] == generation:
+            return cached[1]
+        data = self._build_forecast(hourly)
+        self._forecast_cache[hourly] = (generation, data)
+        return data
+
+    def _build_forecast(self, hourly: bool) -> list[Forecast]:
+        """Build the forecast array from the coordinator data."""
         data: list[Forecast] = []
         weather_data = self.weather_data
 
@@ -299,65 +384,24 @@ class IMSWeather(CoordinatorEntity[WeatherUpdateCoordinator], WeatherEntity):
                 )
                 for daily_forecast in weather_data.forecast.days
             ]
-        else:
-            last_weather_code = None
-            for daily_forecast in weather_data.forecast.days:
-                for hourly_forecast in daily_forecast.hours:
-                    # Skip negative weather codes
-                    try:
-                        weather_code_int = (
-                            int(hourly_forecast.weather_code)
-                            if hourly_forecast.weather_code
-                            else 0
-                        )
-                    except (ValueError, TypeError):
-                        weather_code_int = 0
-
-                    if (
-                        hourly_forecast.weather_code
-                        and hourly_forecast.weather_code != "0"
-                        and weather_code_int >= 0
-                    ):
-                        last_weather_code = hourly_forecast.weather_code
-                    elif not last_weather_code:
-                        try:
-                            daily_weather_code_int = (
-                                int(daily_forecast.weather_code)
-                                if daily_forecast.weather_code
-                                else 0
-                            )
-                        except (ValueError, TypeError):
-                            daily_weather_code_int = 0
-
-                        if daily_forecast.weather_code and daily_weather_code_int >= 0:
-                            last_weather_code = daily_forecast.weather_code
-
-                    hourly_weather_code = get_hourly_weather_icon(
-                        hourly_forecast.hour, last_weather_code
-                    )
-
-                    data.append(
-                        Forecast(
-                            condition=WEATHER_CODE_TO_CONDITION.get(
-                                str(hourly_weather_code)
-                            ),
-                            datetime=hourly_forecast.forecast_time.isoformat(),
-                            humidity=hourly_forecast.relative_humidity,
-                            native_temperature=hourly_forecast.precise_temperature,
-                            native_precipitation=max(hourly_forecast.rain or 0, 0),
-                            precipitation_probability=int(
-                                hourly_forecast.rain_chance * 100
-                            )
-                            if hourly_forecast.rain_chance is not None
-                            else None,
-                            wind_bearing=WIND_DIRECTIONS[
-                                hourly_forecast.wind_direction_id
-                            ],
-                            native_wind_speed=hourly_forecast.wind_speed,
-                            native_wind_gust_speed=hourly_forecast.gust_speed,
-                            uv_index=hourly_forecast.u_v_index,
-                        )
-                    )
+        elif (view := weather_data.forecast_view) is not None:
+            data = [
+                Forecast(
+                    condition=WEATHER_CODE_TO_CONDITION.get(str(hourly_weather_code)),
+                    datetime=hourly_forecast.forecast_time.isoformat(),
+                    humidity=hourly_forecast.relative_humidity,
+                    native_temperature=hourly_forecast.precise_temperature,
+                    native_precipitation=max(hourly_forecast.rain or 0, 0),
+                    precipitation_probability=int(hourly_forecast.rain_chance * 100)
+                    if hourly_forecast.rain_chance is not None
+                    else None,
+                    wind_bearing=WIND_DIRECTIONS[hourly_forecast.wind_direction_id],
+                    native_wind_speed=hourly_forecast.wind_speed,
+                    native_wind_gust_speed=hourly_forecast.gust_speed,
+                    uv_index=hourly_forecast.u_v_index,
+                )
+                for hourly_forecast, hourly_weather_code in view.hourly_codes()
+            ]
 
         return data
 
@@ -373,9 +417,3 @@ class IMSWeather(CoordinatorEntity[WeatherUpdateCoordinator], WeatherEntity):
     async def async_forecast_hourly(self) -> list[Forecast]:
         """Return the hourly forecast in native units."""
         return self._forecast(True)
-
-    async def async_added_to_hass(self) -> None:
-        """Connect to dispatcher listening for entity data notifications."""
-        self.async_on_remove(
-            self._weather_coordinator.async_add_listener(self.async_write_ha_state)
-        )
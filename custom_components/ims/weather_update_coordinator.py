@@ -5,27 +5,66 @@ from __future__ import annotations
 import asyncio
 import datetime
 import logging
-from dataclasses import dataclass
-from typing import Any
+import time
+from collections.abc import Awaitable, Iterable
+from dataclasses import dataclass, field, replace
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, TypeVar
 
 import homeassistant.util.dt as dt_util
 
+from homeassistant.core import CALLBACK_TYPE, callback
+from homeassistant.helpers.event import async_track_time_change
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
-from weatheril import WeatherIL, Forecast, Weather, RadarSatellite, Warning
+from weatheril import Forecast, Weather, RadarSatellite, Warning
 
 from .const import (
+    ATTR_CIRCUIT_STATE,
+    ATTR_NEXT_ATTEMPT,
+    ATTR_SNAPSHOT_TIME,
     DOMAIN,
+    ENDPOINT_CURRENT,
+    ENDPOINT_FORECAST,
+    ENDPOINT_RADAR,
+    ENDPOINT_WARNINGS,
+    ENDPOINT_TIMEOUTS,
+    ENDPOINTS,
+    FAILED_FETCH_RETRY_INTERVAL,
+    FORECAST_UPDATE_INTERVAL,
     IMS_TIMEZONE,
-    WARNING_SENSOR_KEYS,
+    RADAR_UPDATE_INTERVAL,
+    REFRESH_QUEUE_ALLOWANCE,
+    SLICE_MAX_STALE_AGE,
+    STAGGER_WINDOW,
+    WARNINGS_UPDATE_INTERVAL,
 )
+from .circuit_breaker import CircuitState, async_get_circuit_breaker
+from .forecast_index import ForecastIndex
+from .forecast_view import ForecastView
+from .ims_client import IMS_HOST, ImsClient, is_ims_unavailable
+from .planner import BASE_ENDPOINTS
+from .scheduling import PublicationSchedule
+
+if TYPE_CHECKING:
+    from .analysis_feed import CurrentAnalysisFeed
+    from .radar import RadarService
+    from .snapshot import WeatherSnapshotStore
+    from .warnings_feed import WarningsFeed
 
 _LOGGER = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
 ATTRIBUTION = "Powered by IMS Weather"
 
 # Use the shared timezone constant
 timezone = IMS_TIMEZONE
 
+# Endpoints due within this margin are fetched with the current tick rather
+# than scheduling another tick a few seconds later.
+DUE_TOLERANCE = datetime.timedelta(seconds=5)
+MIN_TICK = datetime.timedelta(seconds=30)
+
 
 @dataclass
 class WeatherData:
@@ -35,6 +74,17 @@ class WeatherData:
     forecast: Forecast | None
     images: RadarSatellite | None
     warnings: list[Warning]
+    # When each endpoint's slice was last fetched successfully.
+    updated_at: dict[str, datetime.datetime] = field(default_factory=dict)
+
+    @cached_property
+    def forecast_view(self) -> ForecastView | None:
+        """Return what the entities show of the forecast, derived on demand.
+
+        Each update makes a new ``WeatherData`` (the hourly roll-forward
+        copies it), so the view is shared by the entities of one update.
+        """
+        return ForecastView(self.forecast) if self.forecast is not None else None
 
 
 class WeatherUpdateCoordinator(DataUpdateCoordinator[WeatherData]):
@@ -46,158 +96,628 @@ class WeatherUpdateCoordinator(DataUpdateCoordinator[WeatherData]):
         language: str,
         update_interval: datetime.timedelta,
         hass: Any,
-        monitored_conditions: list[str] | None = None,
+        required_endpoints: Iterable[str] | None = None,
+        endpoint_intervals: dict[str, datetime.timedelta] | None = None,
+        snapshot_store: WeatherSnapshotStore | None = None,
+        max_stale_age: datetime.timedelta = SLICE_MAX_STALE_AGE,
+        radar_service: RadarService | None = None,
+        warnings_feed: WarningsFeed | None = None,
+        analysis_feed: CurrentAnalysisFeed | None = None,
+        endpoint_timeouts: dict[str, datetime.timedelta] | None = None,
     ) -> None:
         """Initialize coordinator.
 
-        ``monitored_conditions`` is the list of sensor keys the user has
-        enabled for this config entry. When none of them consume
-        ``WeatherData.warnings``, the coordinator skips the warnings HTTP
-        fetch entirely. ``None`` (the default) means "no conditions were
-        stored" and is treated as "all sensors enabled" — the legacy
-        behavior in ``sensor.py`` and ``binary_sensor.py`` falls back to
-        every description key when conditions are missing.
+        ``required_endpoints`` are the endpoints the enabled platforms and
+        monitored conditions consume (see ``planner.required_endpoints``);
+        every other endpoint is never fetched. ``None`` (the default) means
+        current analysis, forecast and warnings. Once entities are listening,
+        required endpoints none of them registered in its context (e.g.
+        those of disabled entities) are skipped as well, and radar imagery
+        is only fetched while a listener asks for it.
+
+        Every endpoint is refreshed on its own cadence. The current
+        analysis follows ``update_interval``; the forecast is fetched at
+        most every ``FORECAST_UPDATE_INTERVAL``, warnings at least every
+        ``WARNINGS_UPDATE_INTERVAL`` and radar imagery only while a listener
+        consumes it. ``endpoint_intervals`` overrides any of these. Once the
+        IMS publication cadence has been learned from successive
+        ``forecast_time`` values, current analysis fetches are aligned to it
+        (see ``PublicationSchedule``).
+
+        Each request an endpoint makes is bounded by its ``ENDPOINT_TIMEOUTS``
+        budget, overridable with ``endpoint_timeouts``, counted from when the
+        shared rate limiter lets it through. The current analysis is
+        critical: the update fails when it times out. The other endpoints
+        are best-effort and are abandoned without affecting the results
+        that arrived in time.
+
+        A failed forecast, warnings or radar fetch does not wipe its slice:
+        the last good value keeps being served, with its fetch time in
+        ``WeatherData.updated_at``, for up to ``max_stale_age``. The failed
+        endpoint is retried after ``FAILED_FETCH_RETRY_INTERVAL``, backing
+        off exponentially up to its regular interval.
+
+        Radar imagery is national: with a shared ``radar_service`` the index
+        is fetched once for every coordinator of the domain (see
+        ``RadarService.async_track_frames`` for its consumer). Likewise
+        warnings come from the ``warnings_feed`` shared by every coordinator
+        of the language, and the current analysis from the
+        ``analysis_feed`` shared by the coordinators of every language of
+        the city, when given.
+
+        When a ``snapshot_store`` is given, every good update is saved to it
+        and ``async_restore_snapshot`` can warm-start the coordinator from
+        it.
         """
         self.city = city
         self.language = language
         self.update_interval = update_interval
-        self.weather = WeatherIL(str(city), language)
+        self.client = ImsClient(hass, language)
 
         self._connect_error = False
         self._hass = hass
-        self._monitored_conditions: list[str] | None = monitored_conditions
+        self.required_endpoints: frozenset[str] = (
+            frozenset(required_endpoints)
+            if required_endpoints is not None
+            else frozenset({ENDPOINT_CURRENT, ENDPOINT_FORECAST, ENDPOINT_WARNINGS})
+        )
+        # Wall-clock seconds each endpoint took during the last refresh.
+        self.endpoint_latencies: dict[str, float] = {}
+
+        self.endpoint_intervals: dict[str, datetime.timedelta] = {
+            ENDPOINT_CURRENT: update_interval,
+            ENDPOINT_FORECAST: max(update_interval, FORECAST_UPDATE_INTERVAL),
+            ENDPOINT_WARNINGS: min(update_interval, WARNINGS_UPDATE_INTERVAL),
+            ENDPOINT_RADAR: RADAR_UPDATE_INTERVAL,
+        }
+        if endpoint_intervals:
+            self.endpoint_intervals.update(endpoint_intervals)
+        self._next_fetch: dict[str, datetime.datetime] = {}
+        self.endpoint_timeouts: dict[str, datetime.timedelta] = {
+            **ENDPOINT_TIMEOUTS,
+            **(endpoint_timeouts or {}),
+        }
+        # Fraction in [0, 1) of an interval this coordinator's fetches are
+        # shifted by, so coordinators do not all hit IMS at the same instant
+        # (see ``registry.city_stagger``).
+        self.stagger = 0.0
+        self.max_stale_age = max_stale_age
+        # Consecutive failed fetches of each best-effort endpoint.
+        self._failures: dict[str, int] = {}
+        # The object last fetched from each endpoint and its fingerprint.
+        self._fingerprints: dict[str, tuple[Any, int]] = {}
+        # Fetches of each endpoint that returned what it already had.
+        self.unchanged_fetches: dict[str, int] = {}
+        # State writes skipped by each entity key (see ``ImsEntity``).
+        self.suppressed_writes: dict[str, int] = {}
+        self._publication = PublicationSchedule(
+            self.endpoint_intervals[ENDPOINT_CURRENT]
+        )
+        # Endpoints refreshed by the last update; listeners registered with a
+        # context of endpoints are only called when these intersect it.
+        self.updated_endpoints: frozenset[str] = frozenset(ENDPOINTS)
+        self._last_notified_status: tuple[bool, CircuitState] = (
+            True,
+            CircuitState.CLOSED,
+        )
+        self.breaker = async_get_circuit_breaker(hass, IMS_HOST)
+        self._snapshot_store = snapshot_store
+        self._radar_service = radar_service
+        self._warnings_feed = warnings_feed
+        self._analysis_feed = analysis_feed
+        # Bumped whenever ``data`` changes, so entities can cache what they
+        # derive from it.
+        self.data_generation = 0
+        # Time index over the hours of ``data.forecast``.
+        self.forecast_index: ForecastIndex | None = None
+        # When ``data`` was restored from a snapshot, the time it was saved.
+        self.snapshot_time: datetime.datetime | None = None
 
         super().__init__(hass, _LOGGER, name=DOMAIN, update_interval=update_interval)
 
+        # Hours of the cached forecast expire on the hour, not on a fetch.
+        self._unsub_roll_forward: CALLBACK_TYPE | None = async_track_time_change(
+            hass, self._async_roll_forward_forecast, minute=0, second=0
+        )
+
+    async def async_shutdown(self) -> None:
+        """Cancel the forecast roll-forward and any scheduled refresh.
+
+        A snapshot still waiting for its delayed write is written first.
+        """
+        if self._unsub_roll_forward is not None:
+            self._unsub_roll_forward()
+            self._unsub_roll_forward = None
+        if self._snapshot_store is not None:
+            await self._snapshot_store.async_flush()
+        await super().async_shutdown()
+
+    async def async_staggered_refresh(self) -> None:
+        """Refresh once this coordinator's share of ``STAGGER_WINDOW`` passed.
+
+        Used for the first refresh of coordinators restored from a snapshot,
+        which all start together with Home Assistant.
+        """
+        await asyncio.sleep((STAGGER_WINDOW * self.stagger).total_seconds())
+        await self.async_refresh()
+
+    @callback
+    def _async_roll_forward_forecast(self, now: datetime.datetime) -> None:
+        """Drop the forecast hours and days that have passed, without I/O."""
+        if self.data is None or (forecast := self.data.forecast) is None:
+            return
+        if not self._prune_forecast(forecast):
+            return
+        _LOGGER.debug("Rolled the IMS forecast of %s forward to %s", self.city, now)
+        # A copy drops the forecast view derived from the hours just pruned.
+        self.data = replace(self.data)
+        self.updated_endpoints = frozenset({ENDPOINT_FORECAST})
+        self.data_generation += 1
+        self.async_update_listeners()
+
     async def _async_update_data(self) -> WeatherData:
-        """Update the data."""
-        async with self._hass.timeout.async_timeout(30):
-            try:
-                _LOGGER.info("Fetching data from IMS")
-                data = await self._get_ims_weather()
-            except Exception as error:
-                raise UpdateFailed(error) from error
+        """Update the data.
+
+        While the circuit breaker of the IMS host is open, IMS is not
+        contacted and the last good data is served until the next probe.
+        Data restored from a snapshot is served as well when IMS fails
+        before it answered once, so a warm start during an outage keeps
+        the entities available.
+        """
+        now = dt_util.utcnow()
+        if not self.breaker.allow_request(now):
+            return self._serve_last_good_data(now)
+        try:
+            _LOGGER.info("Fetching data from IMS")
+            data = await self._get_ims_weather()
+        except Exception as error:
+            # Only IMS failing to answer counts against the breaker; a bad
+            # payload, or a deadline that ran out before any request was
+            # made, says nothing about IMS.
+            if is_ims_unavailable(error):
+                self.breaker.record_failure(now)
+            if self.breaker.state is CircuitState.OPEN and self.data is not None:
+                return self._serve_last_good_data(now)
+            self.update_interval = FAILED_FETCH_RETRY_INTERVAL
+            if self.snapshot_time is not None:
+                _LOGGER.warning(
+                    "Failed to fetch IMS data; keeping the data saved at %s: %s",
+                    self.snapshot_time,
+                    error,
+                )
+                self.updated_endpoints = frozenset()
+                return self.data
+            raise UpdateFailed(error) from error
+        self.breaker.record_success()
+        self.snapshot_time = None
         return data
 
+    def _serve_last_good_data(self, now: datetime.datetime) -> WeatherData:
+        """Keep the current data and wake up for the next breaker probe."""
+        if self.data is None:
+            raise UpdateFailed(f"{self.breaker.host} is unreachable")
+        self.updated_endpoints = frozenset()
+        next_attempt = self.breaker.next_attempt or now
+        self.update_interval = max(next_attempt - now, MIN_TICK)
+        return self.data
+
+    def status_attributes(self) -> dict[str, Any]:
+        """Return entity attributes describing where the data comes from."""
+        attributes: dict[str, Any] = {}
+        if self.snapshot_time is not None:
+            attributes[ATTR_SNAPSHOT_TIME] = self.snapshot_time.isoformat()
+        if self.breaker.state is not CircuitState.CLOSED:
+            attributes[ATTR_CIRCUIT_STATE] = self.breaker.state.value
+            if self.breaker.next_attempt is not None:
+                attributes[ATTR_NEXT_ATTEMPT] = self.breaker.next_attempt.isoformat()
+        return attributes
+
+    async def async_restore_snapshot(self) -> bool:
+        """Load the last saved data so entities can start from it.
+
+        Returns ``True`` when ``data`` was restored. A live refresh is still
+        needed afterwards; every endpoint is due on the first one.
+        """
+        if self._snapshot_store is None:
+            return False
+        restored = await self._snapshot_store.async_load()
+        if restored is None:
+            return False
+        self.data, self.snapshot_time = restored
+        self.data_generation += 1
+        if self.data.forecast is not None:
+            self._prune_forecast(self.data.forecast)
+        _LOGGER.info(
+            "Restored IMS data for %s saved at %s", self.city, self.snapshot_time
+        )
+        return True
+
+    @callback
+    def _async_refresh_finished(self) -> None:
+        """Save the data of a good refresh as the next warm-start snapshot."""
+        if (
+            not self.last_update_success
+            or self.data is None
+            or not self.updated_endpoints
+        ):
+            return
+        if self._snapshot_store is not None:
+            self._snapshot_store.async_delay_save(self.data)
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify the listeners that consume a refreshed endpoint.
+
+        Entities register with a context of the endpoints they read (see
+        ``ImsEntity``); listeners without a context read every endpoint.
+        When availability or the circuit breaker state changes every
+        listener is called. When no endpoint returned anything new, none is.
+        """
+        status = (self.last_update_success, self.breaker.state)
+        notify_all = (
+            not self.last_update_success or status != self._last_notified_status
+        )
+        self._last_notified_status = status
+        if not notify_all and not self.updated_endpoints:
+            return
+        for update_callback, context in list(self._listeners.values()):
+            if (
+                notify_all
+                or context is None
+                or not self.updated_endpoints.isdisjoint(context)
+            ):
+                update_callback()
+
+    def as_diagnostics(self) -> dict[str, Any]:
+        """Return the scheduling state of the coordinator for diagnostics."""
+        return {
+            "city": self.city,
+            "language": self.language,
+            "required_endpoints": sorted(self.required_endpoints),
+            "update_interval": str(self.update_interval),
+            "stagger": round(self.stagger, 3),
+            "next_fetch": {
+                endpoint: next_fetch.isoformat()
+                for endpoint, next_fetch in self._next_fetch.items()
+            },
+            "failures": dict(self._failures),
+            "unchanged_fetches": dict(self.unchanged_fetches),
+            "suppressed_writes": dict(self.suppressed_writes),
+            "circuit_breaker": {
+                "state": self.breaker.state.value,
+                "failures": self.breaker.failures,
+                "next_attempt": self.breaker.next_attempt
+                and self.breaker.next_attempt.isoformat(),
+            },
+            "endpoint_latencies": {
+                endpoint: round(latency, 3)
+                for endpoint, latency in self.endpoint_latencies.items()
+            },
+        }
+
+    def _wanted_endpoints(self) -> set[str]:
+        """Return the endpoints something currently consumes.
+
+        Before any entity listens (the first refresh runs ahead of platform
+        setup) every required endpoint is wanted. Afterwards only those in
+        the context of a listener are; a listener without a context wants
+        every required endpoint.
+        """
+        if not self._listeners:
+            return set(self.required_endpoints)
+        consumed: set[str] = set()
+        for _, context in self._listeners.values():
+            consumed.update(self.required_endpoints if context is None else context)
+        wanted = consumed & self.required_endpoints
+        if ENDPOINT_RADAR in consumed:
+            wanted.add(ENDPOINT_RADAR)
+        return wanted | BASE_ENDPOINTS
+
     async def _get_ims_weather(self) -> WeatherData:
         """Poll weather data from IMS."""
-
-        try:
-            loop = asyncio.get_event_loop()
-        except Exception:
-            loop = asyncio.new_event_loop()
-
-        current_weather = await loop.run_in_executor(
-            None, self.weather.get_current_analysis
+        now = dt_util.utcnow()
+        previous = self.data
+        wanted = self._wanted_endpoints()
+        due = [
+            endpoint
+            for endpoint in ENDPOINTS
+            if endpoint in wanted
+            and (
+                previous is None
+                or self._next_fetch.get(endpoint, now) <= now + DUE_TOLERANCE
+            )
+        ]
+
+        fetchers = {
+            ENDPOINT_CURRENT: self._fetch_current_analysis,
+            ENDPOINT_FORECAST: self._fetch_forecast,
+            ENDPOINT_WARNINGS: self._fetch_warnings,
+            ENDPOINT_RADAR: self._fetch_radar_images,
+        }
+
+        # The endpoints are independent, so fan them out together: a refresh
+        # then takes as long as the slowest call instead of the sum of all
+        # four. Only the current analysis is fatal; the other fetchers
+        # swallow their own errors and timeouts and return ``None`` (see
+        # their docstrings). The per-request timeouts leave out the time
+        # spent queued behind the rate limiter and loading lookup tables, so
+        # the whole refresh is bounded by a deadline as well.
+        self.endpoint_latencies = {}
+        timeouts = self._timeouts(due)
+        deadline = (
+            asyncio.get_running_loop().time()
+            + (
+                self.endpoint_timeouts[ENDPOINT_CURRENT] + REFRESH_QUEUE_ALLOWANCE
+            ).total_seconds()
         )
-        weather_forecast = await self._fetch_forecast(loop)
-        warnings = (
-            await self._fetch_warnings(loop) if self._should_fetch_warnings() else []
+        results = await asyncio.gather(
+            *(
+                self._timed(
+                    endpoint,
+                    self._before_deadline(
+                        endpoint, deadline, fetchers[endpoint](timeouts[endpoint])
+                    ),
+                )
+                for endpoint in due
+            )
         )
-        images = await self._fetch_radar_images(loop)
+        fetched: dict[str, Any] = dict(zip(due, results, strict=True))
+
+        if self.endpoint_latencies:
+            slowest = max(self.endpoint_latencies.items(), key=lambda item: item[1])
+            _LOGGER.debug(
+                "IMS endpoint latencies: %s (slowest: %s)",
+                ", ".join(
+                    f"{endpoint}={latency:.3f}s"
+                    for endpoint, latency in self.endpoint_latencies.items()
+                ),
+                slowest[0],
+            )
+
+        # A best-effort fetcher returns ``None`` when it failed; its slice then
+        # keeps the last good value until a fetch fails once that is older
+        # than max_stale_age. A slice not due yet is never aged out.
+        updated_at: dict[str, datetime.datetime] = {}
+        updated: set[str] = set()
+        slices: dict[str, Any] = {}
+        for endpoint, attribute, default in (
+            (ENDPOINT_CURRENT, "current_weather", None),
+            (ENDPOINT_FORECAST, "forecast", None),
+            (ENDPOINT_WARNINGS, "warnings", []),
+            (ENDPOINT_RADAR, "images", None),
+        ):
+            if fetched.get(endpoint) is not None:
+                updated_at[endpoint] = now
+                self._failures.pop(endpoint, None)
+                if self._slice_changed(endpoint, fetched[endpoint]) or previous is None:
+                    slices[endpoint] = fetched[endpoint]
+                    updated.add(endpoint)
+                else:
+                    # Keep the object entities already derived state from.
+                    slices[endpoint] = getattr(previous, attribute)
+                    self.unchanged_fetches[endpoint] = (
+                        self.unchanged_fetches.get(endpoint, 0) + 1
+                    )
+                continue
+            if endpoint in fetched:
+                self._failures[endpoint] = self._failures.get(endpoint, 0) + 1
+            slices[endpoint] = default
+            if endpoint not in wanted or previous is None:
+                self._fingerprints.pop(endpoint, None)
+                continue
+            fetched_at = previous.updated_at.get(endpoint)
+            if (
+                endpoint in fetched
+                and fetched_at is not None
+                and now - fetched_at > self.max_stale_age
+            ):
+                _LOGGER.warning(
+                    "Dropping IMS %s data last fetched at %s", endpoint, fetched_at
+                )
+                self._fingerprints.pop(endpoint, None)
+                updated.add(endpoint)
+                continue
+            slices[endpoint] = getattr(previous, attribute)
+            if fetched_at is not None:
+                updated_at[endpoint] = fetched_at
+
+        current_weather = slices[ENDPOINT_CURRENT]
+        if current_weather is None:
+            raise UpdateFailed(f"IMS returned no current analysis for {self.city}")
+
+        for endpoint in fetched:
+            delay = self._retry_delay(endpoint)
+            if endpoint not in self._next_fetch:
+                # Spread coordinators started together over their interval.
+                delay += delay * self.stagger
+            self._next_fetch[endpoint] = now + delay
+        if updated_at.get(ENDPOINT_CURRENT) == now:
+            self._next_fetch[ENDPOINT_CURRENT] = (
+                self._publication.observe(current_weather.forecast_time, now)
+                + STAGGER_WINDOW * self.stagger
+            )
+        self.updated_endpoints = frozenset(updated)
+        if updated:
+            self.data_generation += 1
+        self._schedule_next_tick(now, wanted)
 
         _LOGGER.debug(
-            "Data fetched from IMS of %s",
+            "Data fetched from IMS of %s (refreshed: %s)",
             current_weather.forecast_time.strftime("%m/%d/%Y, %H:%M:%S"),
+            ", ".join(fetched),
         )
 
+        weather_forecast = slices[ENDPOINT_FORECAST]
         if weather_forecast is not None:
-            self._filter_future_forecast(weather_forecast)
+            self._prune_forecast(weather_forecast)
         else:
             _LOGGER.warning(
                 "IMS returned no forecast data; continuing without forecast"
             )
-        return WeatherData(current_weather, weather_forecast, images, warnings)
+        return WeatherData(
+            current_weather,
+            weather_forecast,
+            slices[ENDPOINT_RADAR],
+            slices[ENDPOINT_WARNINGS],
+            updated_at,
+        )
+
+    def _slice_changed(self, endpoint: str, value: Any) -> bool:
+        """Return whether ``value`` differs from what ``endpoint`` gave last.
+
+        A ``304 Not Modified`` answer and the shared feeds hand back the very
+        same object, which is recognized without looking inside it. Anything
+        else is fingerprinted by the hash of its ``repr``: the ``weatheril``
+        models are dataclasses whose ``repr`` covers every field. This runs
+        before the forecast is pruned, so a republished but identical
+        forecast matches the fingerprint of the previous one.
+        """
+        last = self._fingerprints.get(endpoint)
+        if last is not None and last[0] is value:
+            return False
+        fingerprint = hash(repr(value))
+        self._fingerprints[endpoint] = (value, fingerprint)
+        return last is None or last[1] != fingerprint
+
+    def _retry_delay(self, endpoint: str) -> datetime.timedelta:
+        """Return when to fetch ``endpoint`` again after this refresh."""
+        interval = self.endpoint_intervals[endpoint]
+        if not (failures := self._failures.get(endpoint)):
+            return interval
+        return min(FAILED_FETCH_RETRY_INTERVAL * 2 ** (failures - 1), interval)
+
+    def _schedule_next_tick(self, now: datetime.datetime, wanted: set[str]) -> None:
+        """Wake up when the next wanted endpoint becomes due."""
+        next_due = min(self._next_fetch.get(endpoint, now) for endpoint in wanted)
+        self.update_interval = max(next_due - now, MIN_TICK)
+
+    async def _timed(self, endpoint: str, awaitable: Awaitable[_T]) -> _T:
+        """Await ``awaitable`` and record how long it took under ``endpoint``.
+
+        The latency is recorded even when the call raises, so a failing
+        endpoint still shows up as the long pole.
+        """
+        start = time.monotonic()
+        try:
+            return await awaitable
+        finally:
+            self.endpoint_latencies[endpoint] = time.monotonic() - start
+
+    async def _before_deadline(
+        self, endpoint: str, deadline: float, awaitable: Awaitable[_T]
+    ) -> _T | None:
+        """Await ``awaitable`` until the loop time ``deadline``.
+
+        Past it the current analysis raises ``TimeoutError`` (a local one,
+        which the circuit breaker ignores); a best-effort endpoint gives up
+        and returns ``None`` like its fetcher does on failure.
+        """
+        try:
+            async with asyncio.timeout_at(deadline):
+                return await awaitable
+        except TimeoutError:
+            if endpoint == ENDPOINT_CURRENT:
+                raise
+            _LOGGER.warning(
+                "IMS %s did not arrive before the refresh deadline; "
+                "keeping the last one",
+                endpoint,
+            )
+            return None
+
+    def _timeouts(self, due: list[str]) -> dict[str, float]:
+        """Return the timeout of each due endpoint's requests, in seconds.
+
+        A timeout bounds each HTTP request to IMS, not the time a request
+        waits for the rate limiter (see ``ImsClient._async_fetch``).
 
-    async def _fetch_forecast(self, loop: asyncio.AbstractEventLoop) -> Forecast | None:
+        Best-effort endpoints never outlast the current analysis fetched
+        alongside them, so a slow optional endpoint cannot stretch a
+        refresh beyond its critical path.
+        """
+        timeouts = {
+            endpoint: self.endpoint_timeouts[endpoint].total_seconds()
+            for endpoint in due
+        }
+        if (critical := timeouts.get(ENDPOINT_CURRENT)) is not None:
+            for endpoint, timeout in timeouts.items():
+                timeouts[endpoint] = min(timeout, critical)
+        return timeouts
+
+    async def _fetch_current_analysis(self, timeout: float) -> Weather | None:
+        """Fetch the current analysis from IMS; failures are fatal."""
+        if self._analysis_feed is not None:
+            return await self._analysis_feed.async_get_weather(self.client, timeout)
+        return await self.client.async_get_current_analysis(self.city, timeout)
+
+    async def _fetch_forecast(self, timeout: float) -> Forecast | None:
         """Fetch weather forecast from IMS.
 
         Non-fatal: returns ``None`` on any failure (timeout, network error,
         parse error, server outage) so a misbehaving forecast endpoint cannot
-        prevent the rest of the update from completing.  The upstream
-        ``weatheril`` library may raise ``AttributeError`` when the IMS API
-        returns unexpected data (e.g. ``None`` hourly payload).
+        prevent the rest of the update from completing; the last good
+        forecast keeps being served meanwhile. Parsing may raise
+        ``AttributeError`` or ``KeyError`` when the IMS API returns unexpected
+        data (e.g. ``None`` hourly payload).
         """
         try:
-            return await loop.run_in_executor(None, self.weather.get_forecast)
+            return await self.client.async_get_forecast(self.city, timeout)
         except Exception as error:  # noqa: BLE001 - intentional, see docstring
             _LOGGER.warning(
-                "Failed to fetch IMS weather forecast; continuing without it: %s",
+                "Failed to fetch IMS weather forecast; keeping the last one: %s",
                 error,
             )
             return None
 
-    async def _fetch_warnings(self, loop: asyncio.AbstractEventLoop) -> list[Warning]:
+    async def _fetch_warnings(self, timeout: float) -> list[Warning] | None:
         """Fetch active IMS weather warnings.
 
-        Non-fatal: returns an empty list on any failure (timeout, network
-        error, parse error, server outage) so a misbehaving warnings
-        endpoint cannot prevent the rest of the update from completing.
-        Downstream consumers (sensor, binary_sensor) handle an empty
-        list as "no active warnings".
-
-        Callers should gate this method with ``_should_fetch_warnings()``
-        so the HTTP round-trip is avoided entirely when no sensor in the
-        current config entry consumes warnings.
+        Non-fatal: returns ``None`` on any failure (timeout, network error,
+        parse error, server outage) so a misbehaving warnings endpoint
+        cannot prevent the rest of the update from completing; the last
+        good list keeps being served meanwhile. Once it is too old the
+        slice falls back to an empty list, which downstream consumers
+        (sensor, binary_sensor) handle as "no active warnings".
         """
         try:
-            return await loop.run_in_executor(None, self.weather.get_warnings)
+            if self._warnings_feed is not None:
+                return await self._warnings_feed.async_get_warnings(self.city, timeout)
+            return await self.client.async_get_warnings(self.city, timeout)
         except Exception as error:  # noqa: BLE001 - intentional, see docstring
             _LOGGER.warning(
-                "Failed to fetch IMS weather warnings; continuing with no active warnings: %s",
+                "Failed to fetch IMS weather warnings; keeping the last ones: %s",
                 error,
             )
-            return []
+            return None
 
-    async def _fetch_radar_images(
-        self, loop: asyncio.AbstractEventLoop
-    ) -> RadarSatellite | None:
+    async def _fetch_radar_images(self, timeout: float) -> RadarSatellite | None:
         """Fetch IMS radar/satellite imagery.
 
         Non-fatal: returns ``None`` on any failure (timeout, network error,
         parse error, server outage) so a misbehaving radar endpoint cannot
-        prevent the rest of the update from completing. ``WeatherData.images``
-        is typed as ``RadarSatellite | None`` to reflect this.
+        prevent the rest of the update from completing; the last good index
+        keeps being served meanwhile. ``WeatherData.images`` is typed as
+        ``RadarSatellite | None`` for when there is none.
         """
         try:
-            return await loop.run_in_executor(None, self.weather.get_radar_images)
+            if self._radar_service is None:
+                return await self.client.async_get_radar_images(timeout)
+            return await self._radar_service.async_get_images(timeout)
         except Exception as error:  # noqa: BLE001 - intentional, see docstring
             _LOGGER.warning(
-                "Failed to fetch IMS radar/satellite imagery; continuing without it: %s",
+                "Failed to fetch IMS radar/satellite imagery; keeping the last one: %s",
                 error,
             )
             return None
 
-    def _should_fetch_warnings(self) -> bool:
-        """Return True if any enabled sensor consumes ``data.warnings``.
+    def _prune_forecast(self, forecast: Forecast) -> bool:
+        """Drop the past hours and days of ``forecast``; return if any were.
 
-        ``None`` ``monitored_conditions`` falls back to the legacy
-        "all sensors enabled" behavior (see ``__init__``). An empty list
-        means "no sensors enabled" and yields ``False``.
+        The time index is built once per fetched ``Forecast`` object and
+        reused by every later pruning, e.g. the hourly roll-forward.
         """
-        conditions = self._monitored_conditions
-        if conditions is None:
-            return True
-        return any(key in WARNING_SENSOR_KEYS for key in conditions)
-
-    @staticmethod
-    def _filter_future_forecast(weather_forecast: Forecast) -> None:
-        """Filter Forecast to include only future dates"""
-        today_datetime = dt_util.as_local(
-            datetime.datetime.combine(dt_util.now(timezone).date(), datetime.time())
-        )
-        filtered_day_list = list(
-            filter(lambda daily: daily.date >= today_datetime, weather_forecast.days)
-        )
-
-        for daily_forecast in filtered_day_list:
-            filtered_hours = []
-            for hourly_forecast in daily_forecast.hours:
-                forecast_datetime = daily_forecast.date + datetime.timedelta(
-                    hours=int(hourly_forecast.hour.split(":")[0])
-                )
-                if dt_util.now(timezone) <= forecast_datetime:
-                    filtered_hours.append(hourly_forecast)
-            daily_forecast.hours = filtered_hours
-
-        weather_forecast.days = filtered_day_list
+        if self.forecast_index is None or self.forecast_index.forecast is not forecast:
+            self.forecast_index = ForecastIndex(forecast)
+        now = dt_util.now(timezone)
+        today = dt_util.as_local(datetime.datetime.combine(now.date(), datetime.time()))
+        return self.forecast_index.prune(now, today)
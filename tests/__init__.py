@@ -0,0 +1 @@
+"""Tests for the IMS Weather integration."""
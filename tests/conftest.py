@@ -0,0 +1,294 @@
+"""Fixtures for the IMS Weather tests.
+
+IMS is never contacted: every endpoint, lookup tables included, is served
+by ``aioclient_mock``. ``weatheril`` must never download anything itself.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import Any
+
+import pytest
+from homeassistant.const import CONF_MODE, CONF_MONITORED_CONDITIONS, CONF_NAME
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.test_util.aiohttp import (
+    AiohttpClientMocker,
+)
+from weatheril import utils as weatheril_utils
+from weatheril.consts import (
+    CURRENT_ANALYSIS_URL,
+    FORECAST_URL,
+    LOCATIONS_INFO_URL,
+    RADAR_SATELLITE_URL,
+    REGIONS_URL,
+    WARNINGS_METADTA_URL,
+    WARNINGS_URL,
+    WEATHER_CODES_URL,
+    WIND_DIRECTIONS_URL,
+)
+
+from custom_components.ims import ims_client
+from custom_components.ims.const import (
+    CONF_CITY,
+    CONF_IMAGES_PATH,
+    CONF_LANGUAGE,
+    CONF_UPDATE_INTERVAL,
+    FORECAST_MODE_DAILY,
+    IMS_PLATFORM,
+    IMS_PLATFORMS,
+    IMS_TIMEZONE,
+)
+from custom_components.ims.rate_limit import RequestLimiter
+
+JERUSALEM = 1
+JERUSALEM_REGION = "118"
+CLEAR = 1250
+PARTLY_CLOUDY = 1220
+
+IMS_DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# The lookup tables of each language, as IMS serves them.
+LOCATIONS = {
+    "en": {"1": {"lid": "1", "name": "Jerusalem", "rid": JERUSALEM_REGION}},
+    "he": {"1": {"lid": "1", "name": "ירושלים", "rid": JERUSALEM_REGION}},
+}
+WEATHER_CODES = {
+    "en": {
+        "1": {"weather_code": str(CLEAR), "desc": "Clear"},
+        "2": {"weather_code": str(PARTLY_CLOUDY), "desc": "Partly cloudy"},
+    },
+    "he": {
+        "1": {"weather_code": str(CLEAR), "desc": "בהיר"},
+        "2": {"weather_code": str(PARTLY_CLOUDY), "desc": "מעונן חלקית"},
+    },
+}
+WIND_DIRECTIONS = {
+    language: {"1": {"direction": "360"}, "5": {"direction": "90"}}
+    for language in ("en", "he")
+}
+REGIONS = {
+    "en": [{"rid": "r-" + JERUSALEM_REGION, "name": "Jerusalem Hills"}],
+    "he": [{"rid": "r-" + JERUSALEM_REGION, "name": "הרי ירושלים"}],
+}
+WARNINGS_METADATA = {
+    "en": {
+        "ims_warning_type": {"1": {"warning_type_id": "1", "name": "Heat"}},
+        "warning_groups": {"g-1": {"name": "Heat"}},
+        "warning_severity": {"1": {"severity_id": "1", "severity_name": "Yellow"}},
+    },
+    "he": {
+        "ims_warning_type": {"1": {"warning_type_id": "1", "name": "חום"}},
+        "warning_groups": {"g-1": {"name": "חום"}},
+        "warning_severity": {"1": {"severity_id": "1", "severity_name": "צהוב"}},
+    },
+}
+
+
+def lookup_tables(language: str) -> dict[str, dict[str, Any]]:
+    """Return the lookup table payloads of ``language`` by URL."""
+    return {
+        LOCATIONS_INFO_URL.format(language=language): {"data": LOCATIONS[language]},
+        WEATHER_CODES_URL.format(language=language): {"data": WEATHER_CODES[language]},
+        WIND_DIRECTIONS_URL.format(language=language): {
+            "data": WIND_DIRECTIONS[language]
+        },
+        REGIONS_URL.format(language=language): {"data": REGIONS[language]},
+        WARNINGS_METADTA_URL.format(language=language): {
+            "data": WARNINGS_METADATA[language]
+        },
+    }
+
+
+def ims_time(value: datetime) -> str:
+    """Format ``value`` the way IMS does, in Israel local time."""
+    return value.astimezone(IMS_TIMEZONE).strftime(IMS_DATETIME_FORMAT)
+
+
+def current_analysis_payload(
+    temperature: float = 21.5,
+    weather_code: int = CLEAR,
+    forecast_time: datetime | None = None,
+) -> dict[str, Any]:
+    """Return a ``now_analysis`` payload of Jerusalem."""
+    forecast_time = forecast_time or dt_util.utcnow().replace(minute=0, second=0)
+    return {
+        "data": {
+            str(JERUSALEM): {
+                "lid": str(JERUSALEM),
+                "relative_humidity": "40",
+                "rain": "0",
+                "temperature": str(temperature),
+                "due_point_Temp": "7",
+                "wind_speed": "3",
+                "wind_chill": "20",
+                "wind_direction_id": "1",
+                "feels_like": str(temperature),
+                "heat_stress_level": "0",
+                "u_v_index": "3",
+                "u_v_level": "M",
+                "u_v_i_max": "6",
+                "u_v_i_factor": "1.0",
+                "max_temp": "25",
+                "min_temp": "14",
+                "pm10": "20",
+                "weather_code": str(weather_code),
+                "forecast_time": ims_time(forecast_time),
+                "modified": ims_time(forecast_time),
+            }
+        }
+    }
+
+
+def forecast_payload(weather_code: int = CLEAR, days: int = 3) -> dict[str, Any]:
+    """Return a ``full_forecast_data`` payload starting today."""
+    today = dt_util.now(IMS_TIMEZONE).date()
+    data = {}
+    for offset in range(days):
+        date = today + timedelta(days=offset)
+        data[date.isoformat()] = {
+            "daily": {
+                "lid": str(JERUSALEM),
+                "weather_code": str(weather_code),
+                "minimum_temperature": "14",
+                "maximum_temperature": "25",
+                "maximum_uvi": "6",
+            },
+            "hourly": {
+                f"{hour:02d}:00": {
+                    "forecast_time": f"{date.isoformat()} {hour:02d}:00:00",
+                    "weather_code": str(weather_code),
+                    "temperature": "20",
+                    "precise_temperature": "20.4",
+                    "relative_humidity": "40",
+                    "rain_chance": "0",
+                    "wind_speed": "3",
+                    "wind_direction_id": "5",
+                }
+                for hour in range(0, 24, 3)
+            },
+            "country": {"description": "Fine weather."},
+        }
+    return {"data": data}
+
+
+def warnings_payload(*alerts: dict[str, Any]) -> dict[str, Any]:
+    """Return a ``warnings`` payload issuing ``alerts`` to Jerusalem."""
+    return {
+        "data": {
+            "full_warnings_data": {
+                "today": {
+                    "r-" + JERUSALEM_REGION: {alert["wid"]: alert for alert in alerts}
+                }
+            }
+        }
+    }
+
+
+def warning_alert(
+    valid_from: datetime, valid_to: datetime, wid: str = "1"
+) -> dict[str, Any]:
+    """Return a warning alert valid from ``valid_from`` to ``valid_to``."""
+    return {
+        "wid": wid,
+        "alert_id": wid,
+        "severity_id": "1",
+        "warning_type_id": "1",
+        "sent": ims_time(valid_from),
+        "valid_from": ims_time(valid_from),
+        "valid_to": ims_time(valid_to),
+        "full_en": "Heat stress",
+        "full_he": "עומס חום",
+        "text": "Heat stress",
+        "text_full": "",
+        "valid_from_unix": str(int(valid_from.timestamp())),
+        "groups": ["1"],
+        "regions": [JERUSALEM_REGION],
+    }
+
+
+def entry_data(language: str = "en", **overrides: Any) -> dict[str, Any]:
+    """Return the data of a config entry for Jerusalem."""
+    return {
+        CONF_NAME: "IMS Weather",
+        CONF_CITY: JERUSALEM,
+        CONF_LANGUAGE: language,
+        CONF_MODE: FORECAST_MODE_DAILY,
+        CONF_UPDATE_INTERVAL: 60,
+        IMS_PLATFORM: list(IMS_PLATFORMS),
+        CONF_MONITORED_CONDITIONS: [
+            "ims_city",
+            "ims_temperature",
+            "ims_forecast_today",
+            "ims_weather_warnings",
+            "ims_is_active_weather_warning",
+        ],
+        CONF_IMAGES_PATH: None,
+        **overrides,
+    }
+
+
+def mock_ims(
+    aioclient_mock: AiohttpClientMocker,
+    language: str = "en",
+    analysis: dict[str, Any] | None = None,
+    forecast: dict[str, Any] | None = None,
+    warnings: dict[str, Any] | None = None,
+    radar: dict[str, Any] | None = None,
+) -> None:
+    """Serve the IMS endpoints of Jerusalem in ``language``."""
+    for url, payload in lookup_tables(language).items():
+        aioclient_mock.get(url, json=payload)
+    aioclient_mock.get(
+        CURRENT_ANALYSIS_URL.format(language=language, location=JERUSALEM),
+        json=analysis or current_analysis_payload(),
+    )
+    aioclient_mock.get(
+        FORECAST_URL.format(language=language, location=JERUSALEM),
+        json=forecast or forecast_payload(),
+    )
+    aioclient_mock.get(
+        WARNINGS_URL.format(language=language),
+        json=warnings or warnings_payload(),
+    )
+    aioclient_mock.get(
+        RADAR_SATELLITE_URL.format(language=language),
+        json=radar or {"data": {"types": {}}},
+    )
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations: None) -> None:
+    """Load the integration from custom_components."""
+
+
+@pytest.fixture(autouse=True)
+def unlimited_requests(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Let the mocked IMS answer as fast as asked, whatever the clock says."""
+    limiter = RequestLimiter(rate=1000.0, burst=1000, max_in_flight=1000)
+    monkeypatch.setattr(ims_client, "async_get_request_limiter", lambda hass: limiter)
+
+
+def _weatheril_download(url: str) -> dict[str, Any]:
+    """Fail a test in which ``weatheril`` downloads with blocking ``requests``.
+
+    ``pytest.fail`` is not an ``Exception``, so ``weatheril`` cannot swallow
+    it and fall back.
+    """
+    pytest.fail(f"weatheril downloaded {url} itself")
+
+
+@pytest.fixture(autouse=True)
+def weatheril_lookup_tables(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Start every test with empty ``weatheril`` tables, never downloaded."""
+    monkeypatch.setattr(weatheril_utils, "fetch_data", _weatheril_download)
+    for name in (
+        "_weather_code_map",
+        "_locations_map",
+        "_wind_direction_map",
+        "_regions_map",
+        "_warning_type_map",
+        "_warning_group_map",
+        "_warning_severity_map",
+    ):
+        monkeypatch.setattr(weatheril_utils, name, {})
@@ -0,0 +1,55 @@
+"""Tests for the IMS Weather binary sensors."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+
+from freezegun.api import FrozenDateTimeFactory
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+from pytest_homeassistant_custom_component.test_util.aiohttp import (
+    AiohttpClientMocker,
+)
+
+from custom_components.ims.const import CONFIG_FLOW_VERSION, DOMAIN
+
+from .conftest import entry_data, mock_ims, warning_alert, warnings_payload
+
+ACTIVE_WARNING = "binary_sensor.ims_is_active_weather_warning"
+
+
+async def test_active_warning_follows_validity_window(
+    hass: HomeAssistant,
+    aioclient_mock: AiohttpClientMocker,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """The sensor turns on and off with an unchanged warning's validity."""
+    freezer.move_to("2026-10-18 09:05:00+00:00")
+    now = dt_util.utcnow()
+    mock_ims(
+        aioclient_mock,
+        warnings=warnings_payload(
+            warning_alert(now + timedelta(minutes=10), now + timedelta(minutes=40))
+        ),
+    )
+    entry = MockConfigEntry(
+        domain=DOMAIN, data=entry_data(), version=CONFIG_FLOW_VERSION
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    assert hass.states.get(ACTIVE_WARNING).state == "off"
+
+    freezer.tick(timedelta(minutes=11))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert hass.states.get(ACTIVE_WARNING).state == "on"
+
+    freezer.tick(timedelta(minutes=30))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert hass.states.get(ACTIVE_WARNING).state == "off"
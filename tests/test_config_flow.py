@@ -0,0 +1,78 @@
+"""Tests for the IMS Weather options flow."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.data_entry_flow import FlowResultType
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.ims import config_flow
+from custom_components.ims.const import (
+    CONF_CITY,
+    CONF_CURRENT_TIMEOUT,
+    CONF_FORECAST_ATTRIBUTES,
+    CONF_FORECAST_INTERVAL,
+    CONF_FORECAST_TIMEOUT,
+    CONF_MAX_STALE_AGE,
+    CONF_WARNINGS_INTERVAL,
+    CONF_WARNINGS_TIMEOUT,
+    CONFIG_FLOW_VERSION,
+    DOMAIN,
+)
+
+from .conftest import JERUSALEM, LOCATIONS, entry_data
+
+
+@pytest.fixture(autouse=True)
+def localized_cities(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Serve the city list the options flow offers."""
+    monkeypatch.setattr(config_flow, "cities_data", LOCATIONS["en"])
+
+
+def _options(**overrides: int) -> dict[str, Any]:
+    """Return what the options form submits, with ``overrides``."""
+    return {
+        **entry_data(images_path="/tmp"),
+        CONF_CITY: str(JERUSALEM),
+        CONF_FORECAST_ATTRIBUTES: "nested",
+        CONF_FORECAST_INTERVAL: 60,
+        CONF_WARNINGS_INTERVAL: 1,
+        CONF_MAX_STALE_AGE: 6,
+        CONF_CURRENT_TIMEOUT: 20,
+        CONF_FORECAST_TIMEOUT: 15,
+        CONF_WARNINGS_TIMEOUT: 10,
+        **overrides,
+    }
+
+
+@pytest.mark.parametrize(
+    ("options", "error"),
+    [
+        (_options(), None),
+        (_options(**{CONF_FORECAST_INTERVAL: 7 * 60}), "max_stale_age_too_short"),
+        (_options(update_interval=24 * 60), "max_stale_age_too_short"),
+    ],
+)
+async def test_max_stale_age_covers_every_interval(
+    hass: HomeAssistant, options: dict[str, Any], error: str | None
+) -> None:
+    """The stale age may not be shorter than an interval between fetches."""
+    entry = MockConfigEntry(
+        domain=DOMAIN, data=entry_data(), version=CONFIG_FLOW_VERSION
+    )
+    entry.add_to_hass(hass)
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], user_input=options
+    )
+
+    if error is None:
+        assert result["type"] is FlowResultType.CREATE_ENTRY
+        assert entry.options[CONF_MAX_STALE_AGE] == 6
+    else:
+        assert result["type"] is FlowResultType.FORM
+        assert result["errors"] == {"base": error}
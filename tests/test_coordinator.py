@@ -0,0 +1,120 @@
+"""Tests for the IMS weather update coordinator."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from http import HTTPStatus
+from unittest.mock import Mock, patch
+
+import pytest
+from aiohttp import ClientConnectionError, ClientResponseError
+from freezegun.api import FrozenDateTimeFactory
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.update_coordinator import UpdateFailed
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pytest_homeassistant_custom_component.test_util.aiohttp import (
+    AiohttpClientMocker,
+)
+
+from custom_components.ims import weather_update_coordinator
+from custom_components.ims.const import (
+    CONFIG_FLOW_VERSION,
+    DOMAIN,
+    ENDPOINT_CURRENT,
+    ENDPOINT_FORECAST,
+    ENDPOINT_WARNINGS,
+    ENTRY_WEATHER_COORDINATOR,
+)
+from custom_components.ims.ims_client import ImsRequestTimeout
+from custom_components.ims.rate_limit import RequestLimiter
+from custom_components.ims.weather_update_coordinator import (
+    WeatherUpdateCoordinator,
+)
+
+from .conftest import JERUSALEM, entry_data, mock_ims
+
+
+def _response_error(status: HTTPStatus) -> ClientResponseError:
+    return ClientResponseError(Mock(), (), status=status)
+
+
+@pytest.mark.parametrize(
+    ("error", "counted"),
+    [
+        (ImsRequestTimeout("IMS did not answer"), True),
+        (ClientConnectionError("IMS is down"), True),
+        (_response_error(HTTPStatus.BAD_GATEWAY), True),
+        (_response_error(HTTPStatus.TOO_MANY_REQUESTS), True),
+        (_response_error(HTTPStatus.NOT_FOUND), False),
+        (TimeoutError(), False),
+        (UpdateFailed("IMS returned no current analysis"), False),
+        (ValueError("Unparsable payload"), False),
+    ],
+)
+async def test_breaker_counts_ims_failures_only(
+    hass: HomeAssistant, error: Exception, counted: bool
+) -> None:
+    """Only IMS failing to answer counts against the circuit breaker."""
+    coordinator = WeatherUpdateCoordinator(JERUSALEM, "en", timedelta(minutes=60), hass)
+    with (
+        patch.object(coordinator, "_get_ims_weather", side_effect=error),
+        pytest.raises(UpdateFailed),
+    ):
+        await coordinator._async_update_data()
+
+    assert coordinator.breaker.failures == int(counted)
+    await coordinator.async_shutdown()
+
+
+async def test_slice_not_due_is_not_aged_out(
+    hass: HomeAssistant,
+    aioclient_mock: AiohttpClientMocker,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """A forecast older than max_stale_age stays until a fetch of it fails."""
+    freezer.move_to("2026-10-18 09:05:00+00:00")
+    mock_ims(aioclient_mock)
+    entry = MockConfigEntry(
+        domain=DOMAIN, data=entry_data(), version=CONFIG_FLOW_VERSION
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = hass.data[DOMAIN][entry.entry_id][ENTRY_WEATHER_COORDINATOR]
+    coordinator.max_stale_age = timedelta(0)
+    forecast = coordinator.data.forecast
+
+    # Warnings are due again, the hourly forecast is not.
+    freezer.tick(coordinator.endpoint_intervals[ENDPOINT_WARNINGS])
+    await coordinator.async_refresh()
+
+    assert coordinator.last_update_success
+    assert ENDPOINT_FORECAST not in coordinator.updated_endpoints
+    assert coordinator.data.forecast is forecast
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def test_refresh_deadline_covers_rate_limiter_wait(
+    hass: HomeAssistant, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A refresh stuck behind the rate limiter fails at its deadline."""
+    monkeypatch.setattr(
+        weather_update_coordinator, "REFRESH_QUEUE_ALLOWANCE", timedelta(0)
+    )
+    coordinator = WeatherUpdateCoordinator(
+        JERUSALEM,
+        "en",
+        timedelta(minutes=60),
+        hass,
+        endpoint_timeouts={ENDPOINT_CURRENT: timedelta(seconds=0.05)},
+    )
+    coordinator.client._limiter = limiter = RequestLimiter(max_in_flight=1)
+
+    async with limiter.async_request():
+        with pytest.raises(UpdateFailed):
+            await coordinator._async_update_data()
+
+    assert coordinator.breaker.failures == 0
+    await coordinator.async_shutdown()
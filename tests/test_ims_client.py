@@ -0,0 +1,168 @@
+"""Tests for the IMS API client and its parsers."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.test_util.aiohttp import (
+    AiohttpClientMocker,
+    AiohttpClientMockResponse,
+)
+from weatheril.consts import CURRENT_ANALYSIS_URL, LOCATIONS_INFO_URL
+
+from custom_components.ims import ims_client
+from custom_components.ims.ims_client import (
+    ImsClient,
+    ImsRequestTimeout,
+    build_warnings,
+)
+from custom_components.ims.lookups import (
+    LanguageLookups,
+    WarningLookups,
+    parse_locations,
+    parse_weather_codes,
+    parse_wind_directions,
+    prime_weatheril_tables,
+    prime_weatheril_warning_tables,
+)
+from custom_components.ims.rate_limit import RequestLimiter
+
+from .conftest import (
+    JERUSALEM,
+    JERUSALEM_REGION,
+    LOCATIONS,
+    REGIONS,
+    WEATHER_CODES,
+    WIND_DIRECTIONS,
+    current_analysis_payload,
+    lookup_tables,
+    warning_alert,
+)
+
+ANALYSIS_URL = CURRENT_ANALYSIS_URL.format(language="en", location=JERUSALEM)
+
+
+async def test_timeout_excludes_rate_limiter_wait(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """Waiting for the rate limiter does not eat into the request timeout."""
+    aioclient_mock.get(ANALYSIS_URL, json=current_analysis_payload())
+    client = ImsClient(hass, "en")
+    client._limiter = limiter = RequestLimiter(max_in_flight=1)
+
+    async with limiter.async_request():
+        fetch = asyncio.create_task(
+            client.async_get_current_analysis_data(JERUSALEM, timeout=0.05)
+        )
+        await asyncio.sleep(0.2)
+
+    assert str(JERUSALEM) in await fetch
+
+
+async def test_unanswered_request_times_out(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """A request IMS does not answer in time raises ``ImsRequestTimeout``."""
+
+    async def _slow_answer(method, url, data):
+        await asyncio.sleep(1)
+        return AiohttpClientMockResponse(method, url, json=current_analysis_payload())
+
+    aioclient_mock.get(ANALYSIS_URL, side_effect=_slow_answer)
+    client = ImsClient(hass, "en")
+
+    with pytest.raises(ImsRequestTimeout):
+        await client.async_get_current_analysis_data(JERUSALEM, timeout=0.05)
+
+
+async def test_unanswered_frame_download_times_out(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """A frame IMS does not send in time raises ``ImsRequestTimeout``."""
+    frame_url = "https://ims.gov.il/radar_1.png"
+
+    async def _slow_answer(method, url, data):
+        await asyncio.sleep(1)
+        return AiohttpClientMockResponse(method, url, response=b"frame")
+
+    aioclient_mock.get(frame_url, side_effect=_slow_answer)
+    client = ImsClient(hass, "en")
+
+    with pytest.raises(ImsRequestTimeout):
+        await client.async_get_bytes(frame_url, timeout=0.05)
+
+
+async def test_unanswered_lookup_table_times_out(
+    hass: HomeAssistant,
+    aioclient_mock: AiohttpClientMocker,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A lookup table IMS does not serve in time is replaced by a built-in one."""
+    monkeypatch.setattr(ims_client, "LOOKUP_TIMEOUT", timedelta(seconds=0.05))
+    locations_url = LOCATIONS_INFO_URL.format(language="en")
+
+    async def _slow_answer(method, url, data):
+        await asyncio.sleep(1)
+        return AiohttpClientMockResponse(method, url, json={})
+
+    aioclient_mock.get(locations_url, side_effect=_slow_answer)
+    for url, payload in lookup_tables("en").items():
+        if url != locations_url:
+            aioclient_mock.get(url, json=payload)
+    aioclient_mock.get(ANALYSIS_URL, json=current_analysis_payload())
+    client = ImsClient(hass, "en")
+
+    weather = await client.async_get_current_analysis(JERUSALEM, timeout=1)
+
+    assert weather.temperature == 21.5
+    assert not client.lookups.complete
+
+
+def _warning_lookups(regions: list[dict[str, str]]) -> WarningLookups:
+    """Return English warning tables, primed as ``ImsClient`` would."""
+    lookups = WarningLookups(
+        language="en",
+        regions={region["rid"]: region for region in regions},
+        warning_types={1: {"name": "Heat"}},
+        warning_groups={"g-1": {"name": "Heat"}},
+        warning_severities={1: {"severity_name": "Yellow"}},
+    )
+    prime_weatheril_tables(
+        LanguageLookups(
+            "en",
+            parse_locations(LOCATIONS["en"]),
+            parse_weather_codes(WEATHER_CODES["en"]),
+            parse_wind_directions(WIND_DIRECTIONS["en"]),
+        )
+    )
+    prime_weatheril_warning_tables(lookups)
+    return lookups
+
+
+def test_build_warnings_of_known_region() -> None:
+    """The alerts of a known region become localized ``Warning`` objects."""
+    now = dt_util.utcnow()
+    alert = warning_alert(now, now + timedelta(hours=6))
+
+    (warning,) = build_warnings(
+        JERUSALEM, "r-" + JERUSALEM_REGION, [alert], _warning_lookups(REGIONS["en"])
+    )
+
+    assert warning.region_name == "Jerusalem Hills"
+    assert warning.severity == "Yellow"
+
+
+def test_build_warnings_of_unknown_region(caplog: pytest.LogCaptureFixture) -> None:
+    """A region missing from the lookup tables has no warnings, logged once."""
+    now = dt_util.utcnow()
+    alert = warning_alert(now, now + timedelta(hours=6))
+    lookups = _warning_lookups([])
+
+    for _ in range(2):
+        assert build_warnings(JERUSALEM, "r-999", [alert], lookups) == []
+
+    assert caplog.text.count("Region not found for id r-999") == 1
@@ -0,0 +1,85 @@
+"""Tests for setting up and unloading IMS Weather config entries."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pytest_homeassistant_custom_component.test_util.aiohttp import (
+    AiohttpClientMocker,
+)
+
+from custom_components.ims.const import (
+    CONF_CURRENT_TIMEOUT,
+    CONF_FORECAST_INTERVAL,
+    CONF_MAX_STALE_AGE,
+    CONF_WARNINGS_INTERVAL,
+    CONFIG_FLOW_VERSION,
+    DOMAIN,
+    ENDPOINT_CURRENT,
+    ENDPOINT_FORECAST,
+    ENDPOINT_WARNINGS,
+    ENTRY_WEATHER_COORDINATOR,
+)
+
+from .conftest import entry_data, mock_ims
+
+
+async def test_setup_and_unload_entry(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """An entry loads its entities from IMS and unloads cleanly."""
+    mock_ims(aioclient_mock)
+    entry = MockConfigEntry(
+        domain=DOMAIN, data=entry_data(), version=CONFIG_FLOW_VERSION
+    )
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert entry.state is ConfigEntryState.LOADED
+    assert hass.states.get("sensor.ims_temperature").state == "21.5"
+    assert hass.states.get("sensor.ims_city").state == "Jerusalem"
+    assert hass.states.get("sensor.ims_forecast_today").state is not None
+    assert hass.states.get("binary_sensor.ims_is_active_weather_warning").state == (
+        "off"
+    )
+    assert hass.states.async_entity_ids("weather")
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+    assert entry.state is ConfigEntryState.NOT_LOADED
+
+
+async def test_options_tune_the_coordinator(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """The options flow settings reach the coordinator of the entry."""
+    mock_ims(aioclient_mock)
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data=entry_data(),
+        options={
+            **entry_data(),
+            CONF_FORECAST_INTERVAL: 180,
+            CONF_WARNINGS_INTERVAL: 5,
+            CONF_MAX_STALE_AGE: 2,
+            CONF_CURRENT_TIMEOUT: 30,
+        },
+        version=CONFIG_FLOW_VERSION,
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = hass.data[DOMAIN][entry.entry_id][ENTRY_WEATHER_COORDINATOR]
+
+    assert coordinator.endpoint_intervals[ENDPOINT_FORECAST] == timedelta(hours=3)
+    assert coordinator.endpoint_intervals[ENDPOINT_WARNINGS] == timedelta(minutes=5)
+    assert coordinator.max_stale_age == timedelta(hours=2)
+    assert coordinator.endpoint_timeouts[ENDPOINT_CURRENT] == timedelta(seconds=30)
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
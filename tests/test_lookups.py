@@ -0,0 +1,54 @@
+"""Tests for the IMS lookup tables of each language."""
+
+from __future__ import annotations
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pytest_homeassistant_custom_component.test_util.aiohttp import (
+    AiohttpClientMocker,
+)
+
+from custom_components.ims.const import CONFIG_FLOW_VERSION, DOMAIN
+
+from .conftest import entry_data, lookup_tables, mock_ims
+
+
+async def test_entries_of_two_languages_keep_their_names(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """An English and a Hebrew entry of one city each show their own names."""
+    mock_ims(aioclient_mock, "en")
+    mock_ims(aioclient_mock, "he")
+    entries = {
+        language: MockConfigEntry(
+            domain=DOMAIN,
+            data=entry_data(language, name=f"IMS {language}"),
+            version=CONFIG_FLOW_VERSION,
+        )
+        for language in ("en", "he")
+    }
+    for entry in entries.values():
+        entry.add_to_hass(hass)
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+    entity_registry = er.async_get(hass)
+
+    def state(language: str, key: str) -> str:
+        entity_id = entity_registry.async_get_entity_id(
+            "sensor", DOMAIN, f"{key}_1_{language}"
+        )
+        return hass.states.get(entity_id)
+
+    assert state("en", "ims_city").state == "Jerusalem"
+    assert state("he", "ims_city").state == "ירושלים"
+    assert state("en", "ims_forecast_today").attributes["weather"]["value"] == "Clear"
+    assert state("he", "ims_forecast_today").attributes["weather"]["value"] == "בהיר"
+
+    # Each table is fetched once per language, and never by ``weatheril``
+    # itself (see ``conftest``).
+    requested = [str(url) for _, url, _, _ in aioclient_mock.mock_calls]
+    for language in ("en", "he"):
+        for url in lookup_tables(language):
+            assert requested.count(url) == 1
@@ -0,0 +1,83 @@
+"""Tests for the IMS radar/satellite frame cache."""
+
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pytest_homeassistant_custom_component.test_util.aiohttp import (
+    AiohttpClientMocker,
+)
+
+from custom_components.ims.const import (
+    CONFIG_FLOW_VERSION,
+    DOMAIN,
+    ENDPOINT_RADAR,
+    ENTRY_WEATHER_COORDINATOR,
+    RADAR_FRAMES_DIRECTORY,
+)
+
+from .conftest import entry_data, mock_ims
+
+FRAME_FILE_NAME = "/sites/default/files/ims_data/map_images/radar_1.png"
+FRAME_URL = "https://ims.gov.il" + FRAME_FILE_NAME
+FRAME = b"radar frame"
+
+
+async def _setup(hass: HomeAssistant, images_path: str | None) -> MockConfigEntry:
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data=entry_data(images_path=images_path),
+        version=CONFIG_FLOW_VERSION,
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    return entry
+
+
+async def test_frames_cached_under_images_path(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker, tmp_path: Path
+) -> None:
+    """With an images path, radar is fetched and its frames are stored."""
+    radar = {"data": {"types": {"IMSRadar": [{"file_name": FRAME_FILE_NAME}]}}}
+    mock_ims(aioclient_mock, radar=radar)
+    aioclient_mock.get(FRAME_URL, content=FRAME)
+    entry = await _setup(hass, str(tmp_path))
+    coordinator = hass.data[DOMAIN][entry.entry_id][ENTRY_WEATHER_COORDINATOR]
+
+    # Radar is fetched once a listener consumes it, i.e. on the next refresh;
+    # its frames are then downloaded in the background.
+    await coordinator.async_refresh()
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert coordinator.data.images.imsradar_images == [FRAME_URL]
+    frame = (
+        tmp_path / RADAR_FRAMES_DIRECTORY / f"{hashlib.sha256(FRAME).hexdigest()}.png"
+    )
+    assert frame.read_bytes() == FRAME
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def test_no_radar_without_images_path(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """Without an images path nothing consumes radar, so it is never fetched."""
+    mock_ims(aioclient_mock)
+    entry = await _setup(hass, None)
+    coordinator = hass.data[DOMAIN][entry.entry_id][ENTRY_WEATHER_COORDINATOR]
+
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    assert ENDPOINT_RADAR not in coordinator._wanted_endpoints()
+    assert not any(
+        "radar_satellite" in str(url) for _, url, _, _ in aioclient_mock.mock_calls
+    )
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
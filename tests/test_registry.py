@@ -0,0 +1,70 @@
+"""Tests for the coordinators shared by IMS Weather config entries."""
+
+from __future__ import annotations
+
+from freezegun.api import FrozenDateTimeFactory
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pytest_homeassistant_custom_component.test_util.aiohttp import (
+    AiohttpClientMocker,
+)
+from weatheril.consts import CURRENT_ANALYSIS_URL
+from yarl import URL
+
+from custom_components.ims.const import (
+    CONFIG_FLOW_VERSION,
+    DOMAIN,
+    ENDPOINT_CURRENT,
+    ENTRY_WEATHER_COORDINATOR,
+    SHARED_ANALYSIS_MAX_AGE,
+    STAGGER_WINDOW,
+)
+from custom_components.ims.registry import city_stagger
+
+from .conftest import entry_data, mock_ims
+
+
+def test_city_stagger() -> None:
+    """Cities are spread apart; a city's coordinators stay within sharing age."""
+    staggers = [city_stagger(city) for city in range(1, 90)]
+    assert all(0 <= stagger < 1 for stagger in staggers)
+    assert len(set(staggers)) == len(staggers)
+    assert city_stagger("7") == city_stagger(7)
+    assert STAGGER_WINDOW < SHARED_ANALYSIS_MAX_AGE
+
+
+async def test_languages_of_a_city_fetch_together(
+    hass: HomeAssistant,
+    aioclient_mock: AiohttpClientMocker,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """The English and Hebrew coordinators of a city share one schedule."""
+    freezer.move_to("2026-10-18 09:05:00+00:00")
+    coordinators = []
+    for language in ("en", "he"):
+        mock_ims(aioclient_mock, language)
+        entry = MockConfigEntry(
+            domain=DOMAIN,
+            data=entry_data(language, name=f"IMS {language}"),
+            version=CONFIG_FLOW_VERSION,
+            unique_id=f"ims-1-{language}",
+        )
+        entry.add_to_hass(hass)
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+        coordinators.append(
+            hass.data[DOMAIN][entry.entry_id][ENTRY_WEATHER_COORDINATOR]
+        )
+
+    english, hebrew = coordinators
+    assert english is not hebrew
+    assert english.stagger == hebrew.stagger == city_stagger(1)
+    assert english._next_fetch[ENDPOINT_CURRENT] == hebrew._next_fetch[ENDPOINT_CURRENT]
+    # The Hebrew coordinator was handed the analysis fetched for English.
+    analysis_urls = {
+        CURRENT_ANALYSIS_URL.format(language=language, location=1)
+        for language in ("en", "he")
+    }
+    assert [
+        url for _, url, _, _ in aioclient_mock.mock_calls if str(url) in analysis_urls
+    ] == [URL(CURRENT_ANALYSIS_URL.format(language="en", location=1))]
@@ -0,0 +1,101 @@
+"""Tests for warm-starting IMS Weather from a snapshot."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import Any
+
+from aiohttp import ClientError
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+from pytest_homeassistant_custom_component.test_util.aiohttp import (
+    AiohttpClientMocker,
+)
+from weatheril.consts import CURRENT_ANALYSIS_URL
+
+from custom_components.ims.const import (
+    CONFIG_FLOW_VERSION,
+    DOMAIN,
+    ENTRY_WEATHER_COORDINATOR,
+    STAGGER_WINDOW,
+)
+from custom_components.ims.snapshot import snapshot_storage_key
+
+from .conftest import JERUSALEM, entry_data, lookup_tables, mock_ims
+
+
+async def test_warm_start_makes_no_request_during_setup(
+    hass: HomeAssistant,
+    aioclient_mock: AiohttpClientMocker,
+    hass_storage: dict[str, Any],
+) -> None:
+    """Setting up from a snapshot leaves IMS alone until the staggered refresh."""
+    mock_ims(aioclient_mock)
+    entry = MockConfigEntry(
+        domain=DOMAIN, data=entry_data(), version=CONFIG_FLOW_VERSION
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+    aioclient_mock.clear_requests()
+    mock_ims(aioclient_mock)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert aioclient_mock.call_count == 0
+    assert hass.states.get("sensor.ims_temperature").state == "21.5"
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def test_warm_start_during_outage(
+    hass: HomeAssistant,
+    aioclient_mock: AiohttpClientMocker,
+    hass_storage: dict[str, Any],
+) -> None:
+    """Unloading saves the snapshot, which is served while IMS is down."""
+    mock_ims(aioclient_mock)
+    entry = MockConfigEntry(
+        domain=DOMAIN, data=entry_data(), version=CONFIG_FLOW_VERSION
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    # The delayed snapshot write is flushed rather than lost on unload.
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+    assert snapshot_storage_key(f"ims-en-{JERUSALEM}") in hass_storage
+
+    aioclient_mock.clear_requests()
+    for url, payload in lookup_tables("en").items():
+        aioclient_mock.get(url, json=payload)
+    aioclient_mock.get(
+        CURRENT_ANALYSIS_URL.format(language="en", location=JERUSALEM),
+        exc=ClientError(),
+    )
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = hass.data[DOMAIN][entry.entry_id][ENTRY_WEATHER_COORDINATOR]
+
+    # Let the staggered warm-start refresh run, and fail.
+    async_fire_time_changed(hass, dt_util.utcnow() + STAGGER_WINDOW)
+    await hass.async_block_till_done()
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+
+    assert aioclient_mock.call_count
+    assert coordinator.last_update_success
+    assert coordinator.snapshot_time is not None
+    assert hass.states.get("sensor.ims_temperature").state == "21.5"
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
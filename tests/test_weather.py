@@ -0,0 +1,79 @@
+"""Tests for the IMS weather entity."""
+
+from __future__ import annotations
+
+from collections import Counter
+from unittest.mock import patch
+
+from freezegun.api import FrozenDateTimeFactory
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity import Entity
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pytest_homeassistant_custom_component.test_util.aiohttp import (
+    AiohttpClientMocker,
+)
+
+from custom_components.ims.const import (
+    CONFIG_FLOW_VERSION,
+    DOMAIN,
+    ENTRY_WEATHER_COORDINATOR,
+)
+from custom_components.ims.weather import IMSWeather
+
+from .conftest import current_analysis_payload, entry_data, mock_ims
+
+
+async def test_writes_and_pushes_once_per_data_change(
+    hass: HomeAssistant,
+    aioclient_mock: AiohttpClientMocker,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """A refresh writes states and pushes forecasts only when data changed."""
+    freezer.move_to("2026-10-18 09:05:00+00:00")
+    mock_ims(aioclient_mock)
+    entry = MockConfigEntry(
+        domain=DOMAIN, data=entry_data(), version=CONFIG_FLOW_VERSION
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = hass.data[DOMAIN][entry.entry_id][ENTRY_WEATHER_COORDINATOR]
+    (weather_entity_id,) = hass.states.async_entity_ids("weather")
+
+    writes: Counter[str] = Counter()
+    pushes: list[tuple[str, ...]] = []
+    write_ha_state = Entity.async_write_ha_state
+
+    def _count_write(entity: Entity) -> None:
+        writes[entity.entity_id] += 1
+        write_ha_state(entity)
+
+    async def _count_push(entity: IMSWeather, forecast_types: tuple[str, ...]) -> None:
+        pushes.append(forecast_types)
+
+    async def _refresh_everything() -> None:
+        # Make every endpoint due, as if its interval had passed.
+        coordinator._next_fetch.clear()
+        await coordinator.async_refresh()
+        await hass.async_block_till_done()
+
+    with (
+        patch.object(Entity, "async_write_ha_state", _count_write),
+        patch.object(IMSWeather, "async_update_listeners", _count_push),
+    ):
+        aioclient_mock.clear_requests()
+        mock_ims(aioclient_mock, analysis=current_analysis_payload(temperature=25.0))
+        await _refresh_everything()
+
+        assert writes[weather_entity_id] == 1
+        assert writes["sensor.ims_temperature"] == 1
+        assert pushes == [("daily", "hourly")]
+        assert hass.states.get("sensor.ims_temperature").state == "25.0"
+
+        writes.clear()
+        pushes.clear()
+        await _refresh_everything()
+
+        assert not writes
+        assert not pushes
+        assert aioclient_mock.call_count